@@ -0,0 +1,34 @@
+from typing import Any, Callable, Generator, Optional, Tuple
+
+import pytest
+from playwright.sync_api import Page
+
+from framework.browser import BrowserManager, resolve_browser_name, resolve_channel
+from framework.standin import StandinServer
+
+
+@pytest.fixture(scope="session")
+def base_url(standin_server: Optional[StandinServer]) -> Generator[str, Any, None]:
+    """Benchmarks always target the local stand-in so numbers don't depend on the network."""
+    if standin_server is not None:
+        yield standin_server.url
+        return
+    with StandinServer() as server:
+        yield server.url
+
+
+@pytest.fixture
+def page_factory(
+    browser_manager: BrowserManager, pytestconfig: pytest.Config
+) -> Tuple[Callable[[], Page], Callable[[Page], None]]:
+    """(open, close) pair building a page exactly like the ``context``/``page`` fixtures do."""
+    browser_name = resolve_browser_name(pytestconfig)
+    channel = resolve_channel(pytestconfig)
+
+    def _open() -> Page:
+        return browser_manager.acquire(browser_name, channel).new_page()
+
+    def _close(page: Page) -> None:
+        browser_manager.release(page.context)
+
+    return _open, _close
@@ -0,0 +1,96 @@
+import pytest
+
+from framework.auth import login_to_inventory
+from pages import CartPage, InventoryPage
+from pages import CheckoutStepOnePage, CheckoutOverviewPage, CheckoutCompletePage
+
+pytestmark = pytest.mark.benchmark
+
+SORTS = [
+    ("Name (A to Z)", "assert_sorted_name_asc"),
+    ("Name (Z to A)", "assert_sorted_name_desc"),
+    ("Price (low to high)", "assert_sorted_price_asc"),
+    ("Price (high to low)", "assert_sorted_price_desc"),
+]
+
+
+@pytest.fixture
+def logged_in(page_factory, base_url, users_data, auth_cache):
+    open_page, close_page = page_factory
+
+    def _setup() -> InventoryPage:
+        inv = login_to_inventory(open_page(), base_url, users_data, auth_cache, "standard_user")
+        inv.is_at()
+        return inv
+
+    def _teardown(inv: InventoryPage) -> None:
+        close_page(inv.page)
+
+    return _setup, _teardown
+
+
+def test_bench_context_startup(bench, page_factory):
+    open_page, close_page = page_factory
+    bench.measure(
+        "context.startup",
+        lambda pages: pages.append(open_page()),
+        setup=list,
+        teardown=lambda pages: [close_page(p) for p in pages],
+    )
+
+
+@pytest.mark.parametrize("use_cache", [False, True], ids=["ui", "cached"])
+def test_bench_login(bench, page_factory, base_url, users_data, auth_cache, use_cache):
+    open_page, close_page = page_factory
+
+    def _login(page):
+        login_to_inventory(page, base_url, users_data, auth_cache, "standard_user", use_cache=use_cache).is_at()
+
+    bench.measure(f"login.{'cached' if use_cache else 'ui'}", _login, setup=open_page, teardown=close_page)
+
+
+def test_bench_inventory_reads(bench, logged_in):
+    setup, teardown = logged_in
+    inv = setup()
+    try:
+        bench.measure("inventory.item_names", lambda _: inv.item_names())
+        bench.measure("inventory.item_prices", lambda _: inv.item_prices())
+    finally:
+        teardown(inv)
+
+
+def test_bench_sort_and_assert(bench, logged_in):
+    setup, teardown = logged_in
+    inv = setup()
+
+    def _sort_all(_):
+        for label, assertion in SORTS:
+            inv.select_sort(label)
+            getattr(inv, assertion)()
+
+    try:
+        bench.measure("inventory.sort_matrix", _sort_all)
+    finally:
+        teardown(inv)
+
+
+def test_bench_full_checkout(bench, logged_in):
+    setup, teardown = logged_in
+
+    def _checkout(inv: InventoryPage):
+        inv.add_all_items()
+        inv.open_cart()
+        CartPage(inv.page).start_checkout()
+
+        c1 = CheckoutStepOnePage(inv.page)
+        c1.is_at()
+        c1.fill("John", "Doe", "12345")
+        c1.continue_checkout()
+
+        c2 = CheckoutOverviewPage(inv.page)
+        c2.is_at()
+        c2.finish()
+
+        CheckoutCompletePage(inv.page).is_at()
+
+    bench.measure("checkout.full", _checkout, setup=setup, teardown=teardown)
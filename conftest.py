@@ -1,34 +1,70 @@
-import json
+from __future__ import annotations
+
 import os
-from pathlib import Path
-from typing import Any, Dict, Optional, Generator
+from typing import TYPE_CHECKING, Any, Dict, Optional, Generator
 
 import pytest
 from playwright.sync_api import Playwright, Page, BrowserContext
-from playwright.sync_api import Browser
-from playwright.sync_api import BrowserContext
-from playwright.sync_api import Page
-from playwright.sync_api import sync_playwright
 
-from pages import InventoryPage
-from pages import LoginPage
+from framework.browser import BROWSER_MANAGER_KEY, BrowserManager, LAUNCH_STATS_KEY
+from framework.browser import is_headless, resolve_context_mode
+from framework.browser import resolve_viewport
+from framework.artifacts import ARTIFACT_RECORDER_KEY, FailureArtifacts
+from framework.auth import StorageStateCache, login_to_inventory
+from framework.context_pool import PREWARMED_KEY, WarmContextPool
+from framework.matrix import BrowserTarget
+from framework.network import NETWORK_STATS_KEY, NetworkRouter
+from framework.perf import PerfMonitor
+from framework.standin import StandinServer
+from framework.users import load_users
+from framework.workers import worker_id
+
+if TYPE_CHECKING:
+    from pages import InventoryPage
+
+pytest_plugins = [
+    "framework.plugins.startup",
+    "framework.plugins.browser",
+    "framework.plugins.auth",
+    "framework.plugins.parallel",
+    "framework.plugins.selection",
+    "framework.plugins.standin",
+    "framework.plugins.network",
+    "framework.plugins.steps",
+    "framework.plugins.results",
+    "framework.plugins.bench",
+    "framework.plugins.pool",
+    "framework.plugins.reuse",
+    "framework.plugins.async_api",
+    "framework.plugins.matrix",
+    "framework.plugins.artifacts",
+    "framework.plugins.selectors",
+    "framework.plugins.waits",
+    "framework.plugins.resources",
+    "framework.plugins.users",
+    "framework.plugins.perf",
+    "framework.plugins.visual",
+    "pytester",
+]
 
 
 @pytest.fixture(scope="session")
 def users_data() -> Dict[str, Any]:
-    data_path = Path(__file__).parent / "data" / "users.json"
-    with data_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_users()
 
 
 @pytest.fixture(scope="session")
-def base_url(pytestconfig: pytest.Config) -> str:
+def base_url(pytestconfig: pytest.Config, standin_server: Optional[StandinServer]) -> str:
     """Base URL for AUT.
 
-    Prefer pytest-playwright's built-in --base-url option when present.
+    With --standin (or SAUCEDEMO_STANDIN=1) the local stand-in server is used.
+    Otherwise prefer pytest-playwright's built-in --base-url option when present.
     Fall back to BASE_URL env var, then SauceDemo default.
     """
 
+    if standin_server is not None:
+        return standin_server.url
+
     cli_value: Optional[str]
     try:
         # Provided by pytest-playwright (if installed): --base-url
@@ -43,165 +79,142 @@ def base_url(pytestconfig: pytest.Config) -> str:
 
 
 @pytest.fixture(scope="session")
-def playwright_instance() -> Playwright:
-    """Session-scoped Playwright instance.
-
-    We keep this explicit rather than relying on pytest-playwright's fixtures so we can
-    create a persistent Chromium context and apply browser profile preferences.
-    """
-    with sync_playwright() as p:
-        yield p
-
-
-def _is_headless(pytestconfig: pytest.Config) -> bool:
-    """Resolve headless mode.
-
-    - If pytest-playwright is installed, it provides --headed (default is headless).
-    - We also support HEADLESS env var for CI convenience.
-    """
-
-    env = os.getenv("HEADLESS")
-    if env is not None:
-        return str(env).strip().lower() in {"1", "true", "yes", "y"}
-
-    try:
-        headed = bool(pytestconfig.getoption("headed"))
-        return not headed
-    except Exception:
-        # If the option doesn't exist, default to headless=false for local dev.
-        return False
-
-
-def _resolve_browser_name(pytestconfig: pytest.Config) -> str:
-    """Resolve desired browser name.
-
-    If pytest-playwright is installed, it provides --browser. Otherwise default to chromium.
-    """
-    try:
-        browser_opt = pytestconfig.getoption("browser")
-    except Exception:
-        return os.getenv("BROWSER", "chromium")
-
-    if isinstance(browser_opt, (list, tuple)):
-        return (browser_opt[0] if browser_opt else "chromium")
-    return browser_opt or "chromium"
-
-
-def _resolve_channel(pytestconfig: pytest.Config) -> Optional[str]:
-    """Resolve browser channel (e.g., msedge).
-
-    If pytest-playwright is installed, it provides --browser-channel.
-    """
-    try:
-        channel = pytestconfig.getoption("browser_channel")
-    except Exception:
-        channel = None
-
-    channel = (str(channel).strip() if channel else "")
-    if channel:
-        return channel
-
-    env = os.getenv("BROWSER_CHANNEL")
-    return env.strip() if env else None
-
-
-def _write_chromium_preferences(user_data_dir: Path) -> None:
-    """Pre-create Chromium Preferences to disable password leak detection popup.
+def browser_manager(
+    pytestconfig: pytest.Config,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[BrowserManager, Any, None]:
+    """Per-worker owner of browser processes (see framework/browser.py for the modes).
 
-    This prevents the native (non-DOM) 'Change your password' breach dialog from blocking tests.
-    Mirrors the Java framework fix: profile.password_manager_leak_detection = false.
+    We keep this explicit rather than relying on pytest-playwright's fixtures so we control
+    the browser lifecycle (shared browser per worker or persistent Chromium profiles). The
+    manager starts the Playwright driver on the first browser launch and stops it at the end.
     """
+    manager = BrowserManager(
+        None,
+        tmp_path_factory,
+        mode=resolve_context_mode(pytestconfig),
+        headless=is_headless(pytestconfig),
+        viewport=resolve_viewport(),
+        worker_id=worker_id(pytestconfig),
+    )
+    pytestconfig.stash[LAUNCH_STATS_KEY] = manager.stats
+    pytestconfig.stash[BROWSER_MANAGER_KEY] = manager
+    yield manager
+    manager.close()
 
-    default_dir = user_data_dir / "Default"
-    default_dir.mkdir(parents=True, exist_ok=True)
-    preferences_path = default_dir / "Preferences"
-
-    prefs = {
-        "credentials_enable_service": False,
-        "profile": {
-            "password_manager_enabled": False,
-            "password_manager_leak_detection": False,
-        },
-    }
 
-    preferences_path.write_text(json.dumps(prefs, indent=2), encoding="utf-8")
+@pytest.fixture(scope="session")
+def playwright_instance(browser_manager: BrowserManager) -> Playwright:
+    """The worker's Playwright driver (one per xdist worker), started on request."""
+    return browser_manager.playwright
 
 
 @pytest.fixture
 def context(
-    playwright_instance: Playwright,
+    request: pytest.FixtureRequest,
+    browser_manager: BrowserManager,
+    browser_target: BrowserTarget,
+    network_router: Optional[NetworkRouter],
+    warm_pool: Optional[WarmContextPool],
+    failure_artifacts: Optional[FailureArtifacts],
+    perf_monitor: Optional[PerfMonitor],
     pytestconfig: pytest.Config,
-    tmp_path_factory: pytest.TempPathFactory,
 ) -> Generator[BrowserContext, Any, None]:
     """Provides a clean browser context per test.
 
-    Strategy:
-    - Chromium (default) -> persistent context with isolated user-data-dir, allowing profile prefs.
-    - Firefox/WebKit     -> regular incognito context.
+    Strategy (--context-mode / CONTEXT_MODE):
+    - shared (default) -> lightweight new_context() on the worker's long-lived browser.
+    - isolated         -> full launch per test; Chromium gets a persistent context with an
+                          isolated user-data-dir, allowing profile prefs.
 
     Browser selection options (when pytest-playwright is installed):
       --browser chromium|firefox|webkit
       --browser-channel msedge
       --headed
+    With --browser-matrix, compatibility tests run once per listed browser instead.
+
+    With --network-policy, requests are routed through framework/network.py.
+    With --warm-pool N, the context comes from framework/context_pool.py when one is ready.
+    Failing tests get a screenshot, DOM and console log (framework/artifacts.py).
+    With --perf-metrics, page transitions record web performance metrics (framework/perf.py).
     """
 
-    browser_name = _resolve_browser_name(pytestconfig)
-    channel = _resolve_channel(pytestconfig)
-    headless = _is_headless(pytestconfig)
-
-    width = int(os.getenv("WINDOW_WIDTH", "1366"))
-    height = int(os.getenv("WINDOW_HEIGHT", "768"))
-
-    if browser_name == "chromium":
-        user_data_dir = tmp_path_factory.mktemp("pw-chromium-profile")
-        _write_chromium_preferences(user_data_dir)
-
-        launch_args: Dict[str, Any] = {
-            "headless": headless,
-            "viewport": {"width": width, "height": height},
-            # Extra hardening: disable the feature flags as well.
-            "args": [
-                "--disable-features=PasswordLeakDetection,PasswordManager",
-                "--disable-notifications",
-            ],
-        }
-        if channel:
-            launch_args["channel"] = channel
-
-        ctx = playwright_instance.chromium.launch_persistent_context(str(user_data_dir), **launch_args)
-        yield ctx
-        ctx.close()
-        return
-
-    # Non-Chromium browsers
-    browser_type = getattr(playwright_instance, browser_name)
-    browser: Browser = browser_type.launch(headless=headless)
-    ctx = browser.new_context(viewport={"width": width, "height": height})
+    if warm_pool is not None and not warm_pool.serves(browser_target.name, browser_target.channel):
+        warm_pool = None
+    pooled = warm_pool.take() if warm_pool is not None else None
+    if pooled is not None:
+        ctx = pooled.context
+        counters = pooled.extras
+        request.node.stash[PREWARMED_KEY] = pooled
+    else:
+        ctx = browser_manager.acquire(browser_target.name, browser_target.channel)
+        counters = network_router.install(ctx) if network_router is not None else None
+    if perf_monitor is not None:
+        perf_monitor.install(ctx)
+    if warm_pool is not None:
+        # Refill now: the browser loads the next contexts' pages while this test runs.
+        warm_pool.replenish()
+    if network_router is not None:
+        pytestconfig.stash[NETWORK_STATS_KEY].per_test.append((request.node.nodeid, counters))
+    recorder = failure_artifacts.attach(ctx) if failure_artifacts is not None else None
+    if recorder is not None:
+        request.node.stash[ARTIFACT_RECORDER_KEY] = recorder
     yield ctx
-    ctx.close()
-    browser.close()
+    if recorder is not None:
+        failure_artifacts.finish(recorder, request.node.nodeid)
+    if network_router is not None:
+        request.node.user_properties.append(("network", counters.as_dict()))
+    browser_manager.release(ctx)
 
 
 @pytest.fixture
-def page(context: BrowserContext) -> Generator[Page, Any, None]:
-    p = context.new_page()
+def page(request: pytest.FixtureRequest, context: BrowserContext) -> Generator[Page, Any, None]:
+    pooled = request.node.stash.get(PREWARMED_KEY, None)
+    p = pooled.page if pooled is not None else context.new_page()
     yield p
     p.close()
 
 
 @pytest.fixture
-def login(page: Page, base_url: str, users_data: Dict[str, Any]):
+def login(
+    request: pytest.FixtureRequest,
+    page: Page,
+    base_url: str,
+    users_data: Dict[str, Any],
+    auth_cache: StorageStateCache,
+):
+    """Log in and return the inventory page.
+
+    Restores a cached storage_state when possible; tests marked ``ui_login`` (or runs with
+    --no-auth-cache) always go through LoginPage.
+    """
+    use_cache = auth_cache.enabled and request.node.get_closest_marker("ui_login") is None
+    pooled = request.node.stash.get(PREWARMED_KEY, None)
+
     def _login(username: str, password: Optional[str] = None) -> InventoryPage:
-        lp = LoginPage(page, base_url)
-        lp.open()
-        lp.login(username, password or users_data["password"])
-        return InventoryPage(page)
+        nonlocal pooled
+        prepared = "none"
+        if pooled is not None:
+            # A warm page is only usable for the first login, an injected session only for its own user.
+            prepared = pooled.prepared
+            if prepared == "inventory" and (pooled.username != username or not use_cache or password):
+                page.context.clear_cookies()
+                prepared = "none"
+            pooled = None
+        return login_to_inventory(
+            page, base_url, users_data, auth_cache, username, password, use_cache=use_cache, prepared=prepared
+        )
 
     return _login
 
 
 @pytest.fixture
-def standard_inventory(login) -> InventoryPage:
-    inv = login("standard_user")
+def standard_inventory(request: pytest.FixtureRequest, shared_inventory: Optional[InventoryPage]) -> InventoryPage:
+    """standard_user's inventory page.
+
+    Tests marked ``read_only`` share a logged-in context per worker with --reuse-contexts
+    (framework/context_reuse.py); the others get their own context and login.
+    """
+    inv = shared_inventory or request.getfixturevalue("login")("standard_user")
     inv.is_at()
     return inv
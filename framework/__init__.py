@@ -0,0 +1 @@
+"""Test framework infrastructure: browser lifecycle, pytest plugins and reporting helpers."""
@@ -0,0 +1,189 @@
+"""Failure-only artifacts: cheap recording while a test runs, persisted only when it fails.
+
+Modes:
+
+- ``light`` (default) -> a bounded ring of console messages, page errors, failed requests and
+                         navigations per context; a failing test gets a screenshot (JPEG), the
+                         DOM (gzip) and that ring (gzip JSON).
+- ``trace``           -> ``light`` plus Playwright tracing; the trace is written only on failure
+                         and discarded otherwise.
+- ``off``             -> nothing is recorded.
+
+Files land in ``test-results/failures/<test>/``. Every file is capped (``max_file_bytes``) and
+the run stops writing once ``max_total_bytes`` have been used. The time spent recording on
+passing tests is measured so the overhead shows up in the session summary.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+import pytest
+from playwright.sync_api import BrowserContext, Page
+
+ARTIFACT_MODES = ("off", "light", "trace")
+DEFAULT_DIR = "test-results/failures"
+DEFAULT_RING_SIZE = 200
+DEFAULT_MAX_FILE_MB = 10.0
+DEFAULT_MAX_TOTAL_MB = 200.0
+SCREENSHOT_QUALITY = 70
+
+
+@dataclass
+class ArtifactStats:
+    tests: int = 0
+    failures: int = 0
+    bytes_written: int = 0
+    over_budget: int = 0
+    # Recording cost on passing tests (listener setup, tracing start/discard).
+    overhead: List[float] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "tests": self.tests,
+            "failures": self.failures,
+            "bytes_written": self.bytes_written,
+            "over_budget": self.over_budget,
+            "overhead": self.overhead,
+        }
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        self.tests += other["tests"]
+        self.failures += other["failures"]
+        self.bytes_written += other["bytes_written"]
+        self.over_budget += other["over_budget"]
+        self.overhead.extend(other["overhead"])
+
+
+class ArtifactRecorder:
+    """Per-test recorder attached to one browser context."""
+
+    def __init__(self, ctx: BrowserContext, tracing: bool, ring_size: int = DEFAULT_RING_SIZE) -> None:
+        started = time.perf_counter()
+        self.context = ctx
+        self.tracing = tracing
+        self.failed = False
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=ring_size)
+        self.overhead = 0.0
+        ctx.on("console", lambda msg: self.note("console", msg.type, msg.text))
+        ctx.on("weberror", lambda err: self.note("pageerror", "error", str(err.error)))
+        ctx.on("requestfailed", lambda req: self.note("requestfailed", req.method, f"{req.url} {req.failure}"))
+        ctx.on("page", self._watch_page)
+        for page in ctx.pages:
+            self._watch_page(page)
+        if tracing:
+            ctx.tracing.start(screenshots=True, snapshots=True)
+        self.overhead += time.perf_counter() - started
+
+    def note(self, kind: str, level: str, text: str) -> None:
+        started = time.perf_counter()
+        self.events.append({"t": time.time(), "kind": kind, "level": level, "text": text})
+        self.overhead += time.perf_counter() - started
+
+    def _watch_page(self, page: Page) -> None:
+        def on_navigated(frame: Any) -> None:
+            if frame.parent_frame is None:
+                self.note("navigation", "info", frame.url)
+
+        page.on("framenavigated", on_navigated)
+
+    def current_page(self) -> Optional[Page]:
+        pages = [p for p in self.context.pages if not p.is_closed()]
+        return pages[-1] if pages else None
+
+
+def _safe_name(nodeid: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")[:150]
+
+
+class FailureArtifacts:
+    """Session-wide policy: attaches recorders and writes artifacts for failing tests."""
+
+    def __init__(
+        self,
+        root: Path,
+        mode: str = "light",
+        ring_size: int = DEFAULT_RING_SIZE,
+        max_file_bytes: int = int(DEFAULT_MAX_FILE_MB * 1024 * 1024),
+        max_total_bytes: int = int(DEFAULT_MAX_TOTAL_MB * 1024 * 1024),
+    ) -> None:
+        self.root = root
+        self.mode = mode
+        self.ring_size = ring_size
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.stats = ArtifactStats()
+
+    def attach(self, ctx: BrowserContext) -> ArtifactRecorder:
+        self.stats.tests += 1
+        return ArtifactRecorder(ctx, tracing=self.mode == "trace", ring_size=self.ring_size)
+
+    def _budget_left(self) -> bool:
+        return self.stats.bytes_written < self.max_total_bytes
+
+    def _write(self, path: Path, data: bytes) -> Optional[Path]:
+        if len(data) > self.max_file_bytes or not self._budget_left():
+            self.stats.over_budget += 1
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.stats.bytes_written += len(data)
+        return path
+
+    def test_dir(self, nodeid: str) -> Path:
+        return self.root / _safe_name(nodeid)
+
+    def capture(self, recorder: ArtifactRecorder, nodeid: str) -> List[Path]:
+        """Screenshot, DOM and event ring of the test's current page; called once, on failure."""
+        recorder.failed = True
+        self.stats.failures += 1
+        dest = self.test_dir(nodeid)
+        written: List[Optional[Path]] = []
+
+        page = recorder.current_page()
+        if page is not None:
+            try:
+                written.append(
+                    self._write(dest / "screenshot.jpg", page.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY))
+                )
+                # Truncate before compressing: a runaway DOM must not eat the whole budget.
+                dom = page.content().encode("utf-8")[: self.max_file_bytes]
+                written.append(self._write(dest / "dom.html.gz", gzip.compress(dom)))
+            except Exception as exc:  # page crashed or navigated away mid-capture
+                recorder.note("artifacts", "error", f"capture failed: {exc}")
+
+        console = json.dumps(list(recorder.events), indent=1).encode("utf-8")
+        written.append(self._write(dest / "console.json.gz", gzip.compress(console)))
+        return [p for p in written if p is not None]
+
+    def finish(self, recorder: ArtifactRecorder, nodeid: str) -> Optional[Path]:
+        """Stop recording; keeps the trace of a failed test, discards it otherwise."""
+        started = time.perf_counter()
+        trace_path: Optional[Path] = None
+        if recorder.tracing:
+            if recorder.failed and self._budget_left():
+                trace_path = self.test_dir(nodeid) / "trace.zip"
+                trace_path.parent.mkdir(parents=True, exist_ok=True)
+                recorder.context.tracing.stop(path=str(trace_path))
+                size = trace_path.stat().st_size
+                if size > self.max_file_bytes:
+                    trace_path.unlink()
+                    trace_path = None
+                    self.stats.over_budget += 1
+                else:
+                    self.stats.bytes_written += size
+            else:
+                recorder.context.tracing.stop()
+        if not recorder.failed:
+            self.stats.overhead.append(recorder.overhead + time.perf_counter() - started)
+        return trace_path
+
+
+ARTIFACT_RECORDER_KEY = pytest.StashKey[ArtifactRecorder]()
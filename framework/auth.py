@@ -0,0 +1,246 @@
+"""Authenticated storage-state cache.
+
+A UI login is performed once per (username, base_url); the resulting ``storage_state``
+(cookies + localStorage) is kept in memory and on disk and injected into later contexts,
+so tests land directly on ``/inventory.html``.
+
+Invalidation policy:
+- entries older than the TTL are rebuilt;
+- entries whose cookies expire within ``EXPIRY_MARGIN_S`` are rebuilt (SauceDemo's
+  ``session-username`` cookie is short-lived);
+- a restore that does not land on the inventory page drops the entry and falls back to
+  the UI login.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from urllib.parse import urljoin
+
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.selectors import InventorySelectors, LoginSelectors
+
+if TYPE_CHECKING:
+    from pages import InventoryPage
+
+DEFAULT_TTL_S = 300.0
+EXPIRY_MARGIN_S = 30.0
+
+# One-shot localStorage restore: runs on the first navigation of a tab only, so later
+# navigations don't overwrite state the test created (e.g. cart contents).
+_RESTORE_LOCAL_STORAGE_JS = """
+(origins) => {
+  if (window.sessionStorage.getItem('__pw_state_restored')) return;
+  const entry = origins.find((o) => o.origin === window.location.origin);
+  if (!entry) return;
+  for (const { name, value } of entry.localStorage) window.localStorage.setItem(name, value);
+  window.sessionStorage.setItem('__pw_state_restored', '1');
+}
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def merge(self, other: Dict[str, int]) -> None:
+        self.hits += other["hits"]
+        self.misses += other["misses"]
+        self.invalidations += other["invalidations"]
+
+
+class StorageStateCache:
+    """Storage states keyed by (username, base_url), persisted as JSON files in ``cache_dir``."""
+
+    def __init__(self, cache_dir: Optional[Path], ttl: float = DEFAULT_TTL_S, enabled: bool = True) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.enabled = enabled
+        self.stats = CacheStats()
+        self._memory: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    @staticmethod
+    def _key(username: str, base_url: str) -> Tuple[str, str]:
+        return username, base_url.rstrip("/") + "/"
+
+    def _path(self, key: Tuple[str, str]) -> Path:
+        digest = hashlib.sha1("|".join(key).encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{key[0]}-{digest}.json"
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        now = time.time()
+        if now - float(entry.get("created", 0)) > self.ttl:
+            return False
+        for cookie in entry["state"].get("cookies", []):
+            expires = float(cookie.get("expires", -1))
+            if 0 < expires < now + EXPIRY_MARGIN_S:
+                return False
+        return True
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        entry = self._memory.get(key)
+        if entry is None and self.cache_dir is not None:
+            try:
+                entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                entry = None
+
+        if entry is None or not self._is_fresh(entry):
+            self._memory.pop(key, None)
+            return None
+        self._memory[key] = entry
+        return entry
+
+    def get(self, username: str, base_url: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh storage state or None (counted as a miss)."""
+        entry = self._lookup(self._key(username, base_url))
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry["state"]
+
+    def peek(self, username: str, base_url: str) -> Optional[Dict[str, Any]]:
+        """Like ``get`` but not counted: for prewarming, which is not a login the cache saved."""
+        entry = self._lookup(self._key(username, base_url))
+        return entry["state"] if entry is not None else None
+
+    def put(self, username: str, base_url: str, state: Dict[str, Any]) -> None:
+        key = self._key(username, base_url)
+        entry = {"created": time.time(), "username": key[0], "base_url": key[1], "state": state}
+        self._memory[key] = entry
+        if self.cache_dir is None:
+            return
+
+        # Atomic write: parallel workers may read the same file.
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def invalidate(self, username: str, base_url: str) -> None:
+        key = self._key(username, base_url)
+        self._memory.pop(key, None)
+        if self.cache_dir is not None:
+            self._path(key).unlink(missing_ok=True)
+        self.stats.invalidations += 1
+
+
+class CachedLogin:
+    """The cache decisions of one login, shared by the sync and async login paths.
+
+    Callers do the browser work: restore ``state()`` when it is not None (``restore_failed()`` when
+    that bounced to the login page), else log in with ``password`` and ``remember()`` the session
+    once the inventory loaded.
+    """
+
+    def __init__(
+        self,
+        auth_cache: StorageStateCache,
+        base_url: str,
+        users_data: Dict[str, Any],
+        username: str,
+        password: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> None:
+        self.auth_cache = auth_cache
+        self.base_url = base_url
+        self.username = username
+        self.password = password or users_data["password"]
+        # Only default-password logins of users that can log in are worth (and safe) caching.
+        self.cacheable = (
+            use_cache
+            and auth_cache.enabled
+            and self.password == users_data["password"]
+            and users_data["users"].get(username, {}).get("kind") != "locked_out"
+        )
+
+    def state(self) -> Optional[Dict[str, Any]]:
+        return self.auth_cache.get(self.username, self.base_url) if self.cacheable else None
+
+    def restore_failed(self) -> None:
+        self.auth_cache.invalidate(self.username, self.base_url)
+
+    def remember(self, state: Dict[str, Any]) -> None:
+        if self.cacheable:
+            self.auth_cache.put(self.username, self.base_url, state)
+
+
+def restore_session(page: Page, base_url: str, state: Dict[str, Any]) -> bool:
+    """Inject ``state`` into the page's context and open the inventory.
+
+    Returns False when the app bounced us back to the login page (stale session).
+    """
+    context = page.context
+    if state.get("cookies"):
+        context.add_cookies(state["cookies"])
+    if state.get("origins"):
+        context.add_init_script(f"({_RESTORE_LOCAL_STORAGE_JS})({json.dumps(state['origins'])})")
+
+    page.goto(urljoin(base_url, "inventory.html"))
+    return _landed_on_inventory(page)
+
+
+def _landed_on_inventory(page: Page) -> bool:
+    # Resolves as soon as either page renders: no timeout burned on a stale session.
+    page.wait_for_selector(f"{InventorySelectors.ITEM}, {LoginSelectors.LOGIN_BTN}")
+    return "inventory.html" in page.url
+
+
+def login_to_inventory(
+    page: Page,
+    base_url: str,
+    users_data: Dict[str, Any],
+    auth_cache: StorageStateCache,
+    username: str,
+    password: Optional[str] = None,
+    use_cache: bool = True,
+    prepared: str = "none",
+) -> InventoryPage:
+    """Log ``username`` in (restoring a cached session when possible) and return the inventory page.
+
+    ``prepared`` describes a page pre-navigated by the warm context pool: ``"login"`` (login page
+    loading) or ``"inventory"`` (session injected, inventory loading).
+    """
+    from pages import InventoryPage, LoginPage  # deferred: page objects load with the first login
+
+    cached = CachedLogin(auth_cache, base_url, users_data, username, password, use_cache)
+
+    if prepared == "inventory":
+        if _landed_on_inventory(page):
+            return InventoryPage(page)
+        prepared = "login"
+    else:
+        state = cached.state()
+        if state is not None:
+            if restore_session(page, base_url, state):
+                return InventoryPage(page)
+            cached.restore_failed()
+            prepared = "login"
+
+    lp = LoginPage(page, base_url)
+    if prepared == "login":
+        lp.wait_until_open()
+    else:
+        lp.open()
+    lp.login(username, cached.password)
+
+    if cached.cacheable:
+        try:
+            page.wait_for_url("**/inventory.html")
+        except PlaywrightTimeoutError:
+            # Login didn't go through; leave the assertion to the test.
+            return InventoryPage(page)
+        cached.remember(page.context.storage_state())
+    return InventoryPage(page)
@@ -0,0 +1,140 @@
+"""Framework-overhead benchmarks: repeated measurements compared against a stored baseline.
+
+A metric regresses when its median exceeds the baseline median by more than ``threshold``
+(relative, e.g. 0.2 = 20%). Baselines are only comparable on the same machine class and
+browser, so the recorded environment is printed next to any mismatch.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import pytest
+
+from framework.stats import describe
+
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+DEFAULT_ITERATIONS = 5
+DEFAULT_WARMUP = 1
+DEFAULT_THRESHOLD = 0.2
+
+T = TypeVar("T")
+
+
+@dataclass
+class BenchResult:
+    metric: str
+    samples: List[float]
+    median: float
+    p95: float
+    baseline: Optional[float] = None
+    threshold: float = DEFAULT_THRESHOLD
+
+    @property
+    def delta(self) -> Optional[float]:
+        """Relative change against the baseline median (+0.25 = 25% slower)."""
+        if not self.baseline:
+            return None
+        return self.median / self.baseline - 1
+
+    @property
+    def regressed(self) -> bool:
+        return self.delta is not None and self.delta > self.threshold
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def environment(browser_name: str) -> Dict[str, str]:
+    return {"browser": browser_name, "python": sys.version.split()[0], "platform": platform.platform()}
+
+
+class Baseline:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        self.env: Dict[str, str] = data.get("env", {})
+        self.metrics: Dict[str, Dict[str, float]] = data.get("metrics", {})
+
+    def median(self, metric: str) -> Optional[float]:
+        entry = self.metrics.get(metric)
+        return entry["median"] if entry else None
+
+    def save(self, results: List[Dict[str, Any]], env: Dict[str, str]) -> None:
+        for result in results:
+            self.metrics[result["metric"]] = {
+                "median": result["median"],
+                "p95": result["p95"],
+                "iterations": len(result["samples"]),
+            }
+        self.env = env
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"env": env, "metrics": dict(sorted(self.metrics.items()))}
+        self.path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+class BenchRunner:
+    """Runs ``fn`` ``warmup + iterations`` times; only the measured part is timed."""
+
+    def __init__(
+        self,
+        baseline: Baseline,
+        iterations: int = DEFAULT_ITERATIONS,
+        warmup: int = DEFAULT_WARMUP,
+        threshold: float = DEFAULT_THRESHOLD,
+        enforce: bool = True,
+    ) -> None:
+        self.baseline = baseline
+        self.iterations = iterations
+        self.warmup = warmup
+        self.threshold = threshold
+        self.enforce = enforce
+        self.results: List[BenchResult] = []
+
+    def measure(
+        self,
+        metric: str,
+        fn: Callable[[T], Any],
+        setup: Callable[[], T] = lambda: None,  # type: ignore[assignment, return-value]
+        teardown: Callable[[T], Any] = lambda _: None,
+    ) -> BenchResult:
+        """Time ``fn(setup())`` per iteration; regressions are reported together by :meth:`check`."""
+        samples: List[float] = []
+        for i in range(self.warmup + self.iterations):
+            state = setup()
+            try:
+                started = time.perf_counter()
+                fn(state)
+                elapsed = time.perf_counter() - started
+            finally:
+                teardown(state)
+            if i >= self.warmup:
+                samples.append(elapsed)
+
+        stats = describe(samples)
+        result = BenchResult(metric, samples, stats["p50"], stats["p95"], self.baseline.median(metric), self.threshold)
+        self.results.append(result)
+        return result
+
+    def check(self) -> None:
+        """Fail the test once, listing every metric that regressed (all metrics still get measured)."""
+        regressed = [r for r in self.results if r.regressed]
+        if not self.enforce or not regressed:
+            return
+        pytest.fail(
+            "\n".join(
+                f"{r.metric} regressed: median {r.median * 1000:.1f} ms vs baseline {r.baseline * 1000:.1f} ms "
+                f"(+{r.delta:.0%}, threshold {r.threshold:.0%})"
+                for r in regressed
+            ),
+            pytrace=False,
+        )
@@ -0,0 +1,293 @@
+"""Browser lifecycle: option resolution and the per-worker browser manager.
+
+Two context modes are supported:
+
+- ``shared``   (default) -> one browser process per worker, kept for the whole session.
+                             Each test gets a lightweight ``browser.new_context()``.
+- ``isolated``            -> a full browser launch per test. Chromium uses a persistent
+                             context with a fresh, pre-seeded user-data-dir.
+
+The Playwright driver itself is started on the first browser launch, so sessions whose tests
+never touch a browser (collection only, stand-in or async-only runs) don't pay for it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
+
+CONTEXT_MODES = ("shared", "isolated")
+
+# Chromium hardening against the native (non-DOM) password leak dialog.
+# Incognito contexts created via new_context() never run leak detection, the flags cover
+# the persistent (isolated) profile as well.
+CHROMIUM_ARGS = [
+    "--disable-features=PasswordLeakDetection,PasswordManager",
+    "--disable-notifications",
+]
+
+
+def is_headless(config: pytest.Config) -> bool:
+    """Resolve headless mode.
+
+    - If pytest-playwright is installed, it provides --headed (default is headless).
+    - We also support HEADLESS env var for CI convenience.
+    """
+
+    env = os.getenv("HEADLESS")
+    if env is not None:
+        return str(env).strip().lower() in {"1", "true", "yes", "y"}
+
+    try:
+        headed = bool(config.getoption("headed"))
+        return not headed
+    except Exception:
+        # If the option doesn't exist, default to headless=false for local dev.
+        return False
+
+
+def resolve_browser_name(config: pytest.Config) -> str:
+    """Resolve desired browser name.
+
+    If pytest-playwright is installed, it provides --browser. Otherwise default to chromium.
+    """
+    try:
+        browser_opt = config.getoption("browser")
+    except Exception:
+        return os.getenv("BROWSER", "chromium")
+
+    if isinstance(browser_opt, (list, tuple)):
+        return (browser_opt[0] if browser_opt else "chromium")
+    return browser_opt or "chromium"
+
+
+def resolve_channel(config: pytest.Config) -> Optional[str]:
+    """Resolve browser channel (e.g., msedge).
+
+    If pytest-playwright is installed, it provides --browser-channel.
+    """
+    try:
+        channel = config.getoption("browser_channel")
+    except Exception:
+        channel = None
+
+    channel = (str(channel).strip() if channel else "")
+    if channel:
+        return channel
+
+    env = os.getenv("BROWSER_CHANNEL")
+    return env.strip() if env else None
+
+
+def resolve_context_mode(config: pytest.Config) -> str:
+    """Resolve context mode: --context-mode, then CONTEXT_MODE env var, then ``shared``."""
+    mode = config.getoption("context_mode", default=None) or os.getenv("CONTEXT_MODE", "shared")
+    mode = str(mode).strip().lower()
+    if mode not in CONTEXT_MODES:
+        raise pytest.UsageError(f"Unknown context mode: {mode!r} (expected one of {', '.join(CONTEXT_MODES)})")
+    return mode
+
+
+def resolve_viewport() -> Dict[str, int]:
+    return {
+        "width": int(os.getenv("WINDOW_WIDTH", "1366")),
+        "height": int(os.getenv("WINDOW_HEIGHT", "768")),
+    }
+
+
+def write_chromium_preferences(user_data_dir: Path) -> None:
+    """Pre-create Chromium Preferences to disable password leak detection popup.
+
+    This prevents the native (non-DOM) 'Change your password' breach dialog from blocking tests.
+    Mirrors the Java framework fix: profile.password_manager_leak_detection = false.
+    """
+
+    default_dir = user_data_dir / "Default"
+    default_dir.mkdir(parents=True, exist_ok=True)
+    preferences_path = default_dir / "Preferences"
+
+    prefs = {
+        "credentials_enable_service": False,
+        "profile": {
+            "password_manager_enabled": False,
+            "password_manager_leak_detection": False,
+        },
+    }
+
+    preferences_path.write_text(json.dumps(prefs, indent=2), encoding="utf-8")
+
+
+def launch_options(browser_name: str, channel: Optional[str], headless: bool) -> Dict[str, Any]:
+    """``launch()`` keyword arguments, shared by the sync manager and the async fixtures."""
+    launch_args: Dict[str, Any] = {"headless": headless}
+    if browser_name == "chromium":
+        launch_args["args"] = list(CHROMIUM_ARGS)
+        if channel:
+            launch_args["channel"] = channel
+    return launch_args
+
+
+@dataclass
+class LaunchStats:
+    """Counters reported at the end of the session."""
+
+    launches: Dict[str, int] = field(default_factory=dict)
+    setup_times: List[float] = field(default_factory=list)
+    driver_start_s: Optional[float] = None  # None: the driver was never started
+    first_launch_s: Optional[float] = None
+    first_ready_at: Optional[float] = None  # epoch seconds the first browser was up
+
+    @property
+    def total_launches(self) -> int:
+        return sum(self.launches.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"launches": self.launches, "setup_times": self.setup_times, "driver_start_s": self.driver_start_s}
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        """Fold in a worker's :meth:`as_dict`; the driver start keeps the slowest worker's."""
+        for label, count in other["launches"].items():
+            self.launches[label] = self.launches.get(label, 0) + count
+        self.setup_times.extend(other["setup_times"])
+        if other["driver_start_s"] is not None:
+            self.driver_start_s = max(self.driver_start_s or 0.0, other["driver_start_s"])
+
+    def record_launch(self, label: str, seconds: Optional[float] = None) -> None:
+        self.launches[label] = self.launches.get(label, 0) + 1
+        if self.first_launch_s is None and seconds is not None:
+            self.first_launch_s = seconds
+            self.first_ready_at = time.time()
+
+
+LAUNCH_STATS_KEY = pytest.StashKey[LaunchStats]()
+BROWSER_MANAGER_KEY = pytest.StashKey["BrowserManager"]()
+
+
+class BrowserManager:
+    """Owns the browsers of one worker process and hands out per-test contexts."""
+
+    def __init__(
+        self,
+        playwright: Optional[Playwright],
+        tmp_path_factory: pytest.TempPathFactory,
+        mode: str = "shared",
+        headless: bool = True,
+        viewport: Optional[Dict[str, int]] = None,
+        worker_id: str = "master",
+    ) -> None:
+        # None: start (and stop) our own driver on first use.
+        self._playwright = playwright
+        self._owns_driver = playwright is None
+        self.tmp_path_factory = tmp_path_factory
+        self.mode = mode
+        self.headless = headless
+        self.viewport = viewport or resolve_viewport()
+        self.worker_id = worker_id
+        self.stats = LaunchStats()
+        self._browsers: Dict[Tuple[str, Optional[str]], Browser] = {}
+        # Browsers launched for a single test in isolated mode, closed together with the context.
+        self._owned: Dict[int, Browser] = {}
+        # Contexts handed out and not released yet (leak checks in framework/resources.py).
+        self._live: Dict[int, BrowserContext] = {}
+
+    @staticmethod
+    def label(browser_name: str, channel: Optional[str] = None) -> str:
+        return f"{browser_name}:{channel}" if channel else browser_name
+
+    @property
+    def playwright(self) -> Playwright:
+        """The worker's Playwright driver, started on first use."""
+        if self._playwright is None:
+            started = time.perf_counter()
+            self._playwright = sync_playwright().start()
+            self.stats.driver_start_s = time.perf_counter() - started
+        return self._playwright
+
+    @property
+    def driver_started(self) -> bool:
+        return self._playwright is not None
+
+    def _launch(self, browser_name: str, channel: Optional[str]) -> Browser:
+        launch_args = launch_options(browser_name, channel, self.headless)
+        driver = self.playwright
+        started = time.perf_counter()
+        browser = getattr(driver, browser_name).launch(**launch_args)
+        self.stats.record_launch(self.label(browser_name, channel), time.perf_counter() - started)
+        return browser
+
+    def browser(self, browser_name: str, channel: Optional[str] = None) -> Browser:
+        """Return the worker's shared browser, launching it on first use."""
+        key = (browser_name, channel)
+        browser = self._browsers.get(key)
+        if browser is None or not browser.is_connected():
+            browser = self._launch(browser_name, channel)
+            self._browsers[key] = browser
+        return browser
+
+    def acquire(self, browser_name: str, channel: Optional[str] = None, **context_args: Any) -> BrowserContext:
+        """Create a fresh context for one test and record how long it took."""
+        started = time.perf_counter()
+        if self.mode == "shared":
+            ctx = self.browser(browser_name, channel).new_context(viewport=self.viewport, **context_args)
+        else:
+            ctx = self._acquire_isolated(browser_name, channel, **context_args)
+        self.stats.setup_times.append(time.perf_counter() - started)
+        self._live[id(ctx)] = ctx
+        return ctx
+
+    def _acquire_isolated(self, browser_name: str, channel: Optional[str], **context_args: Any) -> BrowserContext:
+        if browser_name == "chromium":
+            # tmp_path_factory is already per-worker under xdist; the worker id keeps names readable.
+            user_data_dir = self.tmp_path_factory.mktemp(f"pw-chromium-profile-{self.worker_id}")
+            write_chromium_preferences(user_data_dir)
+
+            launch_args: Dict[str, Any] = {
+                "headless": self.headless,
+                "viewport": self.viewport,
+                # Extra hardening: disable the feature flags as well.
+                "args": list(CHROMIUM_ARGS),
+                **context_args,
+            }
+            if channel:
+                launch_args["channel"] = channel
+
+            driver = self.playwright
+            started = time.perf_counter()
+            ctx = driver.chromium.launch_persistent_context(str(user_data_dir), **launch_args)
+            self.stats.record_launch(self.label(browser_name, channel), time.perf_counter() - started)
+            return ctx
+
+        browser = self._launch(browser_name, channel)
+        ctx = browser.new_context(viewport=self.viewport, **context_args)
+        self._owned[id(ctx)] = browser
+        return ctx
+
+    def live_contexts(self) -> List[BrowserContext]:
+        return list(self._live.values())
+
+    def resident(self) -> int:
+        """Started driver plus shared browsers: processes that outlive the test that launched them."""
+        return int(self._playwright is not None and self._owns_driver) + len(self._browsers)
+
+    def release(self, ctx: BrowserContext) -> None:
+        self._live.pop(id(ctx), None)
+        ctx.close()
+        browser = self._owned.pop(id(ctx), None)
+        if browser is not None:
+            browser.close()
+
+    def close(self) -> None:
+        for browser in self._browsers.values():
+            if browser.is_connected():
+                browser.close()
+        self._browsers.clear()
+        if self._owns_driver and self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
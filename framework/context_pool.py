@@ -0,0 +1,185 @@
+"""Warm context pool: browser contexts created (and optionally pre-navigated) ahead of demand.
+
+Playwright's sync API is bound to the runner thread, so contexts can't be built on a
+background thread. Instead the pool refills right after a test takes a context and starts
+the pre-navigation with ``wait_until="commit"``: the browser loads those pages in parallel
+while the current test runs, and the next test finds a context that is already rendered.
+
+Policies:
+- ``size``          -> at most K idle contexts;
+- ``idle_ttl``      -> idle contexts older than this are closed (stale session cookies);
+- ``min_free_mb``   -> no new warm contexts while available memory is below this value;
+- dirty contexts (closed page, unexpected URL) are discarded, used contexts are never reused.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+from urllib.parse import urljoin
+
+import pytest
+from playwright.sync_api import BrowserContext, Page
+
+from framework.browser import BrowserManager
+
+PREPARE_MODES = ("none", "login", "inventory")
+
+
+def available_memory_mb() -> Optional[float]:
+    """Available system memory, via psutil when installed, else /proc/meminfo; None if unknown."""
+    try:
+        import psutil  # type: ignore[import-not-found]
+
+        return psutil.virtual_memory().available / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+@dataclass
+class PooledContext:
+    context: BrowserContext
+    page: Page
+    created: float
+    prepared: str
+    username: Optional[str] = None
+    extras: Any = None
+
+
+# Set on the test item when its context came from the pool (read by the page/login fixtures).
+PREWARMED_KEY = pytest.StashKey[PooledContext]()
+
+
+@dataclass
+class PoolStats:
+    created: int = 0
+    hits: int = 0
+    misses: int = 0
+    evicted_idle: int = 0
+    discarded_dirty: int = 0
+    backoffs: int = 0
+
+    def merge(self, other: Dict[str, int]) -> None:
+        for key, value in other.items():
+            setattr(self, key, getattr(self, key) + value)
+
+
+class WarmContextPool:
+    def __init__(
+        self,
+        manager: BrowserManager,
+        browser_name: str,
+        channel: Optional[str],
+        base_url: str,
+        size: int = 2,
+        prepare: str = "login",
+        idle_ttl: float = 60.0,
+        min_free_mb: float = 512.0,
+        auth_state: Callable[[], Optional[Dict[str, Any]]] = lambda: None,
+        on_create: Callable[[BrowserContext], Any] = lambda ctx: None,
+        username: str = "standard_user",
+    ) -> None:
+        self.manager = manager
+        self.browser_name = browser_name
+        self.channel = channel
+        self.base_url = base_url
+        self.size = size
+        self.prepare = prepare
+        self.idle_ttl = idle_ttl
+        self.min_free_mb = min_free_mb
+        self.auth_state = auth_state
+        self.on_create = on_create
+        self.username = username
+        self.stats = PoolStats()
+        self._idle: Deque[PooledContext] = deque()
+
+    def serves(self, browser_name: str, channel: Optional[str]) -> bool:
+        return (browser_name, channel) == (self.browser_name, self.channel)
+
+    def _memory_ok(self) -> bool:
+        available = available_memory_mb()
+        return available is None or available >= self.min_free_mb
+
+    def _create(self) -> PooledContext:
+        ctx = self.manager.acquire(self.browser_name, self.channel)
+        extras = self.on_create(ctx)
+        page = ctx.new_page()
+        prepared, username = "none", None
+
+        if self.prepare == "inventory":
+            state = self.auth_state()
+            if state and state.get("cookies"):
+                ctx.add_cookies(state["cookies"])
+                page.goto(urljoin(self.base_url, "inventory.html"), wait_until="commit")
+                prepared, username = "inventory", self.username
+        if prepared == "none" and self.prepare in ("login", "inventory"):
+            page.goto(self.base_url, wait_until="commit")
+            prepared = "login"
+
+        self.stats.created += 1
+        return PooledContext(ctx, page, time.monotonic(), prepared, username, extras)
+
+    def _discard(self, pooled: PooledContext) -> None:
+        try:
+            self.manager.release(pooled.context)
+        except Exception:
+            pass
+
+    def _is_dirty(self, pooled: PooledContext) -> bool:
+        if pooled.page.is_closed():
+            return True
+        expected = "inventory.html" if pooled.prepared == "inventory" else None
+        return expected is not None and expected not in pooled.page.url
+
+    def evict_idle(self) -> None:
+        now = time.monotonic()
+        while self._idle and now - self._idle[0].created > self.idle_ttl:
+            self._discard(self._idle.popleft())
+            self.stats.evicted_idle += 1
+
+    def take(self) -> Optional[PooledContext]:
+        """Oldest healthy warm context, or None (the caller then creates one on demand)."""
+        self.evict_idle()
+        while self._idle:
+            pooled = self._idle.popleft()
+            if self._is_dirty(pooled):
+                self._discard(pooled)
+                self.stats.discarded_dirty += 1
+                continue
+            self.stats.hits += 1
+            return pooled
+        self.stats.misses += 1
+        return None
+
+    def replenish(self) -> None:
+        while len(self._idle) < self.size:
+            if not self._memory_ok():
+                self.stats.backoffs += 1
+                return
+            self._idle.append(self._create())
+
+    def idle_contexts(self) -> List[BrowserContext]:
+        return [pooled.context for pooled in self._idle]
+
+    def close(self) -> None:
+        while self._idle:
+            self._discard(self._idle.popleft())
+
+
+def worker_pool_size(requested: int) -> int:
+    """Cap the pool on small runners: at most one warm context per CPU core."""
+    return max(0, min(requested, os.cpu_count() or 1))
+
+
+WARM_POOL_KEY = pytest.StashKey[WarmContextPool]()
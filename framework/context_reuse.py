@@ -0,0 +1,210 @@
+"""Context reuse for read-only tests: one logged-in context per worker, reset between tests.
+
+Tests marked ``read_only`` only look at the inventory after logging in as standard_user. With
+--reuse-contexts they share one context per worker and browser target instead of getting a new
+context and a login each. Before every test but the first the shared page is reset:
+
+- ``storage`` (default) -> clear localStorage (the cart), then navigate to the inventory;
+- ``menu``              -> the app's own "Reset App State", then navigate to the inventory.
+
+The navigation closes the menu and restores the default sort. An isolation probe then checks
+that nothing leaked from the previous test: a single open page, on the inventory, still logged
+in as the same user, an empty cart in storage and on the badge, default sort, menu closed. A
+leak (or a failed reset) discards the shared context and the test gets a fresh one; so does a
+failing test, whose context is not trusted afterwards.
+
+The network policy and perf metrics are installed once per shared context; its request
+counters are not reported per test.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import pytest
+from playwright.sync_api import BrowserContext, Page
+
+from framework.browser import BrowserManager
+from pages.selectors import InventorySelectors, LoginSelectors
+
+if TYPE_CHECKING:
+    from pages import InventoryPage
+
+RESET_MODES = ("storage", "menu")
+DEFAULT_SORT = "Name (A to Z)"
+SESSION_COOKIE = "session-username"
+
+# Everything the isolation probe reads from the page, in one round trip.
+ISOLATION_PROBE_JS = """
+(s) => ({
+  url: window.location.href,
+  cart: window.localStorage.getItem(s.cartKey),
+  badge: document.querySelectorAll(s.badge).length,
+  sort: (document.querySelector(s.activeSort)?.innerText ?? '').trim(),
+  menuOpen: document.querySelector(s.menu)?.getAttribute('aria-hidden') === 'false',
+})
+"""
+
+_PROBE_SELECTORS = {
+    "cartKey": InventorySelectors.CART_STORAGE_KEY,
+    "badge": InventorySelectors.CART_BADGE,
+    "activeSort": InventorySelectors.ACTIVE_SORT,
+    "menu": InventorySelectors.MENU_PANEL,
+}
+
+
+@dataclass
+class SharedContext:
+    context: BrowserContext
+    page: Page
+    username: str
+    recorder: Any = None
+    uses: int = 0
+
+
+@dataclass
+class ReuseStats:
+    created: int = 0
+    reused: int = 0
+    discarded_failed: int = 0
+    # Leak reason -> how many shared contexts it discarded.
+    leaks: Dict[str, int] = field(default_factory=dict)
+    reset: List[float] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "discarded_failed": self.discarded_failed,
+            "leaks": self.leaks,
+            "reset": self.reset,
+        }
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        self.created += other["created"]
+        self.reused += other["reused"]
+        self.discarded_failed += other["discarded_failed"]
+        for reason, n in other["leaks"].items():
+            self.leaks[reason] = self.leaks.get(reason, 0) + n
+        self.reset.extend(other["reset"])
+
+
+def leaked_state(shared: SharedContext, probe: Dict[str, Any], cookies: List[Dict[str, Any]]) -> List[str]:
+    """Reasons the freshly reset shared context is not equivalent to a new one (empty when clean)."""
+    reasons = []
+    if len(shared.context.pages) != 1:
+        reasons.append("extra pages")
+    if InventorySelectors.PATH not in probe["url"]:
+        reasons.append("not on inventory")
+    session = next((c["value"] for c in cookies if c["name"] == SESSION_COOKIE), None)
+    if session is None:
+        reasons.append("logged out")
+    elif session != shared.username:
+        reasons.append("other user")
+    if probe["cart"] not in (None, "[]"):
+        reasons.append("cart in storage")
+    if probe["badge"]:
+        reasons.append("cart badge")
+    if probe["sort"] and probe["sort"] != DEFAULT_SORT:
+        reasons.append("sort order")
+    if probe["menuOpen"]:
+        reasons.append("menu open")
+    return reasons
+
+
+class ContextReuse:
+    """Per-worker shared contexts for ``read_only`` tests, keyed by browser target."""
+
+    def __init__(
+        self,
+        manager: BrowserManager,
+        base_url: str,
+        login: Callable[[Page, str], InventoryPage],
+        reset: str = "storage",
+        username: str = "standard_user",
+        on_create: Callable[[BrowserContext], Any] = lambda ctx: None,
+        on_discard: Callable[[SharedContext, str], None] = lambda shared, nodeid: None,
+    ) -> None:
+        self.manager = manager
+        self.base_url = base_url
+        self.login = login
+        self.reset = reset
+        self.username = username
+        self.on_create = on_create
+        self.on_discard = on_discard
+        self.stats = ReuseStats()
+        self._shared: Dict[Tuple[str, Optional[str]], SharedContext] = {}
+
+    def _create(self, browser_name: str, channel: Optional[str]) -> Tuple[SharedContext, InventoryPage]:
+        ctx = self.manager.acquire(browser_name, channel)
+        recorder = self.on_create(ctx)
+        page = ctx.new_page()
+        inventory = self.login(page, self.username)
+        self.stats.created += 1
+        shared = self._shared[(browser_name, channel)] = SharedContext(ctx, page, self.username, recorder)
+        return shared, inventory
+
+    def _reset(self, shared: SharedContext) -> Tuple[InventoryPage, List[str]]:
+        from pages import InventoryPage  # deferred: page objects load with the first login
+
+        page = shared.page
+        if page.is_closed():
+            return InventoryPage(page), ["page closed"]
+        try:
+            if self.reset == "menu":
+                InventoryPage(page).click_menu_item("Reset App State")
+            else:
+                page.evaluate("() => window.localStorage.clear()")
+            page.goto(urljoin(self.base_url, InventorySelectors.PATH))
+            # Resolves on either page: an expired session shows up as a leak, not as a timeout.
+            page.wait_for_selector(f"{InventorySelectors.ITEM}, {LoginSelectors.LOGIN_BTN}")
+            probe = page.evaluate(ISOLATION_PROBE_JS, _PROBE_SELECTORS)
+        except Exception as exc:  # page crashed, menu missing (logged out), navigation failed
+            return InventoryPage(page), [f"reset failed: {type(exc).__name__}"]
+        return InventoryPage(page), leaked_state(shared, probe, shared.context.cookies(self.base_url))
+
+    def checkout(self, browser_name: str, channel: Optional[str]) -> Tuple[SharedContext, InventoryPage]:
+        """The target's shared context, reset and checked, or a new logged-in one."""
+        shared = self._shared.get((browser_name, channel))
+        if shared is not None:
+            started = time.perf_counter()
+            inventory, leaks = self._reset(shared)
+            self.stats.reset.append(time.perf_counter() - started)
+            if not leaks:
+                self.stats.reused += 1
+                shared.uses += 1
+                return shared, inventory
+            for reason in leaks:
+                self.stats.leaks[reason] = self.stats.leaks.get(reason, 0) + 1
+            self.discard(browser_name, channel, "")
+        shared, inventory = self._create(browser_name, channel)
+        shared.uses += 1
+        return shared, inventory
+
+    def discard(self, browser_name: str, channel: Optional[str], nodeid: str) -> None:
+        """Close the target's shared context; the next ``read_only`` test gets a fresh one."""
+        shared = self._shared.pop((browser_name, channel), None)
+        if shared is None:
+            return
+        self.on_discard(shared, nodeid)
+        try:
+            self.manager.release(shared.context)
+        except Exception:
+            pass
+
+    def failed(self, browser_name: str, channel: Optional[str], nodeid: str) -> None:
+        self.stats.discarded_failed += 1
+        self.discard(browser_name, channel, nodeid)
+
+    def contexts(self) -> List[BrowserContext]:
+        return [shared.context for shared in self._shared.values()]
+
+    def close(self) -> None:
+        for browser_name, channel in list(self._shared):
+            self.discard(browser_name, channel, "")
+
+
+CONTEXT_REUSE_KEY = pytest.StashKey[ContextReuse]()
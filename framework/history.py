@@ -0,0 +1,181 @@
+"""Per-test run history persisted in pytest's cache directory (``.pytest_cache``).
+
+Each test keeps a record per browser: smoothed duration, run/failure counts, the last outcome,
+its markers and the source fingerprint of its last green run. Durations are smoothed with an
+exponential moving average so a single slow run does not reshuffle the schedule.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import statistics
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pytest
+
+HISTORY_CACHE_KEY = "saucedemo/history"
+SMOOTHING = 0.5
+
+# Value model for --time-budget: higher value per estimated second is selected first.
+MARKER_VALUE = {"smoke": 2.0, "regression": 1.0, "known_bug": -0.75}
+NEW_TEST_VALUE = 2.0
+RECENT_FAILURE_VALUE = 4.0
+FAILURE_RATE_VALUE = 2.0
+
+# Sources every test depends on (page objects, fixtures, framework, test data), relative to the rootdir.
+SHARED_SOURCES = ("pages/**/*.py", "conftest.py", "framework/**/*.py", "data/*.json")
+
+
+@dataclass
+class TestRecord:
+    duration: Optional[float] = None
+    runs: int = 0
+    failures: int = 0
+    last_outcome: Optional[str] = None
+    green_fingerprint: Optional[str] = None
+    markers: List[str] = field(default_factory=list)
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+
+class RunHistory:
+    def __init__(self, data: Optional[Dict[str, Any]] = None, browser: str = "chromium") -> None:
+        data = data or {}
+        self.browser = browser
+        self.records: Dict[str, TestRecord] = {
+            key: TestRecord(**record) for key, record in data.get("tests", {}).items()
+        }
+        # Older caches only stored durations keyed by nodeid.
+        for nodeid, seconds in data.get("durations", {}).items():
+            self.records.setdefault(self.key(nodeid), TestRecord(duration=seconds))
+
+    @classmethod
+    def load(cls, config: pytest.Config, browser: str = "chromium") -> "RunHistory":
+        cache = getattr(config, "cache", None)  # None with -p no:cacheprovider
+        return cls(cache.get(HISTORY_CACHE_KEY, None) if cache else None, browser)
+
+    def save(self, config: pytest.Config) -> None:
+        cache = getattr(config, "cache", None)
+        if cache:
+            cache.set(HISTORY_CACHE_KEY, {"tests": {k: asdict(r) for k, r in sorted(self.records.items())}})
+
+    def key(self, nodeid: str) -> str:
+        return f"{self.browser}|{nodeid}"
+
+    def record(self, nodeid: str) -> Optional[TestRecord]:
+        return self.records.get(self.key(nodeid))
+
+    def duration(self, nodeid: str) -> Optional[float]:
+        record = self.record(nodeid)
+        return record.duration if record else None
+
+    def record_duration(self, nodeid: str, seconds: float) -> None:
+        record = self.records.setdefault(self.key(nodeid), TestRecord())
+        if record.duration is None:
+            record.duration = seconds
+        else:
+            record.duration = SMOOTHING * seconds + (1 - SMOOTHING) * record.duration
+
+    def record_outcome(
+        self, nodeid: str, outcome: str, fingerprint: Optional[str] = None, markers: Iterable[str] = ()
+    ) -> None:
+        """Count a finished run; a passing run remembers the sources it passed against."""
+        record = self.records.setdefault(self.key(nodeid), TestRecord())
+        record.runs += 1
+        record.last_outcome = outcome
+        record.markers = sorted(markers)
+        if outcome == "failed":
+            record.failures += 1
+            record.green_fingerprint = None
+        elif outcome == "passed":
+            record.green_fingerprint = fingerprint
+
+    def estimate(self, nodeids: Iterable[str]) -> Dict[str, float]:
+        """Known durations, with the median standing in for tests that never ran."""
+        nodeids = list(nodeids)
+        known = {n: self.duration(n) for n in nodeids}
+        measured = [d for d in known.values() if d is not None]
+        default = statistics.median(measured) if measured else 1.0
+        return {n: default if d is None else d for n, d in known.items()}
+
+    def longest_first(self, items: List[pytest.Item]) -> List[pytest.Item]:
+        """Longest-processing-time-first order; ties keep collection order (deterministic across workers)."""
+        estimates = self.estimate(item.nodeid for item in items)
+        return sorted(items, key=lambda item: -estimates[item.nodeid])
+
+    def fail_first(self, items: List[pytest.Item]) -> List[pytest.Item]:
+        """Tests that failed last time first, each group longest-first."""
+        estimates = self.estimate(item.nodeid for item in items)
+
+        def rank(item: pytest.Item) -> Tuple[bool, float]:
+            record = self.record(item.nodeid)
+            return (not (record and record.last_outcome == "failed"), -estimates[item.nodeid])
+
+        return sorted(items, key=rank)
+
+    def value(self, nodeid: str, markers: Iterable[str]) -> float:
+        score = 1.0 + sum(MARKER_VALUE.get(m, 0.0) for m in markers)
+        record = self.record(nodeid)
+        if record is None or not record.runs:
+            return score + NEW_TEST_VALUE
+        if record.last_outcome == "failed":
+            score += RECENT_FAILURE_VALUE
+        return score + FAILURE_RATE_VALUE * record.failure_rate
+
+    def within_budget(
+        self, items: Sequence[pytest.Item], budget_s: float
+    ) -> Tuple[List[pytest.Item], List[pytest.Item]]:
+        """Greedy knapsack: highest value per estimated second until the budget is spent.
+
+        Returns ``(selected, dropped)``, both in the original order.
+        """
+        estimates = self.estimate(item.nodeid for item in items)
+        density = {
+            item.nodeid: self.value(item.nodeid, {m.name for m in item.iter_markers()})
+            / max(estimates[item.nodeid], 0.01)
+            for item in items
+        }
+        chosen = set()
+        spent = 0.0
+        for item in sorted(items, key=lambda i: -density[i.nodeid]):
+            cost = estimates[item.nodeid]
+            if spent + cost <= budget_s:
+                chosen.add(item.nodeid)
+                spent += cost
+        return [i for i in items if i.nodeid in chosen], [i for i in items if i.nodeid not in chosen]
+
+
+class SourceFingerprints:
+    """Digest of a test file plus the shared page objects, fixtures and data it runs against."""
+
+    def __init__(self, rootpath: Path, shared: Sequence[str] = SHARED_SOURCES) -> None:
+        self.rootpath = rootpath
+        self.shared = shared
+        self._shared_digest: Optional[str] = None
+        self._by_file: Dict[str, str] = {}
+
+    def _digest(self, paths: Iterable[Path]) -> str:
+        h = hashlib.sha1()
+        for path in paths:
+            h.update(path.relative_to(self.rootpath).as_posix().encode())
+            h.update(path.read_bytes())
+        return h.hexdigest()
+
+    def shared_digest(self) -> str:
+        if self._shared_digest is None:
+            paths = sorted({p for pattern in self.shared for p in self.rootpath.glob(pattern) if p.is_file()})
+            self._shared_digest = self._digest(paths)
+        return self._shared_digest
+
+    def for_nodeid(self, nodeid: str) -> Optional[str]:
+        test_file = nodeid.split("::", 1)[0]
+        if test_file not in self._by_file:
+            path = self.rootpath / test_file
+            if not path.is_file():
+                return None
+            self._by_file[test_file] = self._digest([path]) + self.shared_digest()
+        return self._by_file[test_file]
@@ -0,0 +1,228 @@
+"""Per-step timing for page-object actions.
+
+When enabled, every public method of the page objects in ``pages/`` is wrapped so each call
+becomes a *step* (``InventoryPage.add_all_items``) with its wall time. Playwright ``Page`` /
+``Locator`` methods are wrapped as well to count driver round trips, and ``expect(...)``
+assertions plus ``wait_for_*`` calls are counted as waits, attributed to every step on the
+stack (so counts are inclusive of nested steps).
+
+All patches are undone by :meth:`Instrumentation.uninstall`.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pytest
+
+# Driver methods that never leave the Python process (locator builders, listeners...).
+LOCAL_DRIVER_METHODS = {
+    "and_",
+    "describe",
+    "filter",
+    "frame",
+    "frame_locator",
+    "get_by_alt_text",
+    "get_by_label",
+    "get_by_placeholder",
+    "get_by_ref",
+    "get_by_role",
+    "get_by_test_id",
+    "get_by_text",
+    "get_by_title",
+    "is_closed",
+    "locator",
+    "nth",
+    "on",
+    "once",
+    "opener",
+    "or_",
+    "remove_listener",
+    "set_default_navigation_timeout",
+    "set_default_timeout",
+}
+
+
+@dataclass
+class _Frame:
+    action: str
+    started: float
+    round_trips: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+
+
+class StepRecorder:
+    """Collects one sample per step call, tagged with the running test's nodeid."""
+
+    def __init__(self) -> None:
+        self.samples: List[Dict[str, Any]] = []
+        self.current_test: Optional[str] = None
+        self._stack: List[_Frame] = []
+        self._in_driver = False
+
+    @property
+    def active(self) -> bool:
+        return bool(self._stack)
+
+    @contextmanager
+    def step(self, action: str) -> Iterator[None]:
+        frame = _Frame(action, time.perf_counter())
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self.samples.append(
+                {
+                    "test": self.current_test,
+                    "action": action,
+                    "seconds": time.perf_counter() - frame.started,
+                    "round_trips": frame.round_trips,
+                    "waits": frame.waits,
+                    "wait_seconds": frame.wait_seconds,
+                    "depth": len(self._stack),
+                }
+            )
+
+    def record(self, action: str, seconds: float) -> None:
+        """Record a step measured elsewhere (e.g. fixture setup/teardown)."""
+        self.samples.append(
+            {
+                "test": self.current_test,
+                "action": action,
+                "seconds": seconds,
+                "round_trips": 0,
+                "waits": 0,
+                "wait_seconds": 0.0,
+                "depth": len(self._stack),
+            }
+        )
+
+    def driver_call(self, fn: Callable, args: Tuple, kwargs: Dict, is_wait: bool) -> Any:
+        # Nested public calls (e.g. an assertion polling a locator) count once.
+        if not self._stack or self._in_driver:
+            return fn(*args, **kwargs)
+        self._in_driver = True
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._in_driver = False
+            for frame in self._stack:
+                frame.round_trips += 1
+                if is_wait:
+                    frame.waits += 1
+                    frame.wait_seconds += elapsed
+
+    def samples_for(self, nodeid: str) -> List[Dict[str, Any]]:
+        return [s for s in self.samples if s["test"] == nodeid]
+
+
+def summarize_samples(samples: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Per-action p50/p95 wall time, mean round trips and wait share, slowest total first."""
+    from framework.stats import describe
+
+    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for sample in samples:
+        grouped[sample["action"]].append(sample)
+
+    rows = []
+    for action, group in grouped.items():
+        seconds = [s["seconds"] for s in group]
+        stats = describe(seconds)
+        total = stats["total"]
+        rows.append(
+            {
+                "action": action,
+                "calls": len(group),
+                "tests": len({s["test"] for s in group}),
+                "p50_ms": stats["p50"] * 1000,
+                "p95_ms": stats["p95"] * 1000,
+                "total_s": total,
+                "round_trips": sum(s["round_trips"] for s in group) / len(group),
+                "wait_share": (sum(s["wait_seconds"] for s in group) / total) if total else 0.0,
+            }
+        )
+    return sorted(rows, key=lambda r: -r["total_s"])
+
+
+class Instrumentation:
+    """Installs/uninstalls the wrappers around page objects and the Playwright driver."""
+
+    def __init__(self, recorder: StepRecorder) -> None:
+        self.recorder = recorder
+        self._patched: List[Tuple[type, str, Any]] = []
+
+    def _patch(self, cls: type, name: str, replacement: Any) -> None:
+        self._patched.append((cls, name, cls.__dict__[name]))
+        setattr(cls, name, replacement)
+
+    def install_pages(self, classes: Iterable[type]) -> None:
+        """Wrap public methods; each defining class is patched once, steps are named after ``type(self)``."""
+        seen = set()
+        for cls in classes:
+            for owner in cls.__mro__:
+                if owner is object or owner in seen:
+                    continue
+                seen.add(owner)
+                for name, raw in list(vars(owner).items()):
+                    if name.startswith("_") or not inspect.isfunction(raw):
+                        continue
+                    self._patch(owner, name, self._step_wrapper(raw, name))
+
+    def _step_wrapper(self, fn: Callable, name: str) -> Callable:
+        recorder = self.recorder
+
+        @functools.wraps(fn)
+        def wrapper(self_: Any, *args: Any, **kwargs: Any) -> Any:
+            with recorder.step(f"{type(self_).__name__}.{name}"):
+                return fn(self_, *args, **kwargs)
+
+        return wrapper
+
+    def install_driver(self) -> None:
+        from playwright.sync_api import Locator, LocatorAssertions, Page, PageAssertions
+
+        for cls in (Page, Locator):
+            for name, raw in list(vars(cls).items()):
+                if name.startswith(("_", "expect_")) or name in LOCAL_DRIVER_METHODS or not inspect.isfunction(raw):
+                    continue
+                self._patch(cls, name, self._driver_wrapper(raw, is_wait=name.startswith("wait_for")))
+
+        for cls in (PageAssertions, LocatorAssertions):
+            for name, raw in list(vars(cls).items()):
+                if name.startswith(("to_", "not_to_")) and inspect.isfunction(raw):
+                    self._patch(cls, name, self._driver_wrapper(raw, is_wait=True))
+
+    def _driver_wrapper(self, fn: Callable, is_wait: bool) -> Callable:
+        recorder = self.recorder
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return recorder.driver_call(fn, args, kwargs, is_wait)
+
+        return wrapper
+
+    def uninstall(self) -> None:
+        while self._patched:
+            cls, name, original = self._patched.pop()
+            setattr(cls, name, original)
+
+
+def page_object_classes() -> List[type]:
+    import pages
+    from pages.base import BasePage
+
+    exported = (getattr(pages, name) for name in pages.__all__)
+    return [obj for obj in exported if isinstance(obj, type) and issubclass(obj, BasePage)]
+
+
+STEP_RECORDER_KEY = pytest.StashKey[StepRecorder]()
@@ -0,0 +1,6 @@
+"""Load generation with the async page objects (``python -m framework.load --help``)."""
+
+from .journeys import JOURNEYS
+from .runner import RAMP_PROFILES, JourneyStats, LoadPlan, format_report, run, start_offsets
+
+__all__ = ["JOURNEYS", "RAMP_PROFILES", "JourneyStats", "LoadPlan", "format_report", "run", "start_offsets"]
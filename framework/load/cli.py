@@ -0,0 +1,98 @@
+"""``python -m framework.load``: drive N virtual users through the page-object journeys."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from framework.matrix import BROWSERS
+from framework.load.journeys import JOURNEYS
+from framework.load.runner import RAMP_PROFILES, LoadPlan, format_report, parse_mix, parse_think, report_dict, run
+from framework.users import load_users
+
+DEFAULT_REPORT = "test-results/load.json"
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m framework.load",
+        description="Run the page-object journeys as concurrent virtual users against SauceDemo.",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--base-url", default=None, help="Target to load (default BASE_URL); required unless --standin."
+    )
+    target.add_argument("--standin", action="store_true", help="Start the local stand-in and load it instead.")
+    parser.add_argument("--users", type=int, default=10, help="Virtual users (default 10).")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes, one browser each (default 1).")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds until all VUs run (default 10).")
+    parser.add_argument("--profile", choices=RAMP_PROFILES, default="linear", help="Ramp-up shape (default linear).")
+    parser.add_argument("--steps", type=int, default=4, help="Number of steps for --profile step (default 4).")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to hold after the ramp (default 60).")
+    parser.add_argument("--iterations", type=int, default=None, help="Stop each VU after this many journeys.")
+    parser.add_argument("--think", default="1-3", help="Think time between steps in seconds, MIN-MAX or FIXED.")
+    parser.add_argument(
+        "--mix",
+        default="browse:3,add_to_cart:2,checkout:1",
+        help=f"Weighted journeys, NAME[:WEIGHT],... from: {', '.join(JOURNEYS)}.",
+    )
+    parser.add_argument("--user", default="standard_user", help="Account every VU logs in with.")
+    parser.add_argument("--browser", choices=BROWSERS, default="chromium")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--report", default=DEFAULT_REPORT, help=f"JSON report path (default {DEFAULT_REPORT}).")
+    parser.add_argument("--standin-latency-ms", type=int, default=0, help="Latency injected by --standin.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+        think_min, think_max = parse_think(args.think)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    base_url = args.base_url or os.getenv("BASE_URL")
+    if not args.standin and not base_url:
+        # Never fall back to the public site: it is not ours to load.
+        parser.error("pass --base-url (or BASE_URL) for a staging environment, or --standin")
+
+    server = None
+    if args.standin:
+        from framework.standin import StandinServer
+
+        server = StandinServer(latency_ms=args.standin_latency_ms).start()
+    base_url = server.url if server else base_url
+
+    plan = LoadPlan(
+        base_url=base_url,
+        users=args.users,
+        processes=args.processes,
+        ramp_up_s=args.ramp_up,
+        duration_s=args.duration,
+        profile=args.profile,
+        steps=args.steps,
+        think_min_s=think_min,
+        think_max_s=think_max,
+        mix=mix,
+        username=args.user,
+        password=load_users()["password"],
+        browser=args.browser,
+        headless=not args.headed,
+        iterations=args.iterations,
+    )
+    try:
+        stats = run(plan)
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(format_report(plan, stats))
+    path = Path(args.report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report_dict(plan, stats), indent=2), encoding="utf-8")
+    print(f"-> {path}")
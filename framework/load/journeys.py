@@ -0,0 +1,89 @@
+"""User journeys for load generation, written against the async page objects.
+
+Each journey opens the login page in a fresh context and walks a path through the app, calling
+``think()`` between page transitions like a real user would. A journey raises on any functional
+failure (the page objects' own ``expect`` checks), which the runner counts as an error.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Awaitable, Callable, Dict
+
+from playwright.async_api import BrowserContext
+
+from pages.async_api import CartPage, CheckoutCompletePage, CheckoutOverviewPage, CheckoutStepOnePage
+from pages.async_api import InventoryPage, LoginPage
+
+Think = Callable[[], Awaitable[None]]
+Journey = Callable[[BrowserContext, str, str, str, Think], Awaitable[None]]
+
+SORTS = ("Name (A to Z)", "Name (Z to A)", "Price (low to high)", "Price (high to low)")
+
+
+async def _login(ctx: BrowserContext, base_url: str, username: str, password: str, think: Think) -> InventoryPage:
+    lp = LoginPage(await ctx.new_page(), base_url)
+    await lp.open()
+    await think()
+    await lp.login(username, password)
+    inv = InventoryPage(lp.page)
+    await inv.is_at()
+    return inv
+
+
+async def login(ctx: BrowserContext, base_url: str, username: str, password: str, think: Think) -> None:
+    await _login(ctx, base_url, username, password, think)
+
+
+async def browse(ctx: BrowserContext, base_url: str, username: str, password: str, think: Think) -> None:
+    inv = await _login(ctx, base_url, username, password, think)
+    await think()
+    snapshot = await inv.snapshot()
+    assert len(snapshot), "empty inventory"
+
+
+async def sort(ctx: BrowserContext, base_url: str, username: str, password: str, think: Think) -> None:
+    inv = await _login(ctx, base_url, username, password, think)
+    await think()
+    await inv.select_sort(random.choice(SORTS))
+
+
+async def add_to_cart(ctx: BrowserContext, base_url: str, username: str, password: str, think: Think) -> None:
+    inv = await _login(ctx, base_url, username, password, think)
+    await think()
+    names = (await inv.snapshot()).names
+    await inv.add_items(random.sample(names, k=min(2, len(names))))
+    await think()
+    await inv.open_cart()
+    cart = CartPage(inv.page)
+    await cart.wait_for_ready()
+
+
+async def checkout(ctx: BrowserContext, base_url: str, username: str, password: str, think: Think) -> None:
+    inv = await _login(ctx, base_url, username, password, think)
+    await think()
+    names = (await inv.snapshot()).names
+    await inv.add_items([random.choice(names)])
+    await inv.open_cart()
+    cart = CartPage(inv.page)
+    await cart.wait_for_ready()
+    await think()
+    await cart.start_checkout()
+    step_one = CheckoutStepOnePage(inv.page)
+    await step_one.is_at()
+    await step_one.fill("Load", "Test", "12345")
+    await think()
+    await step_one.continue_checkout()
+    overview = CheckoutOverviewPage(inv.page)
+    await overview.is_at()
+    await overview.finish()
+    await CheckoutCompletePage(inv.page).is_at()
+
+
+JOURNEYS: Dict[str, Journey] = {
+    "login": login,
+    "browse": browse,
+    "sort": sort,
+    "add_to_cart": add_to_cart,
+    "checkout": checkout,
+}
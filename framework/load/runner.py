@@ -0,0 +1,228 @@
+"""Load plan, ramp-up profiles, the per-process virtual-user loop and the merged report.
+
+Virtual users (VUs) are spread round-robin over ``processes`` worker processes. Each process
+launches one browser, and each VU iteration runs one journey in its own context of that browser.
+VU start times follow the ramp profile on a wall clock shared by all processes. After the ramp,
+the load holds for ``duration_s``; an iteration in flight at the deadline finishes, but no new one
+starts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from framework.browser import launch_options, resolve_viewport
+from framework.load.journeys import JOURNEYS
+from framework.stats import percentile
+
+RAMP_PROFILES = ("linear", "step", "spike")
+BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000)
+STARTUP_GRACE_S = 3.0  # lets every process launch its browser before the first VU starts
+
+
+@dataclass(frozen=True)
+class LoadPlan:
+    base_url: str
+    users: int = 10
+    processes: int = 1
+    ramp_up_s: float = 10.0
+    duration_s: float = 60.0
+    profile: str = "linear"
+    steps: int = 4
+    think_min_s: float = 1.0
+    think_max_s: float = 3.0
+    mix: Tuple[Tuple[str, float], ...] = (("browse", 3.0), ("add_to_cart", 2.0), ("checkout", 1.0))
+    username: str = "standard_user"
+    password: str = "secret_sauce"
+    browser: str = "chromium"
+    headless: bool = True
+    iterations: Optional[int] = None  # per VU; None = until the deadline
+
+
+def start_offsets(profile: str, users: int, ramp_up_s: float, steps: int = 4) -> List[float]:
+    """Seconds after the start at which each VU begins."""
+    if profile == "spike" or users <= 1 or ramp_up_s <= 0:
+        return [0.0] * users
+    if profile == "linear":
+        return [ramp_up_s * i / users for i in range(users)]
+    if profile == "step":
+        steps = max(1, min(steps, users))
+        return [ramp_up_s * (i * steps // users) / steps for i in range(users)]
+    raise ValueError(f"Unknown ramp profile {profile!r} (expected {', '.join(RAMP_PROFILES)})")
+
+
+def parse_mix(spec: str) -> Tuple[Tuple[str, float], ...]:
+    """``"browse:3,checkout:1"`` -> journey weights; a bare name weighs 1."""
+    mix = []
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        name, _, weight = part.partition(":")
+        if name not in JOURNEYS:
+            raise ValueError(f"Unknown journey {name!r} (expected {', '.join(JOURNEYS)})")
+        mix.append((name, float(weight or 1)))
+    if not mix:
+        raise ValueError("Empty journey mix")
+    return tuple(mix)
+
+
+def parse_think(spec: str) -> Tuple[float, float]:
+    """``"1-3"`` -> uniform 1..3 s between steps; ``"2"`` -> always 2 s."""
+    low, _, high = spec.partition("-")
+    return float(low), float(high or low)
+
+
+@dataclass
+class JourneyStats:
+    latencies: List[float] = field(default_factory=list)  # seconds, think time excluded, successful runs
+    errors: Dict[str, int] = field(default_factory=dict)
+    first_start: float = 0.0
+    last_end: float = 0.0
+
+    def record(self, started: float, ended: float, latency: float, error: Optional[str]) -> None:
+        self.first_start = min(self.first_start or started, started)
+        self.last_end = max(self.last_end, ended)
+        if error is None:
+            self.latencies.append(latency)
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def merge(self, other: "JourneyStats") -> None:
+        self.latencies.extend(other.latencies)
+        for error, count in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+        if other.first_start:
+            self.first_start = min(self.first_start or other.first_start, other.first_start)
+        self.last_end = max(self.last_end, other.last_end)
+
+    @property
+    def throughput(self) -> float:
+        """Successful journeys per second over the window this journey was running."""
+        window = self.last_end - self.first_start
+        return len(self.latencies) / window if window > 0 else 0.0
+
+    def histogram(self) -> List[Tuple[str, int]]:
+        edges = [*BUCKETS_MS, None]
+        counts = [0] * len(edges)
+        for latency in self.latencies:
+            ms = latency * 1000
+            counts[next(i for i, edge in enumerate(edges) if edge is None or ms <= edge)] += 1
+        labels = [f"<={edge}ms" for edge in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return list(zip(labels, counts))
+
+
+def _error_key(exc: BaseException) -> str:
+    first_line = (str(exc).strip().splitlines() or [""])[0]
+    return f"{type(exc).__name__}: {first_line[:100]}"
+
+
+async def _virtual_user(
+    browser: Any, plan: LoadPlan, start_at: float, deadline: float, stats: Dict[str, JourneyStats]
+) -> None:
+    await asyncio.sleep(max(0.0, start_at - time.time()))
+    names = [name for name, _ in plan.mix]
+    weights = [weight for _, weight in plan.mix]
+    done = 0
+    while time.time() < deadline and (plan.iterations is None or done < plan.iterations):
+        name = random.choices(names, weights)[0]
+        thought = 0.0
+
+        async def think() -> None:
+            nonlocal thought
+            pause = random.uniform(plan.think_min_s, plan.think_max_s)
+            thought += pause
+            await asyncio.sleep(pause)
+
+        ctx = await browser.new_context(viewport=resolve_viewport())
+        started = time.time()
+        error = None
+        try:
+            await JOURNEYS[name](ctx, plan.base_url, plan.username, plan.password, think)
+        except Exception as exc:  # a failed journey is a data point, not a crash
+            error = _error_key(exc)
+        finally:
+            ended = time.time()
+            await ctx.close()
+        stats.setdefault(name, JourneyStats()).record(started, ended, ended - started - thought, error)
+        done += 1
+
+
+async def _run_users(plan: LoadPlan, offsets: List[float], t0: float) -> Dict[str, JourneyStats]:
+    from playwright.async_api import async_playwright
+
+    stats: Dict[str, JourneyStats] = {}
+    deadline = t0 + plan.ramp_up_s + plan.duration_s
+    async with async_playwright() as p:
+        browser = await getattr(p, plan.browser).launch(**launch_options(plan.browser, None, plan.headless))
+        try:
+            await asyncio.gather(*(_virtual_user(browser, plan, t0 + offset, deadline, stats) for offset in offsets))
+        finally:
+            await browser.close()
+    return stats
+
+
+def run_process(plan: LoadPlan, offsets: List[float], t0: float) -> Dict[str, Dict[str, Any]]:
+    """Entry point of one worker process; returns plain dicts (picklable)."""
+    stats = asyncio.run(_run_users(plan, offsets, t0))
+    return {name: asdict(s) for name, s in stats.items()}
+
+
+def run(plan: LoadPlan) -> Dict[str, JourneyStats]:
+    offsets = start_offsets(plan.profile, plan.users, plan.ramp_up_s, plan.steps)
+    processes = max(1, min(plan.processes, plan.users))
+    per_process = [offsets[i::processes] for i in range(processes)]
+    t0 = time.time() + STARTUP_GRACE_S
+    if processes == 1:
+        results = [run_process(plan, per_process[0], t0)]
+    else:
+        # spawn: the parent may be running the stand-in server thread, which must not be forked.
+        with ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(run_process, [plan] * processes, per_process, [t0] * processes))
+
+    merged: Dict[str, JourneyStats] = {}
+    for result in results:
+        for name, data in result.items():
+            merged.setdefault(name, JourneyStats()).merge(JourneyStats(**data))
+    return merged
+
+
+def format_report(plan: LoadPlan, stats: Dict[str, JourneyStats]) -> str:
+    lines = [
+        f"{plan.users} VUs in {plan.processes} processes, {plan.profile} ramp-up {plan.ramp_up_s:g} s, "
+        f"hold {plan.duration_s:g} s, think {plan.think_min_s:g}-{plan.think_max_s:g} s -> {plan.base_url}",
+        f"{'journey':<12} {'ok':>6} {'errors':>6} {'per s':>7} {'p50':>7} {'p90':>7} {'p95':>7} {'p99':>7} {'max':>7}",
+    ]
+    for name, s in sorted(stats.items()):
+        ms = [latency * 1000 for latency in s.latencies]
+        cells = " ".join(f"{percentile(ms, q):7.0f}" for q in (50, 90, 95, 99))
+        lines.append(
+            f"{name:<12} {len(ms):>6} {sum(s.errors.values()):>6} {s.throughput:7.2f} {cells} {max(ms, default=0):7.0f}"
+        )
+    for name, s in sorted(stats.items()):
+        total = len(s.latencies) or 1
+        lines.append(f"{name} latency histogram:")
+        lines.extend(f"  {label:>9} {count:>6} {'#' * round(40 * count / total)}" for label, count in s.histogram())
+        lines.extend(f"  error x{count}: {error}" for error, count in sorted(s.errors.items(), key=lambda e: -e[1]))
+    return "\n".join(lines)
+
+
+def report_dict(plan: LoadPlan, stats: Dict[str, JourneyStats]) -> Dict[str, Any]:
+    return {
+        "plan": asdict(plan),
+        "journeys": {
+            name: {
+                "ok": len(s.latencies),
+                "errors": s.errors,
+                "throughput_per_s": s.throughput,
+                "latency_ms": {f"p{q}": percentile(s.latencies, q) * 1000 for q in (50, 90, 95, 99)},
+                "histogram": dict(s.histogram()),
+            }
+            for name, s in stats.items()
+        },
+    }
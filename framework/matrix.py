@@ -0,0 +1,82 @@
+"""Cross-browser matrix: browser targets and the per-test result grid.
+
+A target is a browser engine plus an optional channel. Specs are comma-separated, e.g.
+``chromium,firefox,webkit,chromium:msedge``; bare channel names (``chrome``, ``msedge``)
+are shorthands for Chromium channels.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+
+BROWSERS = ("chromium", "firefox", "webkit")
+CHROMIUM_CHANNELS = ("chrome", "chrome-beta", "msedge", "msedge-beta", "msedge-dev")
+# Worst outcome over setup/call/teardown wins.
+_OUTCOME_RANK = {"passed": 0, "skipped": 1, "failed": 2}
+
+
+@dataclass(frozen=True)
+class BrowserTarget:
+    name: str
+    channel: Optional[str] = None
+
+    @property
+    def id(self) -> str:
+        return f"{self.name}-{self.channel}" if self.channel else self.name
+
+
+def parse_matrix(spec: str) -> List[BrowserTarget]:
+    targets: List[BrowserTarget] = []
+    for raw in (part.strip().lower() for part in spec.split(",")):
+        if not raw:
+            continue
+        name, _, channel = raw.partition(":")
+        if name in CHROMIUM_CHANNELS and not channel:
+            name, channel = "chromium", name
+        if name not in BROWSERS:
+            raise pytest.UsageError(f"Unknown browser in matrix: {raw!r} (expected one of {', '.join(BROWSERS)})")
+        if channel and name != "chromium":
+            raise pytest.UsageError(f"Browser channels only apply to chromium: {raw!r}")
+        target = BrowserTarget(name, channel or None)
+        if target not in targets:
+            targets.append(target)
+    if not targets:
+        raise pytest.UsageError(f"Empty browser matrix: {spec!r}")
+    return targets
+
+
+def row_name(nodeid: str, target_id: str) -> str:
+    """``test_x[firefox]`` -> ``test_x``; ``test_y[user-firefox]`` -> ``test_y[user]``."""
+    base, bracket, params = nodeid.partition("[")
+    if not bracket:
+        return nodeid
+    parts = params.rstrip("]").split("-")
+    target_parts = target_id.split("-")
+    for i in range(len(parts) - len(target_parts) + 1):
+        if parts[i : i + len(target_parts)] == target_parts:
+            del parts[i : i + len(target_parts)]
+            break
+    return f"{base}[{'-'.join(parts)}]" if parts else base
+
+
+@dataclass
+class MatrixResults:
+    targets: List[str] = field(default_factory=list)
+    # row -> target id -> outcome
+    cells: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+
+    def record(self, nodeid: str, target_id: str, outcome: str, seconds: float) -> None:
+        row = self.cells.setdefault(row_name(nodeid, target_id), {})
+        if _OUTCOME_RANK[outcome] >= _OUTCOME_RANK.get(row.get(target_id, "passed"), 0):
+            row[target_id] = outcome
+        self.durations[target_id] = self.durations.get(target_id, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"targets": self.targets, "durations": self.durations, "results": self.cells}
+
+
+MATRIX_RESULTS_KEY = pytest.StashKey[MatrixResults]()
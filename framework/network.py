@@ -0,0 +1,188 @@
+"""Request routing layer installed on every test context.
+
+Policies (combine with commas, e.g. ``block-external,stub-images,cache-static``):
+
+- ``block-external`` -> abort sub-resource requests to hosts other than the AUT (analytics,
+                        fonts, CDNs). Navigations are never blocked.
+- ``stub-images``    -> answer image requests with a 1x1 transparent PNG.
+- ``cache-static``   -> serve scripts, stylesheets and fonts from a per-worker cache after the
+                        first download (optionally mirrored on disk to survive across runs).
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+from playwright.sync_api import BrowserContext, Route
+
+POLICIES = ("block-external", "stub-images", "cache-static")
+CACHEABLE_TYPES = {"script", "stylesheet", "font"}
+
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+def parse_policies(value: Optional[str]) -> frozenset:
+    """``"off"``/empty -> no policies; otherwise a comma separated subset of POLICIES."""
+    if not value or value.strip().lower() in {"off", "none"}:
+        return frozenset()
+    policies = frozenset(p.strip().lower() for p in value.split(",") if p.strip())
+    unknown = policies - set(POLICIES)
+    if unknown:
+        raise pytest.UsageError(f"Unknown network policies: {', '.join(sorted(unknown))} (expected {', '.join(POLICIES)})")
+    return policies
+
+
+@dataclass
+class RouteCounters:
+    blocked: int = 0
+    stubbed: int = 0
+    cached: int = 0
+    fetched: int = 0
+    passed: int = 0
+    bytes_saved: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class NetworkStats:
+    """Per-test counters of the session, reported in the terminal summary."""
+
+    per_test: List[Tuple[str, RouteCounters]] = field(default_factory=list)
+
+    def total(self) -> RouteCounters:
+        total = RouteCounters()
+        for _, counters in self.per_test:
+            for key, value in counters.as_dict().items():
+                setattr(total, key, getattr(total, key) + value)
+        return total
+
+    def as_dict(self) -> Dict[str, List]:
+        return {"per_test": [[nodeid, counters.as_dict()] for nodeid, counters in self.per_test]}
+
+    def merge(self, other: Dict[str, List]) -> None:
+        self.per_test.extend((nodeid, RouteCounters(**counters)) for nodeid, counters in other["per_test"])
+
+
+NETWORK_STATS_KEY = pytest.StashKey[NetworkStats]()
+
+
+class StaticAssetCache:
+    """URL -> (status, headers, body) shared by all tests of a worker, optionally backed by ``disk_dir``."""
+
+    def __init__(self, disk_dir: Optional[Path] = None, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.disk_dir = disk_dir
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: Dict[str, Tuple[int, Dict[str, str], bytes]] = {}
+
+    def _disk_paths(self, url: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.disk_dir / f"{digest}.json", self.disk_dir / f"{digest}.bin"
+
+    def get(self, url: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        entry = self._entries.get(url)
+        if entry is None and self.disk_dir is not None:
+            meta_path, body_path = self._disk_paths(url)
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                entry = (meta["status"], meta["headers"], body_path.read_bytes())
+            except (OSError, ValueError, KeyError):
+                return None
+            self._remember(url, entry)
+        return entry
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        entry = (status, headers, body)
+        if not self._remember(url, entry) or self.disk_dir is None:
+            return
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        meta_path, body_path = self._disk_paths(url)
+        # Atomic writes, body before meta: other workers read the mirror while it is being filled.
+        for path, data in (
+            (body_path, body),
+            (meta_path, json.dumps({"url": url, "status": status, "headers": headers}).encode("utf-8")),
+        ):
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+
+    def _remember(self, url: str, entry: Tuple[int, Dict[str, str], bytes]) -> bool:
+        if self.size + len(entry[2]) > self.max_bytes:
+            return False
+        self._entries[url] = entry
+        self.size += len(entry[2])
+        return True
+
+
+class NetworkRouter:
+    def __init__(self, policies: Iterable[str], allowed_hosts: Iterable[str], cache: StaticAssetCache) -> None:
+        self.policies = frozenset(policies)
+        self.allowed_hosts = {h.lower() for h in allowed_hosts if h}
+        self.cache = cache
+
+    def install(self, context: BrowserContext) -> RouteCounters:
+        """Route every request of ``context`` through the policies; returns the context's counters."""
+        counters = RouteCounters()
+        context.route("**/*", lambda route: self._handle(route, counters))
+        return counters
+
+    def _is_external(self, url: str) -> bool:
+        host = (urlsplit(url).hostname or "").lower()
+        return bool(host) and host not in self.allowed_hosts
+
+    def _handle(self, route: Route, counters: RouteCounters) -> None:
+        request = route.request
+
+        if "block-external" in self.policies and not request.is_navigation_request() and self._is_external(request.url):
+            counters.blocked += 1
+            route.abort()
+            return
+
+        if "stub-images" in self.policies and request.resource_type == "image":
+            counters.stubbed += 1
+            route.fulfill(status=200, content_type="image/png", body=PIXEL_PNG)
+            return
+
+        if "cache-static" in self.policies and request.method == "GET" and request.resource_type in CACHEABLE_TYPES:
+            hit = self.cache.get(request.url)
+            if hit is not None:
+                status, headers, body = hit
+                counters.cached += 1
+                counters.bytes_saved += len(body)
+                route.fulfill(status=status, headers=headers, body=body)
+                return
+
+            response = route.fetch()
+            body = response.body()
+            counters.fetched += 1
+            if response.status == 200:
+                # The fetched body is already decoded; drop headers describing the wire encoding.
+                headers = {
+                    k: v for k, v in response.headers.items() if k.lower() not in {"content-encoding", "content-length"}
+                }
+                self.cache.put(request.url, response.status, headers, body)
+            route.fulfill(response=response, body=body)
+            return
+
+        counters.passed += 1
+        route.fallback()
+
+
+def summarize(counters: RouteCounters) -> str:
+    c = counters
+    return (
+        f"blocked {c.blocked}, stubbed {c.stubbed}, cached {c.cached}, fetched {c.fetched}, "
+        f"passed {c.passed}, saved {c.bytes_saved / 1024:.1f} KiB"
+    )
@@ -0,0 +1,159 @@
+"""Web performance metrics of the AUT, collected at page-object transitions.
+
+An init script (installed per context) buffers long tasks, LCP and layout shifts with
+``PerformanceObserver``. When a page object reports that its page is ready (``is_at()``,
+``wait_for_ready()``, ``LoginPage.open()``...), one ``evaluate`` returns:
+
+- for a new document: Navigation Timing (TTFB, DOMContentLoaded, load, transfer size), FCP and LCP;
+- always: long tasks since the previous collection (count and total ms), CLS and the JS heap.
+
+SauceDemo routes between most pages client-side, so cart/checkout transitions are "soft": they
+carry no navigation or paint timing. Long tasks, LCP and heap are Chromium-only and are missing on
+other engines.
+
+Budgets are ``page.metric=max`` (``*`` matches every page); a sample over budget fails the test
+at the transition that produced it.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pytest
+from playwright.sync_api import BrowserContext, Page
+
+METRICS = (
+    "ttfb", "dom_content_loaded", "load", "transfer_kb", "fcp", "lcp", "long_tasks", "long_task_ms", "cls", "heap_mb",
+)
+DEFAULT_REPORT = "test-results/page-perf.json"
+
+PERF_INIT_JS = """
+(() => {
+  if (window.__saucedemoPerf) return;
+  const perf = window.__saucedemoPerf = { longTasks: [], lcp: null, cls: 0 };
+  const observe = (type, fn) => {
+    try { new PerformanceObserver((list) => list.getEntries().forEach(fn)).observe({ type, buffered: true }); }
+    catch (e) { /* entry type not supported by this engine */ }
+  };
+  observe('longtask', (e) => perf.longTasks.push(e.duration));
+  observe('largest-contentful-paint', (e) => { perf.lcp = e.startTime; });
+  observe('layout-shift', (e) => { if (!e.hadRecentInput) perf.cls += e.value; });
+})();
+"""
+
+# Returns [timeOrigin, url, metrics]; drains the long-task buffer.
+COLLECT_JS = """
+() => {
+  const perf = window.__saucedemoPerf || { longTasks: [], lcp: null, cls: 0 };
+  const tasks = perf.longTasks.splice(0);
+  const m = {
+    long_tasks: tasks.length,
+    long_task_ms: tasks.reduce((a, b) => a + b, 0),
+    cls: perf.cls,
+    heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null,
+  };
+  const nav = performance.getEntriesByType('navigation')[0];
+  if (nav) {
+    m.ttfb = nav.responseStart - nav.startTime;
+    m.dom_content_loaded = nav.domContentLoadedEventEnd - nav.startTime;
+    m.load = nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null;
+    m.transfer_kb = nav.transferSize / 1024;
+  }
+  const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+  m.fcp = fcp ? fcp.startTime : null;
+  m.lcp = perf.lcp;
+  return [performance.timeOrigin, location.href, m];
+}
+"""
+
+SOFT_METRICS = ("long_tasks", "long_task_ms", "cls", "heap_mb")
+
+
+def parse_budgets(specs: List[str]) -> Dict[Tuple[str, str], float]:
+    """``["inventory.lcp=2500", "*.long_task_ms=200"]`` -> {("inventory", "lcp"): 2500.0, ...}."""
+    budgets: Dict[Tuple[str, str], float] = {}
+    for spec in (s.strip() for raw in specs for s in raw.split(",")):
+        if not spec:
+            continue
+        target, _, value = spec.partition("=")
+        page, _, metric = target.strip().rpartition(".")
+        if not page or metric not in METRICS or not value:
+            raise pytest.UsageError(
+                f"Bad perf budget {spec!r}: expected page.metric=max with metric in {', '.join(METRICS)}"
+            )
+        budgets[(page.lower(), metric)] = float(value)
+    return budgets
+
+
+def page_name(page_object: Any) -> str:
+    """``InventoryPage`` -> ``inventory``, ``CheckoutStepOnePage`` -> ``checkoutstepone``."""
+    name = type(page_object).__name__
+    return (name[: -len("Page")] if name.endswith("Page") else name).lower()
+
+
+@dataclass
+class PerfSample:
+    page: str
+    url: str
+    soft: bool
+    metrics: Dict[str, float]
+    violations: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "page": self.page,
+            "url": self.url,
+            "soft": self.soft,
+            "metrics": self.metrics,
+            "violations": self.violations,
+        }
+
+
+class PerfMonitor:
+    """Per-worker collector; registered as a BasePage transition listener by the perf plugin."""
+
+    def __init__(self, budgets: Optional[Dict[Tuple[str, str], float]] = None) -> None:
+        self.budgets = budgets or {}
+        self.current: Optional[pytest.Item] = None
+        # Per page of the current test: (document, page name) pairs already measured, so repeated
+        # is_at() calls add nothing and a known document marks a client-side (soft) transition.
+        self._seen: Dict[int, Set[Tuple[float, str]]] = {}
+
+    def start(self, item: Optional[pytest.Item]) -> None:
+        self.current = item
+        self._seen.clear()
+
+    def install(self, ctx: BrowserContext) -> None:
+        ctx.add_init_script(PERF_INIT_JS)
+
+    def _budget_violations(self, name: str, metrics: Dict[str, float]) -> List[str]:
+        found = []
+        for (pattern, metric), limit in self.budgets.items():
+            value = metrics.get(metric)
+            if value is not None and fnmatch.fnmatchcase(name, pattern) and value > limit:
+                found.append(f"{name}.{metric}={value:.1f} > {limit:g}")
+        return found
+
+    def collect(self, page: Page, name: str) -> Optional[PerfSample]:
+        time_origin, url, raw = page.evaluate(COLLECT_JS)
+        seen = self._seen.setdefault(id(page), set())
+        soft = any(origin == time_origin for origin, _ in seen)
+        if (time_origin, name) in seen:
+            return None
+        seen.add((time_origin, name))
+        keep = SOFT_METRICS if soft else METRICS
+        metrics = {k: raw[k] for k in keep if raw.get(k) is not None}
+        sample = PerfSample(name, url, soft, metrics, self._budget_violations(name, metrics))
+        if self.current is not None:
+            self.current.user_properties.append(("perf", sample.as_dict()))
+        return sample
+
+    def on_transition(self, page_object: Any) -> None:
+        sample = self.collect(page_object.page, page_name(page_object))
+        if sample is not None and sample.violations:
+            raise AssertionError("performance budget exceeded: " + "; ".join(sample.violations))
+
+
+PERF_MONITOR_KEY = pytest.StashKey[PerfMonitor]()
@@ -0,0 +1 @@
+"""Pytest plugins registered from the root ``conftest.py`` via ``pytest_plugins``."""
@@ -0,0 +1,131 @@
+"""Failure-only artifacts: options, capture on failing reports, overhead summary."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from framework.artifacts import ARTIFACT_MODES, ARTIFACT_RECORDER_KEY, DEFAULT_DIR, DEFAULT_MAX_FILE_MB
+from framework.artifacts import DEFAULT_MAX_TOTAL_MB, DEFAULT_RING_SIZE, ArtifactStats, FailureArtifacts
+from framework.stats import describe
+from framework.workers import is_worker
+
+WORKEROUTPUT_KEY = "saucedemo_artifacts"
+_ARTIFACTS_KEY = pytest.StashKey[FailureArtifacts]()
+_MERGED_KEY = pytest.StashKey[ArtifactStats]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--failure-artifacts",
+        action="store",
+        choices=ARTIFACT_MODES,
+        default=None,
+        help="off, light (console ring + screenshot/DOM on failure, default) or trace (also keep a "
+        "Playwright trace of failing tests). Env: FAILURE_ARTIFACTS.",
+    )
+    group.addoption("--artifacts-dir", action="store", default=DEFAULT_DIR, help=f"Default {DEFAULT_DIR}.")
+    group.addoption(
+        "--artifacts-ring-size",
+        action="store",
+        type=int,
+        default=DEFAULT_RING_SIZE,
+        help=f"Console/network events kept per test (default {DEFAULT_RING_SIZE}).",
+    )
+    group.addoption(
+        "--artifacts-max-file-mb",
+        action="store",
+        type=float,
+        default=DEFAULT_MAX_FILE_MB,
+        help=f"Drop single artifacts above this size (default {DEFAULT_MAX_FILE_MB:.0f}).",
+    )
+    group.addoption(
+        "--artifacts-max-total-mb",
+        action="store",
+        type=float,
+        default=DEFAULT_MAX_TOTAL_MB,
+        help=f"Stop writing artifacts once a worker wrote this much (default {DEFAULT_MAX_TOTAL_MB:.0f}).",
+    )
+
+
+def _mode(config: pytest.Config) -> str:
+    return config.getoption("failure_artifacts") or os.getenv("FAILURE_ARTIFACTS", "light")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if _mode(config) not in ARTIFACT_MODES:
+        raise pytest.UsageError(f"FAILURE_ARTIFACTS must be one of {', '.join(ARTIFACT_MODES)}")
+    config.stash[_MERGED_KEY] = ArtifactStats()
+
+
+@pytest.fixture(scope="session")
+def failure_artifacts(pytestconfig: pytest.Config) -> Optional[FailureArtifacts]:
+    """Per-worker artifact policy, or None with --failure-artifacts off."""
+    mode = _mode(pytestconfig)
+    if mode == "off":
+        return None
+    mb = 1024 * 1024
+    artifacts = FailureArtifacts(
+        Path(pytestconfig.getoption("artifacts_dir")),
+        mode=mode,
+        ring_size=pytestconfig.getoption("artifacts_ring_size"),
+        max_file_bytes=int(pytestconfig.getoption("artifacts_max_file_mb") * mb),
+        max_total_bytes=int(pytestconfig.getoption("artifacts_max_total_mb") * mb),
+    )
+    pytestconfig.stash[_ARTIFACTS_KEY] = artifacts
+    return artifacts
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report = outcome.get_result()
+    recorder = item.stash.get(ARTIFACT_RECORDER_KEY, None)
+    # Teardown failures happen after the page is gone; setup and call failures still have it.
+    if recorder is None or recorder.failed or not report.failed or report.when == "teardown":
+        return
+    paths = item.config.stash[_ARTIFACTS_KEY].capture(recorder, item.nodeid)
+    if paths:
+        report.sections.append(("failure artifacts", "\n".join(str(p) for p in paths)))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash[_MERGED_KEY].merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    artifacts = config.stash.get(_ARTIFACTS_KEY, None)
+    if artifacts is None:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(artifacts.stats.as_dict())
+    else:
+        config.stash[_MERGED_KEY].merge(artifacts.stats.as_dict())
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    stats = config.stash.get(_MERGED_KEY, None)
+    if stats is None or not stats.tests:
+        return
+    tr = terminalreporter
+    tr.write_sep("-", f"failure artifacts ({_mode(config)})")
+    tr.write_line(
+        f"{stats.failures} failing tests captured, {stats.bytes_written / 1024:.0f} KiB written"
+        + (f", {stats.over_budget} artifacts dropped by size limits" if stats.over_budget else "")
+        + f" -> {config.getoption('artifacts_dir')}"
+    )
+    if stats.overhead:
+        d = describe(stats.overhead)
+        tr.write_line(
+            f"overhead on {d['n']} passing tests: mean {d['mean'] * 1000:.1f} ms, "
+            f"p95 {d['p95'] * 1000:.1f} ms, total {d['total']:.2f} s"
+        )
@@ -0,0 +1,134 @@
+"""asyncio fixtures for the async page objects (``pages.async_api``).
+
+One async browser per worker; every ``async_new_context()`` / ``async_login()`` call opens its
+own context, so a single test can drive many users or tabs concurrently with
+``asyncio.gather``. Async tests run on the session event loop::
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_something(async_login): ...
+
+The sync fixtures (``page``, ``login``...) can't be mixed into async tests, and network
+routing (--network-policy) and the warm pool only apply to the sync API.
+
+Nor can the two APIs share a process in that order: once the sync driver started, it leaves its
+own event loop installed as the thread's running loop and pytest-asyncio can no longer run (or
+close) the session loop. Async tests carry the ``async_api`` marker and run in their own pytest
+process (``pytest -m async_api``); when the sync driver is already up they are skipped before
+setup instead of erroring.
+
+``playwright.async_api`` and the async page objects are imported by the fixtures, so sync-only
+sessions don't load them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urljoin
+
+import pytest
+import pytest_asyncio
+
+from framework.auth import CachedLogin, StorageStateCache
+from framework.browser import BROWSER_MANAGER_KEY, is_headless, launch_options, resolve_browser_name, resolve_channel
+from framework.browser import resolve_viewport
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+    from pages.async_api import InventoryPage
+
+
+SYNC_DRIVER_STARTED = (
+    "the sync Playwright driver already runs in this process and owns the thread's event loop; "
+    "run the asyncio tests in their own process: pytest -m async_api"
+)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    if item.get_closest_marker("asyncio") is None:
+        return
+    manager = item.config.stash.get(BROWSER_MANAGER_KEY, None)
+    # Before any fixture: setting up the session loop would already fail.
+    if manager is not None and manager.driver_started:
+        pytest.skip(SYNC_DRIVER_STARTED)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_browser(pytestconfig: pytest.Config) -> AsyncGenerator[Browser, None]:
+    from playwright.async_api import async_playwright
+
+    browser_name = resolve_browser_name(pytestconfig)
+    async with async_playwright() as p:
+        browser = await getattr(p, browser_name).launch(
+            **launch_options(browser_name, resolve_channel(pytestconfig), is_headless(pytestconfig))
+        )
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_new_context(async_browser: Browser) -> AsyncGenerator[Callable[..., Awaitable[BrowserContext]], None]:
+    """Factory for fresh contexts; all of them are closed after the test."""
+    contexts: List[BrowserContext] = []
+
+    async def _new_context(**context_args: Any) -> BrowserContext:
+        ctx = await async_browser.new_context(viewport=resolve_viewport(), **context_args)
+        contexts.append(ctx)
+        return ctx
+
+    yield _new_context
+    for ctx in contexts:
+        await ctx.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_page(async_new_context) -> Page:
+    ctx = await async_new_context()
+    return await ctx.new_page()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_login(
+    async_new_context,
+    base_url: str,
+    users_data: Dict[str, Any],
+    auth_cache: StorageStateCache,
+) -> Callable[..., Awaitable[InventoryPage]]:
+    """Async counterpart of ``login``: each call logs a user in inside its own context.
+
+    Shares the storage-state cache with the sync fixtures (same entries, same rules).
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    from pages.async_api import InventoryPage, LoginPage
+
+    async def _login(username: str, password: Optional[str] = None) -> InventoryPage:
+        cached = CachedLogin(auth_cache, base_url, users_data, username, password)
+
+        state = cached.state()
+        if state is not None:
+            ctx = await async_new_context(storage_state=state)
+            page = await ctx.new_page()
+            await page.goto(urljoin(base_url, "inventory.html"))
+            await page.wait_for_selector(f"{InventoryPage.ITEM}, {LoginPage.LOGIN_BTN}")
+            if "inventory.html" in page.url:
+                return InventoryPage(page)
+            cached.restore_failed()
+        else:
+            ctx = await async_new_context()
+            page = await ctx.new_page()
+
+        lp = LoginPage(page, base_url)
+        await lp.open()
+        await lp.login(username, cached.password)
+        if cached.cacheable:
+            try:
+                await page.wait_for_url("**/inventory.html")
+            except PlaywrightTimeoutError:
+                # Login didn't go through; leave the assertion to the test.
+                return InventoryPage(page)
+            cached.remember(await ctx.storage_state())
+        return InventoryPage(page)
+
+    return _login
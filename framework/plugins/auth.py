@@ -0,0 +1,90 @@
+"""Authenticated storage-state cache: options, session fixture and summary."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from typing import Any, Generator
+
+import pytest
+
+from framework.auth import DEFAULT_TTL_S, CacheStats, StorageStateCache
+from framework.workers import is_worker
+
+WORKEROUTPUT_KEY = "saucedemo_auth"
+AUTH_CACHE_KEY = pytest.StashKey[StorageStateCache]()
+_MERGED_KEY = pytest.StashKey[CacheStats]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--no-auth-cache",
+        action="store_true",
+        default=False,
+        help="Always log in through the UI instead of restoring a cached storage_state. Env: AUTH_CACHE=0.",
+    )
+    group.addoption(
+        "--auth-cache-ttl",
+        action="store",
+        type=float,
+        default=None,
+        help=f"Seconds a cached login stays valid (default {DEFAULT_TTL_S:.0f}). Env: AUTH_CACHE_TTL.",
+    )
+    group.addoption(
+        "--clear-auth-cache",
+        action="store_true",
+        default=False,
+        help="Drop cached storage states on disk before the session starts.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Only the controlling process clears, parallel workers start afterwards.
+    if config.getoption("clear_auth_cache") and getattr(config, "cache", None) and not hasattr(config, "workerinput"):
+        for path in config.cache.mkdir("auth-state").glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+def _cache_enabled(config: pytest.Config) -> bool:
+    if config.getoption("no_auth_cache"):
+        return False
+    return os.getenv("AUTH_CACHE", "1").strip().lower() not in {"0", "false", "no", "n"}
+
+
+@pytest.fixture(scope="session")
+def auth_cache(pytestconfig: pytest.Config) -> Generator[StorageStateCache, Any, None]:
+    """Per-worker storage-state cache (files live under .pytest_cache and are shared by workers)."""
+    ttl = pytestconfig.getoption("auth_cache_ttl") or float(os.getenv("AUTH_CACHE_TTL", DEFAULT_TTL_S))
+    # Without the cacheprovider plugin (-p no:cacheprovider) entries are kept in memory only.
+    cache_dir = pytestconfig.cache.mkdir("auth-state") if getattr(pytestconfig, "cache", None) else None
+    cache = StorageStateCache(cache_dir, ttl=ttl, enabled=_cache_enabled(pytestconfig))
+    pytestconfig.stash[AUTH_CACHE_KEY] = cache
+    yield cache
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash.setdefault(_MERGED_KEY, CacheStats()).merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    cache = config.stash.get(AUTH_CACHE_KEY, None)
+    if cache is None or not cache.enabled:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(asdict(cache.stats))
+    else:
+        config.stash.setdefault(_MERGED_KEY, CacheStats()).merge(asdict(cache.stats))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    s = config.stash.get(_MERGED_KEY, None)
+    if s is None:
+        return
+    terminalreporter.write_sep("-", "auth storage-state cache")
+    terminalreporter.write_line(f"hits: {s.hits}, misses: {s.misses}, invalidations: {s.invalidations}")
@@ -0,0 +1,114 @@
+"""Benchmark lane: options, the ``bench`` fixture, baseline storage and the summary table."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from framework.bench import DEFAULT_BASELINE, DEFAULT_ITERATIONS, DEFAULT_THRESHOLD, DEFAULT_WARMUP
+from framework.bench import Baseline, BenchRunner, environment
+from framework.browser import resolve_browser_name
+from framework.workers import is_worker
+
+WORKEROUTPUT_KEY = "saucedemo_bench"
+_RESULTS_KEY = pytest.StashKey[List[Dict[str, Any]]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption("--bench-iterations", type=int, default=DEFAULT_ITERATIONS, help="Measured iterations per metric.")
+    group.addoption("--bench-warmup", type=int, default=DEFAULT_WARMUP, help="Unmeasured warm-up iterations per metric.")
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed relative slowdown of a metric's median before it fails (default {DEFAULT_THRESHOLD}).",
+    )
+    group.addoption("--bench-baseline", default=DEFAULT_BASELINE, help=f"Baseline file (default {DEFAULT_BASELINE}).")
+    group.addoption(
+        "--bench-save-baseline",
+        action="store_true",
+        default=False,
+        help="Store this run's results as the new baseline instead of gating on it.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_RESULTS_KEY] = []
+
+
+@pytest.fixture(scope="session")
+def bench_baseline(pytestconfig: pytest.Config) -> Baseline:
+    return Baseline(Path(pytestconfig.getoption("bench_baseline")))
+
+
+@pytest.fixture
+def bench(pytestconfig: pytest.Config, bench_baseline: Baseline):
+    runner = BenchRunner(
+        bench_baseline,
+        iterations=pytestconfig.getoption("bench_iterations"),
+        warmup=pytestconfig.getoption("bench_warmup"),
+        threshold=pytestconfig.getoption("bench_threshold"),
+        enforce=not pytestconfig.getoption("bench_save_baseline"),
+    )
+    yield runner
+    pytestconfig.stash[_RESULTS_KEY].extend(r.as_dict() for r in runner.results)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    result = yield
+    # After the test body, so a test measuring several metrics reports all of its regressions.
+    runner = getattr(item, "funcargs", {}).get("bench")
+    if runner is not None:
+        runner.check()
+    return result
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash[_RESULTS_KEY].extend(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    results = config.stash.get(_RESULTS_KEY, [])
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(results)
+        return
+    if results and config.getoption("bench_save_baseline"):
+        Baseline(Path(config.getoption("bench_baseline"))).save(results, environment(resolve_browser_name(config)))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    results = config.stash.get(_RESULTS_KEY, [])
+    if not results:
+        return
+
+    tr = terminalreporter
+    tr.write_sep("-", "benchmarks")
+    tr.write_line(f"{'metric':<32} {'median ms':>10} {'p95 ms':>9} {'baseline':>9} {'delta':>8}  status")
+    for r in sorted(results, key=lambda r: r["metric"]):
+        baseline = r["baseline"]
+        delta = r["median"] / baseline - 1 if baseline else None
+        status = "new" if delta is None else ("REGRESSED" if delta > r["threshold"] else "ok")
+        tr.write_line(
+            f"{r['metric']:<32} {r['median'] * 1000:>10.1f} {r['p95'] * 1000:>9.1f} "
+            f"{(f'{baseline * 1000:.1f}' if baseline else '-'):>9} {(f'{delta:+.0%}' if delta is not None else '-'):>8}  {status}"
+        )
+
+    path = Path(config.getoption("bench_baseline"))
+    if config.getoption("bench_save_baseline"):
+        tr.write_line(f"baseline saved to {path}")
+    elif not path.exists():
+        tr.write_line(f"no baseline at {path}, nothing gated: record one with --bench-save-baseline")
+    else:
+        recorded = Baseline(path).env
+        current = environment(resolve_browser_name(config))
+        if recorded and recorded != current:
+            tr.write_line(f"note: baseline recorded on {recorded}, current run {current}")
@@ -0,0 +1,71 @@
+"""Browser lifecycle options and the end-of-session launch/setup report."""
+
+from __future__ import annotations
+
+import json
+import statistics
+
+import pytest
+
+from framework.browser import CONTEXT_MODES, LAUNCH_STATS_KEY, LaunchStats
+from framework.workers import is_distributed, is_worker
+
+WORKEROUTPUT_KEY = "saucedemo_browser"
+# Set once a worker (or the serial session) reports; the controller of a -n run launches nothing.
+_MERGED_KEY = pytest.StashKey[LaunchStats]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--context-mode",
+        action="store",
+        default=None,
+        choices=CONTEXT_MODES,
+        help="shared: one browser per worker, new_context() per test (default). "
+        "isolated: full browser launch per test. Env: CONTEXT_MODE.",
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash.setdefault(_MERGED_KEY, LaunchStats()).merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    stats = config.stash.get(LAUNCH_STATS_KEY, None)
+    if stats is None:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(stats.as_dict())
+    else:
+        config.stash.setdefault(_MERGED_KEY, LaunchStats()).merge(stats.as_dict())
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    stats = config.stash.get(_MERGED_KEY, None)
+    if stats is None:
+        return
+
+    tr = terminalreporter
+    tr.write_sep("-", "browser lifecycle")
+    per_browser = ", ".join(f"{label}={count}" for label, count in sorted(stats.launches.items()))
+    tr.write_line(f"browser launches: {stats.total_launches} ({per_browser or 'none'})")
+    if stats.driver_start_s is None:
+        tr.write_line("playwright driver: not started")
+    else:
+        slowest = " (slowest worker)" if is_distributed(config) else ""
+        tr.write_line(f"playwright driver: started in {stats.driver_start_s * 1000:.0f} ms{slowest}")
+
+    times = stats.setup_times
+    if times:
+        tr.write_line(
+            f"context setup: {len(times)} tests, "
+            f"mean {statistics.mean(times) * 1000:.0f} ms, "
+            f"p50 {statistics.median(times) * 1000:.0f} ms, "
+            f"max {max(times) * 1000:.0f} ms, "
+            f"total {sum(times):.2f} s"
+        )
@@ -0,0 +1,104 @@
+"""Cross-browser matrix: parametrizes marked tests over browsers and reports one result grid."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from framework.browser import resolve_browser_name, resolve_channel
+from framework.matrix import MATRIX_RESULTS_KEY, BrowserTarget, MatrixResults, parse_matrix
+from framework.workers import is_worker
+
+DEFAULT_REPORT = "test-results/browser-matrix.json"
+_TARGETS_KEY = pytest.StashKey[List[BrowserTarget]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--browser-matrix",
+        action="store",
+        default=None,
+        metavar="LIST",
+        help="Run the matrix-marked tests once per browser, e.g. chromium,firefox,webkit,msedge. "
+        "Env: BROWSER_MATRIX.",
+    )
+    group.addoption(
+        "--browser-matrix-marker",
+        action="store",
+        default="compatibility",
+        help="Marker selecting the tests to parametrize over the matrix (default compatibility).",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    spec = config.getoption("browser_matrix") or os.getenv("BROWSER_MATRIX")
+    if spec:
+        targets = parse_matrix(spec)
+        results = MatrixResults([t.id for t in targets])
+        config.stash[_TARGETS_KEY] = targets
+        config.stash[MATRIX_RESULTS_KEY] = results
+        config.pluginmanager.register(MatrixReporter(config, results), "saucedemo-matrix")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    targets = metafunc.config.stash.get(_TARGETS_KEY, None)
+    marker = metafunc.config.getoption("browser_matrix_marker")
+    if targets is None or "browser_target" not in metafunc.fixturenames:
+        return
+    if metafunc.definition.get_closest_marker(marker) is None:
+        return
+    metafunc.parametrize("browser_target", targets, ids=[t.id for t in targets], indirect=True)
+
+
+@pytest.fixture
+def browser_target(request: pytest.FixtureRequest) -> BrowserTarget:
+    """Browser for this test: the matrix parameter, else --browser/--browser-channel."""
+    target: Optional[BrowserTarget] = getattr(request, "param", None)
+    if target is None:
+        return BrowserTarget(resolve_browser_name(request.config), resolve_channel(request.config))
+    request.node.user_properties.append(("browser_target", target.id))
+    return target
+
+
+class MatrixReporter:
+    """Collects one cell per (test, browser) on the controller and prints/writes the grid."""
+
+    def __init__(self, config: pytest.Config, results: MatrixResults) -> None:
+        self.config = config
+        self.results = results
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        # Workers forward every report to the controller; only aggregate there (or in serial runs).
+        if is_worker(self.config):
+            return
+        target_id = dict(report.user_properties).get("browser_target")
+        if target_id:
+            self.results.record(report.nodeid, target_id, report.outcome, report.duration)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if is_worker(self.config) or not self.results.cells:
+            return
+        path = Path(DEFAULT_REPORT)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.results.as_dict(), indent=2), encoding="utf-8")
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.results.cells:
+            return
+        tr = terminalreporter
+        targets = self.results.targets
+        width = max(len("test time (s)"), *(len(row) for row in self.results.cells))
+        tr.write_sep("-", "browser matrix")
+        tr.write_line(f"{'test':<{width}}  " + "  ".join(f"{t:>10}" for t in targets))
+        for row, cells in sorted(self.results.cells.items()):
+            tr.write_line(f"{row:<{width}}  " + "  ".join(f"{cells.get(t, '-'):>10}" for t in targets))
+        tr.write_line(
+            f"{'test time (s)':<{width}}  "
+            + "  ".join(f"{self.results.durations.get(t, 0.0):>10.2f}" for t in targets)
+        )
+        tr.write_line(f"matrix report: {DEFAULT_REPORT}")
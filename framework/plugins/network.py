@@ -0,0 +1,93 @@
+"""Network routing layer: options, per-worker router fixture and savings report."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import pytest
+
+from framework.network import NETWORK_STATS_KEY, POLICIES, NetworkRouter, NetworkStats, StaticAssetCache
+from framework.network import parse_policies, summarize
+from framework.workers import is_worker
+
+WORKEROUTPUT_KEY = "saucedemo_network"
+_MERGED_KEY = pytest.StashKey[NetworkStats]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--network-policy",
+        action="store",
+        default=None,
+        help=f"Comma separated request policies ({', '.join(POLICIES)}) or 'off' (default). Env: NETWORK_POLICY.",
+    )
+    group.addoption(
+        "--network-allow-host",
+        action="append",
+        default=[],
+        help="Extra host treated as first-party by block-external (repeatable).",
+    )
+    group.addoption(
+        "--network-cache-dir",
+        action="store",
+        default=None,
+        help="Mirror the static asset cache on disk so it survives across workers and runs.",
+    )
+
+
+def _policies(config: pytest.Config) -> frozenset:
+    return parse_policies(config.getoption("network_policy") or os.getenv("NETWORK_POLICY"))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    _policies(config)  # fail fast on typos instead of at the first test
+
+
+@pytest.fixture(scope="session")
+def network_router(pytestconfig: pytest.Config, base_url: str) -> Optional[NetworkRouter]:
+    """Per-worker router, or None when no policy is active."""
+    policies = _policies(pytestconfig)
+    if not policies:
+        return None
+
+    cache_dir = pytestconfig.getoption("network_cache_dir")
+    cache = StaticAssetCache(Path(cache_dir) if cache_dir else None)
+    allowed = [urlsplit(base_url).hostname, *pytestconfig.getoption("network_allow_host")]
+    pytestconfig.stash[NETWORK_STATS_KEY] = NetworkStats()
+    return NetworkRouter(policies, allowed, cache)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash.setdefault(_MERGED_KEY, NetworkStats()).merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    stats = config.stash.get(NETWORK_STATS_KEY, None)
+    if stats is None:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(stats.as_dict())
+    else:
+        config.stash.setdefault(_MERGED_KEY, NetworkStats()).merge(stats.as_dict())
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    stats = config.stash.get(_MERGED_KEY, None)
+    if not stats or not stats.per_test:
+        return
+
+    tr = terminalreporter
+    tr.write_sep("-", "network routing")
+    tr.write_line(f"total over {len(stats.per_test)} tests: {summarize(stats.total())}")
+    if config.getoption("verbose") > 0:
+        for nodeid, counters in stats.per_test:
+            tr.write_line(f"{nodeid}: {summarize(counters)}")
@@ -0,0 +1,71 @@
+"""Duration-aware scheduling and per-worker timing for ``pytest -n N`` (pytest-xdist) runs.
+
+Tests are ordered fail-first, then longest-first from the recorded history (see
+``framework/plugins/selection.py``) and handed out one at a time (``--maxschedchunk 1``),
+which turns xdist's ``load`` scheduler into a greedy LPT packer: slow checkout tests start
+early and on different workers instead of piling up at the end.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import Dict
+
+import pytest
+
+from framework.workers import is_distributed, is_worker, report_worker
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--no-duration-schedule",
+        action="store_true",
+        default=False,
+        help="Keep collection order in parallel runs instead of fail-first/longest-first from the run history.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.pluginmanager.register(ParallelScheduler(config), "saucedemo-parallel")
+
+
+class ParallelScheduler:
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.enabled = is_distributed(config) and not config.getoption("no_duration_schedule")
+        self.started = time.perf_counter()
+        self.worker_busy: Dict[str, float] = defaultdict(float)
+        self.worker_tests: Dict[str, set] = defaultdict(set)
+
+        if self.enabled and not is_worker(config) and config.getoption("dist", default="no") == "load":
+            if getattr(config.option, "maxschedchunk", None) is None:
+                config.option.maxschedchunk = 1
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        # Workers forward every report to the controller; only aggregate there (or in serial runs).
+        if is_worker(self.config):
+            return
+        worker = report_worker(report)
+        self.worker_busy[worker] += report.duration
+        self.worker_tests[worker].add(report.nodeid)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not is_distributed(self.config) or not self.worker_busy:
+            return
+
+        tr = terminalreporter
+        wall = time.perf_counter() - self.started
+        busy = sum(self.worker_busy.values())
+        tr.write_sep("-", "parallel workers")
+        for worker in sorted(self.worker_busy):
+            tr.write_line(
+                f"{worker:>8}: {len(self.worker_tests[worker]):>4} tests, busy {self.worker_busy[worker]:7.2f} s"
+            )
+        mean = busy / len(self.worker_busy)
+        imbalance = max(self.worker_busy.values()) / mean if mean else 1.0
+        tr.write_line(
+            f"total test time {busy:.2f} s over {len(self.worker_busy)} workers, "
+            f"wall {wall:.2f} s, speedup x{busy / wall if wall else 0:.1f}, imbalance x{imbalance:.2f}"
+        )
@@ -0,0 +1,129 @@
+"""Page performance metrics: options, per-context init script, per-page aggregation and budgets."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from framework.perf import DEFAULT_REPORT, METRICS, PERF_MONITOR_KEY, PerfMonitor, parse_budgets
+from framework.stats import describe
+from framework.workers import is_worker
+from pages import base
+
+SUMMARY_METRICS = ("ttfb", "load", "fcp", "lcp", "long_task_ms", "heap_mb")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="Collect Navigation Timing, paint, long tasks and JS heap at every page-object transition and "
+        f"aggregate them per page (written to {DEFAULT_REPORT}). Env: PERF_METRICS=1.",
+    )
+    group.addoption(
+        "--perf-budget",
+        action="append",
+        default=[],
+        metavar="PAGE.METRIC=MAX",
+        help="Fail a test when a transition exceeds the budget, e.g. inventory.lcp=2500 or '*.long_task_ms=200' "
+        f"(repeatable; implies --perf-metrics; metrics: {', '.join(METRICS)}). Env: PERF_BUDGET (comma-separated).",
+    )
+
+
+def _budgets(config: pytest.Config) -> List[str]:
+    return [*config.getoption("perf_budget"), *filter(None, [os.getenv("PERF_BUDGET")])]
+
+
+def _enabled(config: pytest.Config) -> bool:
+    return bool(config.getoption("perf_metrics") or os.getenv("PERF_METRICS") == "1" or _budgets(config))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not _enabled(config):
+        return
+    monitor = PerfMonitor(parse_budgets(_budgets(config)))
+    config.stash[PERF_MONITOR_KEY] = monitor
+    base.TRANSITION_LISTENERS.append(monitor.on_transition)
+    config.pluginmanager.register(PerfReporter(config), "saucedemo-perf")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    monitor = config.stash.get(PERF_MONITOR_KEY, None)
+    if monitor is not None and monitor.on_transition in base.TRANSITION_LISTENERS:
+        base.TRANSITION_LISTENERS.remove(monitor.on_transition)
+
+
+@pytest.fixture(scope="session")
+def perf_monitor(pytestconfig: pytest.Config) -> Optional[PerfMonitor]:
+    """Installs the metrics init script into each test's context (None unless --perf-metrics/--perf-budget)."""
+    return pytestconfig.stash.get(PERF_MONITOR_KEY, None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: Optional[pytest.Item]):
+    monitor = item.config.stash.get(PERF_MONITOR_KEY, None)
+    if monitor is not None:
+        monitor.start(item)
+    yield
+    if monitor is not None:
+        monitor.start(None)
+
+
+class PerfReporter:
+    """Aggregates the ``perf`` user properties per page on the controller."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.samples: Dict[str, List[Dict[str, Any]]] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        # Properties accumulate over the phases; the teardown report carries all of them once.
+        if is_worker(self.config) or report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == "perf":
+                self.samples.setdefault(value["page"], []).append({**value, "test": report.nodeid})
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        rows: Dict[str, Dict[str, Any]] = {}
+        for page, samples in self.samples.items():
+            rows[page] = {
+                "transitions": len(samples),
+                "soft": sum(1 for s in samples if s["soft"]),
+                "violations": [v for s in samples for v in s["violations"]],
+                "metrics": {
+                    metric: describe(values)
+                    for metric in METRICS
+                    if (values := [s["metrics"][metric] for s in samples if metric in s["metrics"]])
+                },
+            }
+        return rows
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if is_worker(self.config) or not self.samples:
+            return
+        path = Path(DEFAULT_REPORT)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"pages": self.summary(), "samples": self.samples}, indent=2), encoding="utf-8")
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if is_worker(self.config) or not self.samples:
+            return
+        tr = terminalreporter
+        tr.write_sep("-", "page performance (p50 / p95, ms unless noted)")
+        for page, row in sorted(self.summary().items()):
+            parts = [
+                f"{metric} {row['metrics'][metric]['p50']:.0f}/{row['metrics'][metric]['p95']:.0f}"
+                for metric in SUMMARY_METRICS
+                if metric in row["metrics"]
+            ]
+            tr.write_line(f"{page:<18} {row['transitions']:>4} transitions ({row['soft']} soft)  " + "  ".join(parts))
+            for violation in row["violations"]:
+                tr.write_line(f"  over budget: {violation}")
+        tr.write_line(f"-> {DEFAULT_REPORT}")
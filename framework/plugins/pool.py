@@ -0,0 +1,130 @@
+"""Warm context pool: options, session fixture and summary."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from typing import Any, Generator, Optional
+
+import pytest
+
+from framework.auth import StorageStateCache
+from framework.browser import BrowserManager, resolve_browser_name, resolve_channel, resolve_context_mode
+from framework.context_pool import PREPARE_MODES, WARM_POOL_KEY, PoolStats, WarmContextPool, worker_pool_size
+from framework.network import NetworkRouter
+from framework.workers import is_distributed, is_worker
+
+WORKEROUTPUT_KEY = "saucedemo_pool"
+_MERGED_KEY = pytest.StashKey[PoolStats]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--warm-pool",
+        action="store",
+        type=int,
+        default=None,
+        help="Keep N browser contexts created ahead of demand, per worker (capped at the CPU count). "
+        "Env: WARM_POOL. Default 0 (off).",
+    )
+    group.addoption(
+        "--warm-pool-prepare",
+        action="store",
+        choices=PREPARE_MODES,
+        default=None,
+        help="Pre-navigate warm contexts: none, login (login page) or inventory (cached standard_user "
+        "session). Env: WARM_POOL_PREPARE. Default login.",
+    )
+    group.addoption(
+        "--warm-pool-idle-s",
+        action="store",
+        type=float,
+        default=60.0,
+        help="Close warm contexts that sat idle longer than this (default 60).",
+    )
+    group.addoption(
+        "--warm-pool-min-free-mb",
+        action="store",
+        type=float,
+        default=512.0,
+        help="Stop creating warm contexts while available memory is below this (default 512).",
+    )
+
+
+def _pool_size(config: pytest.Config) -> int:
+    requested = config.getoption("warm_pool")
+    if requested is None:
+        requested = int(os.getenv("WARM_POOL", "0") or 0)
+    return worker_pool_size(requested)
+
+
+def _prepare(config: pytest.Config) -> str:
+    return config.getoption("warm_pool_prepare") or os.getenv("WARM_POOL_PREPARE", "login")
+
+
+@pytest.fixture(scope="session")
+def warm_pool(
+    pytestconfig: pytest.Config,
+    browser_manager: BrowserManager,
+    base_url: str,
+    auth_cache: StorageStateCache,
+    network_router: Optional[NetworkRouter],
+) -> Generator[Optional[WarmContextPool], Any, None]:
+    """Per-worker pool of ready contexts; None when disabled or in isolated context mode."""
+    size = _pool_size(pytestconfig)
+    # Isolated mode launches a browser per test, pre-launching those is not worth the memory.
+    if size <= 0 or resolve_context_mode(pytestconfig) != "shared":
+        yield None
+        return
+
+    pool = WarmContextPool(
+        browser_manager,
+        resolve_browser_name(pytestconfig),
+        resolve_channel(pytestconfig),
+        base_url,
+        size=size,
+        prepare=_prepare(pytestconfig),
+        idle_ttl=pytestconfig.getoption("warm_pool_idle_s"),
+        min_free_mb=pytestconfig.getoption("warm_pool_min_free_mb"),
+        # peek: prewarming is not a test login, it must not show up in the auth cache hits/misses.
+        auth_state=lambda: auth_cache.peek("standard_user", base_url) if auth_cache.enabled else None,
+        on_create=network_router.install if network_router is not None else lambda ctx: None,
+    )
+    pytestconfig.stash[WARM_POOL_KEY] = pool
+    pool.replenish()
+    yield pool
+    pool.close()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash.setdefault(_MERGED_KEY, PoolStats()).merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    pool = config.stash.get(WARM_POOL_KEY, None)
+    if pool is None:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(asdict(pool.stats))
+    else:
+        config.stash.setdefault(_MERGED_KEY, PoolStats()).merge(asdict(pool.stats))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    s = config.stash.get(_MERGED_KEY, None)
+    if s is None:
+        return
+    served = s.hits + s.misses
+    per_worker = " per worker" if is_distributed(config) else ""
+    terminalreporter.write_sep("-", "warm context pool")
+    terminalreporter.write_line(
+        f"size: {_pool_size(config)}{per_worker} ({_prepare(config)}), hits: {s.hits}/{served}, "
+        f"created: {s.created}, idle evictions: {s.evicted_idle}, dirty discards: {s.discarded_dirty}, "
+        f"memory backoffs: {s.backoffs}"
+    )
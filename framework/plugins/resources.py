@@ -0,0 +1,162 @@
+"""Resource profiling: per-test RSS/CPU/temp-dir table, leak flags and the session trend."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from framework.browser import BROWSER_MANAGER_KEY
+from framework.context_pool import WARM_POOL_KEY
+from framework.context_reuse import CONTEXT_REUSE_KEY
+from framework.resources import DEFAULT_INTERVAL_MS, DEFAULT_LEAK_DISK_MB, DEFAULT_REPORT, ObjectCounts
+from framework.resources import ResourceMonitor, ResourceRow, row_from_dict, row_to_dict, trend
+from framework.workers import is_distributed, is_worker, worker_id
+
+WORKEROUTPUT_KEY = "saucedemo_resources"
+TOP_ROWS = 10
+_MONITOR_KEY = pytest.StashKey[ResourceMonitor]()
+# worker id -> rows, in run order
+_MERGED_KEY = pytest.StashKey[Dict[str, List[ResourceRow]]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--resource-profile",
+        action="store",
+        nargs="?",
+        const=DEFAULT_REPORT,
+        default=None,
+        help="Sample RSS/CPU of the worker, Playwright driver and browsers per test, track the temp dir and "
+        f"flag leaked contexts, pages, processes and disk; write JSON to PATH (default {DEFAULT_REPORT}). "
+        "Env: RESOURCE_PROFILE.",
+    )
+    group.addoption(
+        "--resource-interval-ms",
+        action="store",
+        type=float,
+        default=DEFAULT_INTERVAL_MS,
+        help=f"Peak RSS sampling interval (default {DEFAULT_INTERVAL_MS}).",
+    )
+    group.addoption(
+        "--leak-disk-mb",
+        action="store",
+        type=float,
+        default=DEFAULT_LEAK_DISK_MB,
+        help=f"Temp dir growth per test reported as a disk leak (default {DEFAULT_LEAK_DISK_MB}).",
+    )
+
+
+def _report_path(config: pytest.Config) -> Optional[str]:
+    return config.getoption("resource_profile") or os.getenv("RESOURCE_PROFILE") or None
+
+
+def _tmp_root(config: pytest.Config) -> Optional[Path]:
+    manager = config.stash.get(BROWSER_MANAGER_KEY, None)
+    return manager.tmp_path_factory.getbasetemp() if manager is not None else None
+
+
+def _objects(config: pytest.Config) -> ObjectCounts:
+    manager = config.stash.get(BROWSER_MANAGER_KEY, None)
+    if manager is None:
+        return ObjectCounts()
+    pool = config.stash.get(WARM_POOL_KEY, None)
+    reuse = config.stash.get(CONTEXT_REUSE_KEY, None)
+    # Warm and shared read_only contexts are open on purpose between tests.
+    idle = {id(ctx) for ctx in pool.idle_contexts()} if pool is not None else set()
+    if reuse is not None:
+        idle.update(id(ctx) for ctx in reuse.contexts())
+    owned = [ctx for ctx in manager.live_contexts() if id(ctx) not in idle]
+    return ObjectCounts(len(owned), sum(len(ctx.pages) for ctx in owned), manager.resident())
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not _report_path(config):
+        return
+    config.stash[_MERGED_KEY] = {}
+    if is_distributed(config) and not is_worker(config):
+        return  # the controller runs no tests
+    config.stash[_MONITOR_KEY] = ResourceMonitor(
+        lambda: _tmp_root(config),
+        lambda: _objects(config),
+        interval_ms=config.getoption("resource_interval_ms"),
+        leak_disk_mb=config.getoption("leak_disk_mb"),
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: Optional[pytest.Item]):
+    monitor = item.config.stash.get(_MONITOR_KEY, None)
+    if monitor is None:
+        yield
+        return
+    monitor.begin()
+    yield
+    monitor.end(item.nodeid, [name for name in getattr(item, "fixturenames", ()) if not name.startswith("_")])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        data = json.loads(payload)
+        node.config.stash[_MERGED_KEY][data["worker"]] = [row_from_dict(r) for r in data["rows"]]
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    monitor = config.stash.get(_MONITOR_KEY, None)
+    if monitor is not None:
+        monitor.close()
+        if is_worker(config):
+            config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(
+                {"worker": worker_id(config), "rows": [row_to_dict(r) for r in monitor.rows]}
+            )
+            return
+        config.stash[_MERGED_KEY][worker_id(config)] = monitor.rows
+    merged = config.stash.get(_MERGED_KEY, None)
+    if merged is None or is_worker(config):
+        return
+    report: Dict[str, Any] = {
+        "workers": {
+            wid: {"trend": trend(rows), "tests": [row_to_dict(r) for r in rows]} for wid, rows in sorted(merged.items())
+        }
+    }
+    path = Path(_report_path(config))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    merged = config.stash.get(_MERGED_KEY, None)
+    if not merged:
+        return
+    rows = [r for worker_rows in merged.values() for r in worker_rows]
+    tr = terminalreporter
+    tr.write_sep("-", "resources")
+    if not any(r.rss_peak_mb for r in rows):
+        tr.write_line("process sampling unavailable (install psutil); temp dir and object leaks only")
+    for wid, worker_rows in sorted(merged.items()):
+        t = trend(worker_rows)
+        if t["tests"] >= 2:
+            tr.write_line(
+                f"{wid}: RSS {t['rss_first_mb']:.0f} -> {t['rss_last_mb']:.0f} MB over {t['tests']} tests "
+                f"(peak {t['rss_max_mb']:.0f} MB, trend {t['slope_mb_per_100']:+.1f} MB/100 tests)"
+            )
+    tr.write_line(f"{'test':<60} {'peak MB':>8} {'browsers':>8} {'dRSS':>7} {'CPU s':>6} {'tmp MB':>7}")
+    for r in sorted(rows, key=lambda r: r.rss_peak_mb, reverse=True)[:TOP_ROWS]:
+        tr.write_line(
+            f"{r.nodeid[-60:]:<60} {r.rss_peak_mb:8.0f} {r.browser_peak_mb:8.0f} {r.rss_delta_mb:+7.1f} "
+            f"{r.cpu_s:6.2f} {r.tmp_delta_mb:7.2f}"
+        )
+    leaking = [r for r in rows if r.leaks]
+    if leaking:
+        tr.write_line(f"possible leaks in {len(leaking)} tests:")
+        for r in leaking:
+            found = ", ".join(f"{k}={v:g}" for k, v in r.leaks.items())
+            tr.write_line(f"  {r.nodeid}: {found} (fixtures: {', '.join(r.fixtures)})")
+    tr.write_line(f"full table -> {_report_path(config)}")
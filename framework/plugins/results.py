@@ -0,0 +1,168 @@
+"""Results streaming: every test's outcome, timings and steps go to a local store as the run progresses."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import time
+import uuid
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from framework.browser import resolve_browser_name
+from framework.instrumentation import STEP_RECORDER_KEY
+from framework.results.store import DEFAULT_STORE, ResultWriter, TestResult, open_sink, store_path
+from framework.workers import is_distributed, is_worker, worker_id
+
+RUN_ID_INPUT = "saucedemo_results_run"
+WORKEROUTPUT_KEY = "saucedemo_results"
+_STREAM_KEY = pytest.StashKey["ResultStream"]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--results-store",
+        action="store",
+        nargs="?",
+        const=DEFAULT_STORE,
+        default=None,
+        help=f"Stream test outcomes, durations and page-object steps to PATH (default {DEFAULT_STORE}; "
+        ".ndjson/.jsonl for newline-delimited JSON, else SQLite). Query with python -m framework.results. "
+        "Env: RESULTS_STORE.",
+    )
+    group.addoption(
+        "--results-label",
+        action="store",
+        default=None,
+        help="Label stored with the run, e.g. nightly (filter with --label). Env: RESULTS_LABEL.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    path = store_path(config)
+    if not path:
+        return
+    run_id = config.workerinput[RUN_ID_INPUT] if is_worker(config) else uuid.uuid4().hex[:12]
+    stream = ResultStream(config, Path(path), run_id)
+    config.stash[_STREAM_KEY] = stream
+    config.pluginmanager.register(stream, "saucedemo-results")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    stream = node.config.stash.get(_STREAM_KEY, None)
+    if stream is not None:
+        node.workerinput[RUN_ID_INPUT] = stream.run_id
+
+
+class ResultStream:
+    """Queues one ``tests`` row (plus its ``steps``) per finished test; the controller owns the ``runs`` row.
+
+    Step rows need the step recorder, which --results-store turns on (framework/plugins/steps.py).
+    """
+
+    def __init__(self, config: pytest.Config, path: Path, run_id: str) -> None:
+        self.config = config
+        self.path = path
+        self.run_id = run_id
+        self.browser = resolve_browser_name(config)
+        self.worker = worker_id(config)
+        self.markers = {line.split(":", 1)[0].split("(", 1)[0].strip() for line in config.getini("markers")}
+        # The controller of a -n run sees every report, but the workers write the tests.
+        self.runs_tests = is_worker(config) or not is_distributed(config)
+        self.started = time.time()
+        self.writer = ResultWriter(lambda: open_sink(path))
+        self._results: Dict[str, TestResult] = {}
+        self._props: Dict[str, Dict[str, object]] = {}
+
+    def _run_row(self, finished: Optional[float] = None, tests: Optional[int] = None, failed: Optional[int] = None):
+        return {
+            "run_id": self.run_id,
+            "started": self.started,
+            "finished": finished,
+            "label": self.config.getoption("results_label") or os.getenv("RESULTS_LABEL") or None,
+            "markexpr": self.config.getoption("markexpr") or None,
+            "browser": self.browser,
+            "host": platform.node(),
+            "workers": self.config.getoption("numprocesses", default=None) or 1,
+            "tests": tests,
+            "failed": failed,
+        }
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        if not is_worker(self.config):
+            self.writer.put("runs", self._run_row())
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if not self.runs_tests:
+            return
+        self._results.setdefault(report.nodeid, TestResult(report.nodeid)).add(report)
+        self._props[report.nodeid] = dict(report.user_properties)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem: Optional[pytest.Item]):
+        recorder = self.config.stash.get(STEP_RECORDER_KEY, None)
+        first_sample = len(recorder.samples) if recorder is not None else 0
+        yield
+        result = self._results.pop(item.nodeid, None)
+        if result is None:
+            return
+        props = self._props.pop(item.nodeid, {})
+        self.writer.put(
+            "tests",
+            result.row(
+                self.run_id,
+                browser=props.get("browser_target") or self.browser,
+                user=props.get("user"),
+                worker=self.worker,
+                markers=" ".join(sorted({m.name for m in item.iter_markers()} & self.markers)),
+            ),
+        )
+        if recorder is None:
+            return
+        for sample in recorder.samples[first_sample:]:
+            if sample["test"] == item.nodeid:
+                self.writer.put(
+                    "steps",
+                    {
+                        "run_id": self.run_id,
+                        "nodeid": item.nodeid,
+                        "action": sample["action"],
+                        "seconds": sample["seconds"],
+                        "round_trips": sample["round_trips"],
+                        "wait_seconds": sample["wait_seconds"],
+                    },
+                )
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if not is_worker(self.config):
+            self.writer.put("runs", self._run_row(time.time(), session.testscollected, session.testsfailed))
+        self.writer.close()
+        if is_worker(self.config):
+            self.config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(asdict(self.writer.stats))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error) -> None:
+        payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+        if payload:
+            self.writer.stats.merge(json.loads(payload))
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        s = self.writer.stats
+        tr = terminalreporter
+        tr.write_sep("-", "results store")
+        where = f"{self.path} (run {self.run_id})"
+        if s.error is not None:
+            tr.write_line(f"writing to {where} failed: {s.error}; {s.dropped} rows dropped")
+            return
+        tr.write_line(
+            f"{s.rows} rows in {s.batches} batches, {s.write_s * 1000:.0f} ms writing off the test thread, "
+            f"max queued {s.max_queued} -> {where}"
+        )
+        tr.write_line(f"query: python -m framework.results --store {self.path} trends|flaky|steps")
@@ -0,0 +1,161 @@
+"""Context reuse for ``read_only`` tests: options, the shared inventory fixture and the summary."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Generator, Optional
+
+import pytest
+
+from framework.artifacts import ARTIFACT_RECORDER_KEY, FailureArtifacts
+from framework.auth import StorageStateCache, login_to_inventory
+from framework.browser import BrowserManager
+from framework.context_reuse import CONTEXT_REUSE_KEY, RESET_MODES, ContextReuse, ReuseStats
+from framework.matrix import BrowserTarget
+from framework.network import NetworkRouter
+from framework.perf import PerfMonitor
+from framework.stats import describe
+from framework.workers import is_worker
+
+if TYPE_CHECKING:
+    from pages import InventoryPage
+
+WORKEROUTPUT_KEY = "saucedemo_reuse"
+_MERGED_KEY = pytest.StashKey[ReuseStats]()
+_FAILED_KEY = pytest.StashKey[bool]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--reuse-contexts",
+        action="store_true",
+        default=False,
+        help="Tests marked read_only share one logged-in standard_user context per worker, reset "
+        "between tests. Env: REUSE_CONTEXTS=1.",
+    )
+    group.addoption(
+        "--reuse-reset",
+        action="store",
+        choices=RESET_MODES,
+        default=None,
+        help="How shared contexts are reset: storage (clear localStorage, default) or menu (the app's "
+        "Reset App State); both then reload the inventory. Env: REUSE_RESET.",
+    )
+
+
+def _enabled(config: pytest.Config) -> bool:
+    return config.getoption("reuse_contexts") or os.getenv("REUSE_CONTEXTS", "0") == "1"
+
+
+def _reset_mode(config: pytest.Config) -> str:
+    return config.getoption("reuse_reset") or os.getenv("REUSE_RESET", "storage")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if _reset_mode(config) not in RESET_MODES:
+        raise pytest.UsageError(f"REUSE_RESET must be one of {', '.join(RESET_MODES)}")
+    config.stash[_MERGED_KEY] = ReuseStats()
+
+
+@pytest.fixture(scope="session")
+def context_reuse(
+    pytestconfig: pytest.Config,
+    browser_manager: BrowserManager,
+    base_url: str,
+    users_data: Dict[str, Any],
+    auth_cache: StorageStateCache,
+    network_router: Optional[NetworkRouter],
+    failure_artifacts: Optional[FailureArtifacts],
+    perf_monitor: Optional[PerfMonitor],
+) -> Generator[Optional[ContextReuse], Any, None]:
+    """Per-worker shared contexts for read_only tests; None unless --reuse-contexts."""
+    if not _enabled(pytestconfig):
+        yield None
+        return
+
+    def on_create(ctx):
+        if network_router is not None:
+            network_router.install(ctx)
+        if perf_monitor is not None:
+            perf_monitor.install(ctx)
+        return failure_artifacts.attach(ctx) if failure_artifacts is not None else None
+
+    def on_discard(shared, nodeid):
+        if shared.recorder is not None:
+            failure_artifacts.finish(shared.recorder, nodeid)
+
+    reuse = ContextReuse(
+        browser_manager,
+        base_url,
+        lambda page, username: login_to_inventory(page, base_url, users_data, auth_cache, username),
+        reset=_reset_mode(pytestconfig),
+        on_create=on_create,
+        on_discard=on_discard,
+    )
+    pytestconfig.stash[CONTEXT_REUSE_KEY] = reuse
+    yield reuse
+    reuse.close()
+
+
+@pytest.fixture
+def shared_inventory(
+    request: pytest.FixtureRequest,
+    context_reuse: Optional[ContextReuse],
+    browser_target: BrowserTarget,
+) -> Generator[Optional[InventoryPage], Any, None]:
+    """standard_user's inventory on the worker's shared context for read_only tests, else None."""
+    if context_reuse is None or request.node.get_closest_marker("read_only") is None:
+        yield None
+        return
+    shared, inventory = context_reuse.checkout(browser_target.name, browser_target.channel)
+    if shared.recorder is not None:
+        shared.recorder.events.clear()  # the event ring of a failure covers this test only
+        request.node.stash[ARTIFACT_RECORDER_KEY] = shared.recorder
+    yield inventory
+    if request.node.stash.get(_FAILED_KEY, False):
+        context_reuse.failed(browser_target.name, browser_target.channel, request.node.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    if outcome.get_result().failed:
+        item.stash[_FAILED_KEY] = True
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash[_MERGED_KEY].merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    reuse = config.stash.get(CONTEXT_REUSE_KEY, None)
+    if reuse is None:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(reuse.stats.as_dict())
+    else:
+        config.stash[_MERGED_KEY].merge(reuse.stats.as_dict())
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    stats = config.stash.get(_MERGED_KEY, None)
+    if stats is None or not stats.created:
+        return
+    tr = terminalreporter
+    tr.write_sep("-", f"context reuse ({_reset_mode(config)} reset)")
+    tr.write_line(
+        f"read_only tests: {stats.created + stats.reused}, reused: {stats.reused}, contexts created: "
+        f"{stats.created}, discarded after failures: {stats.discarded_failed}"
+    )
+    if stats.reset:
+        d = describe(stats.reset)
+        tr.write_line(f"reset: mean {d['mean'] * 1000:.1f} ms, p95 {d['p95'] * 1000:.1f} ms")
+    if stats.leaks:
+        reasons = ", ".join(f"{reason} x{n}" for reason, n in sorted(stats.leaks.items()))
+        tr.write_line(f"leaked state (fresh context used): {reasons}")
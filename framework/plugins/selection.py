@@ -0,0 +1,166 @@
+"""History-driven test selection and ordering.
+
+Every run records per-test duration and outcome (keyed by nodeid and browser, with the test's
+markers) in ``.pytest_cache``. On top of that:
+
+- ``pytest -n N`` runs (and serial runs with --smart-order) are ordered fail-first, then
+  longest-first, for early feedback and good parallel packing;
+- ``--time-budget M`` keeps the highest-value subset that fits in M minutes of wall time
+  (value = markers + failure history + never-run bonus, per estimated second);
+- ``--skip-unchanged`` skips tests that passed last time against the same test file, page
+  objects, fixtures, framework code and test data.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+
+from framework.browser import resolve_browser_name
+from framework.history import RunHistory, SourceFingerprints
+from framework.workers import is_distributed, is_worker, worker_count
+
+WORKEROUTPUT_KEY = "saucedemo_selection"
+# Worst outcome over setup/call/teardown wins.
+_OUTCOME_RANK = {"passed": 0, "skipped": 1, "failed": 2}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--smart-order",
+        action="store_true",
+        default=False,
+        help="Order serial runs fail-first, then longest-first (always on for pytest -n N).",
+    )
+    group.addoption(
+        "--time-budget",
+        action="store",
+        type=float,
+        default=None,
+        metavar="MINUTES",
+        help="Run only the highest-value tests that fit in MINUTES of wall time (per the run history). "
+        "Env: TIME_BUDGET_MIN.",
+    )
+    group.addoption(
+        "--skip-unchanged",
+        action="store_true",
+        default=False,
+        help="Skip tests that passed last time and whose test file, page objects, fixtures and data are unchanged.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.pluginmanager.register(HistorySelection(config), "saucedemo-selection")
+
+
+def _registered_markers(config: pytest.Config) -> Set[str]:
+    return {line.split(":", 1)[0].split("(", 1)[0].strip() for line in config.getini("markers")}
+
+
+class HistorySelection:
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.history = RunHistory.load(config, resolve_browser_name(config))
+        self.fingerprints = SourceFingerprints(config.rootpath)
+        self.ordered = config.getoption("smart_order") or (
+            is_distributed(config) and not config.getoption("no_duration_schedule")
+        )
+        budget = config.getoption("time_budget") or os.getenv("TIME_BUDGET_MIN")
+        self.budget_s: Optional[float] = float(budget) * 60 if budget else None
+        self.skip_unchanged = config.getoption("skip_unchanged")
+        self.markers = _registered_markers(config)
+        self.summary: Dict[str, Any] = {}
+        self._durations: Dict[str, float] = defaultdict(float)
+        self._outcomes: Dict[str, str] = {}
+        self._test_markers: Dict[str, List[str]] = {}
+
+    def _unchanged(self, item: pytest.Item) -> bool:
+        record = self.history.record(item.nodeid)
+        return (
+            record is not None
+            and record.last_outcome == "passed"
+            and record.green_fingerprint is not None
+            and record.green_fingerprint == self.fingerprints.for_nodeid(item.nodeid)
+        )
+
+    # Runs after -m/-k deselection, on every xdist worker (same history, same result).
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: List[pytest.Item]) -> None:
+        runnable = items
+        if self.skip_unchanged:
+            unchanged = [item for item in items if self._unchanged(item)]
+            for item in unchanged:
+                item.add_marker(pytest.mark.skip(reason="unchanged since last green run"))
+            self.summary["unchanged"] = len(unchanged)
+            runnable = [item for item in items if item not in unchanged]
+
+        if self.budget_s is not None:
+            capacity = self.budget_s * worker_count(config)
+            selected, dropped = self.history.within_budget(runnable, capacity)
+            if dropped:
+                config.hook.pytest_deselected(items=dropped)
+                dropped_ids = {item.nodeid for item in dropped}
+                items[:] = [item for item in items if item.nodeid not in dropped_ids]
+            estimates = self.history.estimate(item.nodeid for item in selected)
+            self.summary["budget"] = {
+                "minutes": self.budget_s / 60,
+                "selected": len(selected),
+                "dropped": len(dropped),
+                "estimated_s": sum(estimates.values()) / worker_count(config),
+            }
+
+        if self.ordered:
+            items[:] = self.history.fail_first(items)
+            self.summary["ordered"] = True
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        # Workers forward every report to the controller; only record there (or in serial runs).
+        if is_worker(self.config):
+            return
+        nodeid = report.nodeid
+        self._durations[nodeid] += report.duration
+        if _OUTCOME_RANK[report.outcome] >= _OUTCOME_RANK[self._outcomes.get(nodeid, "passed")]:
+            self._outcomes[nodeid] = report.outcome
+        self._test_markers[nodeid] = sorted(k for k in report.keywords if k in self.markers)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error) -> None:
+        payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+        if payload and not self.summary:
+            self.summary = json.loads(payload)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if is_worker(self.config):
+            self.config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(self.summary)
+            return
+        for nodeid, outcome in self._outcomes.items():
+            # Skipped tests (including unchanged ones) keep their previous record.
+            if outcome == "skipped":
+                continue
+            self.history.record_duration(nodeid, self._durations[nodeid])
+            self.history.record_outcome(
+                nodeid, outcome, self.fingerprints.for_nodeid(nodeid), self._test_markers.get(nodeid, [])
+            )
+        if self._outcomes:
+            self.history.save(self.config)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not (self.summary.get("budget") or self.summary.get("unchanged") or self.config.getoption("smart_order")):
+            return
+        tr = terminalreporter
+        tr.write_sep("-", "test selection")
+        if self.summary.get("ordered"):
+            tr.write_line("order: fail-first, then longest-first")
+        if "unchanged" in self.summary:
+            tr.write_line(f"skipped unchanged since last green run: {self.summary['unchanged']}")
+        budget = self.summary.get("budget")
+        if budget:
+            tr.write_line(
+                f"time budget {budget['minutes']:.1f} min: {budget['selected']} selected, "
+                f"{budget['dropped']} deselected, estimated {budget['estimated_s']:.1f} s wall"
+            )
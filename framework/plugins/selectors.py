@@ -0,0 +1,45 @@
+"""Opt-in startup validation of the selector registry."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from framework.browser import resolve_browser_name, resolve_channel
+from framework.selector_check import format_report, validate_selectors
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--validate-selectors",
+        action="store_true",
+        default=False,
+        help="Check every registered selector against the live pages once per worker before the first test; "
+        "a broken selector errors all tests immediately. Env: VALIDATE_SELECTORS=1.",
+    )
+
+
+def _enabled(config: pytest.Config) -> bool:
+    if config.getoption("validate_selectors"):
+        return True
+    return os.getenv("VALIDATE_SELECTORS", "0").strip().lower() in {"1", "true", "yes", "y"}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def selector_validation(request: pytest.FixtureRequest, pytestconfig: pytest.Config) -> None:
+    if not _enabled(pytestconfig):
+        return
+    # Resolved lazily so runs without the option never start a browser here.
+    manager = request.getfixturevalue("browser_manager")
+    base_url = request.getfixturevalue("base_url")
+    ctx = manager.acquire(resolve_browser_name(pytestconfig), resolve_channel(pytestconfig))
+    started = time.perf_counter()
+    try:
+        broken = validate_selectors(ctx.new_page(), base_url)
+    finally:
+        manager.release(ctx)
+    if broken:
+        pytest.fail(format_report(broken, time.perf_counter() - started), pytrace=False)
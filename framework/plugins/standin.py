@@ -0,0 +1,64 @@
+"""Local SauceDemo stand-in: options and the session fixture that serves it."""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Generator, Optional
+
+import pytest
+
+from framework.standin import StandinServer
+from framework.standin.server import DEFAULT_GLITCH_LATENCY_MS
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--standin",
+        action="store_true",
+        default=False,
+        help="Run against the bundled local SauceDemo stand-in instead of the live site. Env: SAUCEDEMO_STANDIN=1.",
+    )
+    group.addoption(
+        "--standin-latency-ms",
+        action="store",
+        type=int,
+        default=None,
+        help="Latency injected into every stand-in response. Env: STANDIN_LATENCY_MS.",
+    )
+    group.addoption(
+        "--standin-glitch-ms",
+        action="store",
+        type=int,
+        default=None,
+        help=f"Extra page-load latency for performance_glitch_user (default {DEFAULT_GLITCH_LATENCY_MS}). "
+        "Env: STANDIN_GLITCH_MS.",
+    )
+
+
+def standin_enabled(config: pytest.Config) -> bool:
+    if config.getoption("standin"):
+        return True
+    return os.getenv("SAUCEDEMO_STANDIN", "").strip().lower() in {"1", "true", "yes", "y"}
+
+
+def _int_option(config: pytest.Config, name: str, env: str, default: int) -> int:
+    value = config.getoption(name)
+    if value is None:
+        value = int(os.getenv(env, default))
+    return value
+
+
+@pytest.fixture(scope="session")
+def standin_server(pytestconfig: pytest.Config) -> Generator[Optional[StandinServer], Any, None]:
+    """Stand-in server on a free port for this worker, or None when running against a real site."""
+    if not standin_enabled(pytestconfig):
+        yield None
+        return
+
+    server = StandinServer(
+        latency_ms=_int_option(pytestconfig, "standin_latency_ms", "STANDIN_LATENCY_MS", 0),
+        glitch_latency_ms=_int_option(pytestconfig, "standin_glitch_ms", "STANDIN_GLITCH_MS", DEFAULT_GLITCH_LATENCY_MS),
+    ).start()
+    yield server
+    server.stop()
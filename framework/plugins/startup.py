@@ -0,0 +1,170 @@
+"""Startup-optimized collection (--fast-startup) and the startup-time report (--startup-report)."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import pytest
+
+from framework.browser import LAUNCH_STATS_KEY
+from framework.startup import DEFAULT_REPORT, CollectionCache, ItemMarks, StartupTimes
+from framework.startup import compile_markexpr, process_started_at
+from framework.workers import is_worker, worker_id
+
+WORKEROUTPUT_KEY = "saucedemo_startup"
+_TRUTHY = {"1", "true", "yes", "y"}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--fast-startup",
+        action="store_true",
+        default=False,
+        help="Cache each test file's markers; with -m, don't import unchanged test files that have no matching "
+        "test. Env: FAST_STARTUP=1.",
+    )
+    group.addoption(
+        "--startup-report",
+        action="store",
+        nargs="?",
+        const=DEFAULT_REPORT,
+        default=None,
+        help="Report imports, collection, driver spawn, first browser and first test times per worker; write JSON "
+        f"to PATH (default {DEFAULT_REPORT}). Env: STARTUP_REPORT.",
+    )
+
+
+def _report_path(config: pytest.Config) -> Optional[str]:
+    path = config.getoption("startup_report") or os.getenv("STARTUP_REPORT") or None
+    return DEFAULT_REPORT if path and path.strip().lower() in _TRUTHY else path
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    fast = config.getoption("fast_startup") or os.getenv("FAST_STARTUP", "").strip().lower() in _TRUTHY
+    report = _report_path(config)
+    if fast or report:
+        config.pluginmanager.register(StartupMonitor(config, fast, report), "saucedemo-startup")
+
+
+class StartupMonitor:
+    def __init__(self, config: pytest.Config, fast: bool, report: Optional[str]) -> None:
+        configured = time.time()
+        started = process_started_at()
+        self.config = config
+        self.report = report
+        self.times = StartupTimes(
+            worker=worker_id(config),
+            origin=started or configured,
+            imported_at=configured - started if started else None,
+        )
+        self.workers: Dict[str, StartupTimes] = {}
+        self.cache: Optional[CollectionCache] = CollectionCache.load(config) if fast else None
+        self.predicate: Optional[Callable[[ItemMarks], bool]] = None
+        self.explicit: Set[Path] = set()
+        self._collect_started: Optional[float] = None
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        if self.cache is None:
+            return
+        self.predicate = compile_markexpr(self.config.option.markexpr)
+        invocation_dir = self.config.invocation_params.dir
+        self.explicit = {(invocation_dir / arg.split("::", 1)[0]).resolve() for arg in self.config.args}
+
+    def pytest_ignore_collect(self, collection_path: Path, config: pytest.Config) -> Optional[bool]:
+        if self.predicate is None or self.cache is None or collection_path in self.explicit:
+            return None
+        cached = self.cache.cached_marks(collection_path)
+        if cached is None or any(self.predicate(marks) for marks in cached):
+            return None
+        self.times.files_skipped += 1
+        self.times.tests_skipped += len(cached)
+        return True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session: pytest.Session):
+        started = time.time()
+        yield
+        self.times.collection_s = time.time() - started
+        self.times.collected_at = self.times.since_origin(time.time())
+
+    # Before -m/-k deselection: the cache must describe every test of the file.
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, items: List[pytest.Item]) -> None:
+        if self.cache is not None:
+            self.cache.record(items)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> None:
+        if self.times.first_test_at is None:
+            self.times.first_test_at = self.times.since_origin(time.time())
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error) -> None:
+        payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+        if not payload:
+            return
+        data = json.loads(payload)
+        times = StartupTimes(**data["times"])
+        self.workers[times.worker] = times
+        if self.cache is not None:
+            # Every worker collects the same tests; the first one's entries are enough.
+            for relpath, entry in data["collection"].items():
+                self.cache.collected.setdefault(relpath, entry)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        stats = self.config.stash.get(LAUNCH_STATS_KEY, None)
+        if stats is not None:
+            self.times.driver_start_s = stats.driver_start_s
+            self.times.first_launch_s = stats.first_launch_s
+            self.times.browser_ready_at = self.times.since_origin(stats.first_ready_at)
+        if is_worker(self.config):
+            self.config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(
+                {"times": self.times.as_dict(), "collection": self.cache.collected if self.cache else {}}
+            )
+            return
+        if self.cache is not None:
+            self.cache.save(self.config)
+        if self.report:
+            path = Path(self.report)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            report: Dict[str, Any] = {wid: times.as_dict() for wid, times in sorted(self._rows().items())}
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    def _rows(self) -> Dict[str, StartupTimes]:
+        # Under xdist the controller runs no tests: its own timeline only shows its imports.
+        return self.workers or {self.times.worker: self.times}
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if is_worker(self.config):
+            return
+        tr = terminalreporter
+        tr.write_sep("-", "startup")
+        if self.report:
+            tr.write_line(
+                f"{'worker':<8} {'imports':>8} {'collect':>8} {'collected':>10} {'driver':>8} "
+                f"{'launch':>8} {'browser up':>11} {'1st test':>9}"
+            )
+
+            def cell(seconds: Optional[float], width: int) -> str:
+                return f"{seconds:>{width - 1}.2f}s" if seconds is not None else f"{'-':>{width}}"
+
+            for wid, t in sorted(self._rows().items()):
+                tr.write_line(
+                    f"{wid:<8} {cell(t.imported_at, 8)} {cell(t.collection_s, 8)} {cell(t.collected_at, 10)} "
+                    f"{cell(t.driver_start_s, 8)} {cell(t.first_launch_s, 8)} {cell(t.browser_ready_at, 11)} "
+                    f"{cell(t.first_test_at, 9)}"
+                )
+            tr.write_line("(imports, collected, browser up and 1st test: seconds since process start)")
+        if self.cache is not None:
+            times = next(iter(self._rows().values()))
+            tr.write_line(
+                f"collection cache: {times.files_skipped} test files not imported "
+                f"({times.tests_skipped} tests outside -m)"
+            )
+        if self.report:
+            tr.write_line(f"-> {self.report}")
@@ -0,0 +1,124 @@
+"""Per-step timing report: page-object actions and conftest fixture setup/teardown."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from framework.instrumentation import STEP_RECORDER_KEY, Instrumentation, StepRecorder
+from framework.instrumentation import page_object_classes, summarize_samples
+from framework.results.store import store_path
+from framework.workers import is_worker
+
+DEFAULT_REPORT = "test-results/step-timings.json"
+WORKEROUTPUT_KEY = "saucedemo_steps"
+_INSTRUMENTATION_KEY = pytest.StashKey[Instrumentation]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--step-report",
+        action="store",
+        nargs="?",
+        const=DEFAULT_REPORT,
+        default=None,
+        help=f"Time every page-object action and conftest fixture; write JSON to PATH (default {DEFAULT_REPORT}) "
+        "and print p50/p95 per action. Env: STEP_REPORT.",
+    )
+
+
+def _report_path(config: pytest.Config) -> Optional[str]:
+    return config.getoption("step_report") or os.getenv("STEP_REPORT") or None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # The results store (framework/plugins/results.py) streams the steps of every test too.
+    if not _report_path(config) and not store_path(config):
+        return
+    recorder = StepRecorder()
+    instrumentation = Instrumentation(recorder)
+    instrumentation.install_pages(page_object_classes())
+    instrumentation.install_driver()
+    config.stash[STEP_RECORDER_KEY] = recorder
+    config.stash[_INSTRUMENTATION_KEY] = instrumentation
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    instrumentation = config.stash.get(_INSTRUMENTATION_KEY, None)
+    if instrumentation is not None:
+        instrumentation.uninstall()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: Optional[pytest.Item]):
+    recorder = item.config.stash.get(STEP_RECORDER_KEY, None)
+    if recorder is not None:
+        recorder.current_test = item.nodeid
+    yield
+    if recorder is not None:
+        recorder.current_test = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef: pytest.FixtureDef, request: pytest.FixtureRequest):
+    recorder = request.config.stash.get(STEP_RECORDER_KEY, None)
+    if recorder is None or getattr(fixturedef.func, "__module__", None) != "conftest":
+        yield
+        return
+
+    name = f"fixture:{fixturedef.argname}"
+    teardown_started = []
+    # Finalizers run LIFO: this one runs after the fixture's own teardown...
+    fixturedef.addfinalizer(
+        lambda: teardown_started and recorder.record(f"{name}:teardown", time.perf_counter() - teardown_started[0])
+    )
+    started = time.perf_counter()
+    yield
+    recorder.record(f"{name}:setup", time.perf_counter() - started)
+    # ...and this one right before it.
+    fixturedef.addfinalizer(lambda: teardown_started.append(time.perf_counter()))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    recorder = node.config.stash.get(STEP_RECORDER_KEY, None)
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if recorder is not None and payload:
+        recorder.samples.extend(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    recorder = config.stash.get(STEP_RECORDER_KEY, None)
+    if recorder is None or not _report_path(config):
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(recorder.samples)
+        return
+
+    path = Path(_report_path(config))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {"summary": summarize_samples(recorder.samples), "samples": recorder.samples}
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    recorder = config.stash.get(STEP_RECORDER_KEY, None)
+    if recorder is None or not recorder.samples or not _report_path(config):
+        return
+
+    tr = terminalreporter
+    tr.write_sep("-", "step timings")
+    tr.write_line(f"{'action':<48} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} {'total s':>8} {'trips':>6} {'wait%':>6}")
+    for row in summarize_samples(recorder.samples):
+        tr.write_line(
+            f"{row['action'][:48]:<48} {row['calls']:>6} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} "
+            f"{row['total_s']:>8.2f} {row['round_trips']:>6.1f} {row['wait_share'] * 100:>5.0f}%"
+        )
+    tr.write_line(f"step report: {_report_path(config)}")
@@ -0,0 +1,109 @@
+"""User matrix: expands ``users``-marked tests over data/users.json and reports per-user timings."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import pytest
+
+from framework.users import BASELINE_USER, USER_TIMINGS_KEY, UserCase, UserTimings, load_users, user_cases
+from framework.workers import is_worker
+
+if TYPE_CHECKING:
+    from pages import InventoryPage
+
+DEFAULT_REPORT = "test-results/user-timings.json"
+CACHE_KEY = "saucedemo/user-timings"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    timings = UserTimings()
+    config.stash[USER_TIMINGS_KEY] = timings
+    config.pluginmanager.register(UserMatrixReporter(config, timings), "saucedemo-users")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    marker = metafunc.definition.get_closest_marker("users")
+    if marker is None or "user" not in metafunc.fixturenames:
+        return
+    params = [
+        pytest.param(case, id=case.username, marks=[pytest.mark.known_bug] if case.kind == "known_bug" else [])
+        for case in user_cases(load_users(), marker.args)
+    ]
+    metafunc.parametrize("user", params, indirect=True)
+
+
+@pytest.fixture
+def user(request: pytest.FixtureRequest) -> UserCase:
+    """The user of this matrix case; ``standard_user`` for tests without ``@pytest.mark.users``."""
+    case: Optional[UserCase] = getattr(request, "param", None)
+    if case is None:
+        case = next(c for c in user_cases(load_users()) if c.username == BASELINE_USER)
+    request.node.user_properties.append(("user", case.username))
+    return case
+
+
+@pytest.fixture
+def user_inventory(login, user: UserCase, request: pytest.FixtureRequest) -> InventoryPage:
+    """Inventory page logged in as ``user`` (storage state shared per user); times the login."""
+    started = time.perf_counter()
+    inv = login(user.username)
+    inv.is_at()
+    request.node.user_properties.append(("user_login_s", time.perf_counter() - started))
+    return inv
+
+
+class UserMatrixReporter:
+    """Collects per-user durations on the controller; prints and stores them with the last run's."""
+
+    def __init__(self, config: pytest.Config, timings: UserTimings) -> None:
+        self.config = config
+        self.timings = timings
+        self.previous: Dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if is_worker(self.config) or report.when != "call":
+            return
+        props = dict(report.user_properties)
+        if "user" in props:
+            self.timings.record(props["user"], report.duration, props.get("user_login_s"), report.failed)
+
+    def _previous(self) -> Dict[str, Any]:
+        cache = getattr(self.config, "cache", None)
+        return cache.get(CACHE_KEY, {}) if cache is not None else {}
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if is_worker(self.config) or not self.timings.calls:
+            return
+        rows = self.timings.summary()
+        self.previous = self._previous()
+        path = Path(DEFAULT_REPORT)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        cache = getattr(self.config, "cache", None)
+        if cache is not None:
+            logins = {user: row["login"]["mean"] for user, row in rows.items() if row["login"]["n"]}
+            cache.set(CACHE_KEY, {**self.previous, **logins})
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if is_worker(self.config) or not self.timings.calls:
+            return
+        previous = self.previous
+        tr = terminalreporter
+        tr.write_sep("-", "user matrix")
+        tr.write_line(
+            f"{'user':<26} {'tests':>5} {'failed':>6} {'call p50':>9} {'login':>8} {'vs std':>7} {'last run':>9}"
+        )
+        for user, row in sorted(self.timings.summary().items()):
+            login = row["login"]
+            ratio = row["login_vs_baseline"]
+            tr.write_line(
+                f"{user:<26} {row['tests']:>5} {row['failed']:>6} {row['call']['p50']:>8.2f}s "
+                + (f"{login['mean']:>7.2f}s" if login["n"] else f"{'-':>8}")
+                + (f" {ratio:>6.1f}x" if ratio is not None else f" {'-':>7}")
+                + (f" {previous[user]:>8.2f}s" if user in previous else f" {'-':>9}")
+            )
+        tr.write_line(f"-> {DEFAULT_REPORT}")
@@ -0,0 +1,102 @@
+"""Visual regression: the ``visual`` fixture, baseline update mode and the comparison summary."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from framework.browser import resolve_viewport
+from framework.matrix import BrowserTarget
+from framework.visual import DEFAULT_DIFF_DIR, VISUAL_MODES, VisualCheck, VisualEngine, VisualStats, baseline_dir
+from framework.workers import is_worker
+
+WORKEROUTPUT_KEY = "saucedemo_visual"
+_ENGINE_KEY = pytest.StashKey[VisualEngine]()
+_MERGED_KEY = pytest.StashKey[VisualStats]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--visual",
+        action="store",
+        choices=VISUAL_MODES,
+        default=None,
+        help="check: compare captures with the baselines; a missing baseline fails (default). update: record "
+        "missing baselines and rewrite the ones that differ. off: skip visual checks. Env: VISUAL.",
+    )
+    group.addoption("--visual-diff-dir", action="store", default=DEFAULT_DIFF_DIR, help=f"Default {DEFAULT_DIFF_DIR}.")
+
+
+def _mode(config: pytest.Config) -> str:
+    return config.getoption("visual") or os.getenv("VISUAL", "check")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if _mode(config) not in VISUAL_MODES:
+        raise pytest.UsageError(f"VISUAL must be one of {', '.join(VISUAL_MODES)}")
+    config.stash[_MERGED_KEY] = VisualStats()
+
+
+@pytest.fixture(scope="session")
+def visual_engine(pytestconfig: pytest.Config) -> Optional[VisualEngine]:
+    """Per-worker comparator (keeps decoded baselines in memory), or None with --visual off."""
+    mode = _mode(pytestconfig)
+    if mode == "off":
+        return None
+    engine = VisualEngine(Path(pytestconfig.getoption("visual_diff_dir")), update=mode == "update")
+    pytestconfig.stash[_ENGINE_KEY] = engine
+    return engine
+
+
+@pytest.fixture
+def visual(
+    request: pytest.FixtureRequest,
+    visual_engine: Optional[VisualEngine],
+    browser_target: BrowserTarget,
+    base_url: str,
+):
+    """``visual(page_object, "name", ...)`` compares a capture with its baseline (framework/visual.py)."""
+    if visual_engine is None:
+        return lambda *args, **kwargs: None
+    directory = baseline_dir(request.config.rootpath, base_url, browser_target.id, resolve_viewport())
+    return VisualCheck(visual_engine, directory, request.node)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash[_MERGED_KEY].merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    engine = config.stash.get(_ENGINE_KEY, None)
+    if engine is None:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(engine.stats.seconds)
+    else:
+        config.stash[_MERGED_KEY].merge(engine.stats.seconds)
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    stats = config.stash.get(_MERGED_KEY, None)
+    if stats is None or not stats.seconds:
+        return
+    tr = terminalreporter
+    tr.write_sep("-", f"visual regression ({_mode(config)})")
+    tr.write_line(f"{'outcome':<18} {'count':>6} {'mean ms':>8} {'p95 ms':>8}")
+    for outcome, d in stats.summary().items():
+        tr.write_line(f"{outcome:<18} {d['n']:>6} {d['mean'] * 1000:>8.1f} {d['p95'] * 1000:>8.1f}")
+    if "unchecked" in stats.seconds:
+        tr.write_line("pixel diffing unavailable (install numpy and Pillow): changed captures were not checked")
+    if "different" in stats.seconds:
+        tr.write_line(f"diff images -> {config.getoption('visual_diff_dir')}")
+    if "missing" in stats.seconds:
+        tr.write_line("missing baselines: record them with --visual update and commit visual-baselines/")
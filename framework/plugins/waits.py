@@ -0,0 +1,93 @@
+"""Adaptive waits: loads/saves the learned per-action timeouts and reports wait vs act time."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from framework.workers import is_worker
+from pages import waits
+from pages.waits import WaitEngine, WaitModel
+
+CACHE_KEY = "saucedemo/wait-timings"
+WORKEROUTPUT_KEY = "saucedemo_waits"
+LEARNED_WAITS = ("on", "off")
+SUMMARY_ROWS = 8
+_MERGED_KEY = pytest.StashKey[WaitEngine]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("saucedemo", "SauceDemo framework")
+    group.addoption(
+        "--learned-waits",
+        action="store",
+        choices=LEARNED_WAITS,
+        default=None,
+        help="on (default): page-object readiness checks use timeouts learned from earlier runs; "
+        f"off: the fixed {waits.DEFAULT_TIMEOUT_MS / 1000:.0f} s expect timeout, nothing is recorded. "
+        "Env: LEARNED_WAITS.",
+    )
+
+
+def _learned(config: pytest.Config) -> bool:
+    return (config.getoption("learned_waits") or os.getenv("LEARNED_WAITS", "on")) == "on"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not _learned(config):
+        # Not just no cache: a session's own waits must not move the timeouts either.
+        waits.ENGINE.model = WaitModel()
+        waits.ENGINE.learn = False
+        return
+    waits.ENGINE.learn = True
+    cache = getattr(config, "cache", None)
+    samples = cache.get(CACHE_KEY, {}) if cache is not None else {}
+    waits.ENGINE.model = WaitModel(samples)
+    config.stash[_MERGED_KEY] = WaitEngine(WaitModel(samples))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    payload = getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY)
+    if payload:
+        node.config.stash[_MERGED_KEY].merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    merged = config.stash.get(_MERGED_KEY, None)
+    if merged is None:
+        return
+    if is_worker(config):
+        config.workeroutput[WORKEROUTPUT_KEY] = json.dumps(waits.ENGINE.as_dict())
+        return
+    merged.merge(waits.ENGINE.as_dict())
+    cache = getattr(config, "cache", None)
+    if cache is not None and merged.ledger:
+        cache.set(CACHE_KEY, merged.model.samples)
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    engine = config.stash.get(_MERGED_KEY, None)
+    if engine is None or not engine.ledger:
+        return
+    rows = engine.ledger
+    wait_s = sum(r.wait_s for r in rows.values())
+    act_s = sum(r.act_s for r in rows.values())
+    timeouts = sum(r.timeouts for r in rows.values())
+    tr = terminalreporter
+    tr.write_sep("-", "adaptive waits")
+    total = wait_s + act_s or 1.0
+    tr.write_line(
+        f"waiting {wait_s:.2f} s ({wait_s / total:.0%}), acting {act_s:.2f} s ({act_s / total:.0%})"
+        + (f", {timeouts} readiness checks timed out" if timeouts else "")
+    )
+    for action, row in sorted(rows.items(), key=lambda kv: kv[1].wait_s, reverse=True)[:SUMMARY_ROWS]:
+        if not row.waits:
+            continue
+        tr.write_line(
+            f"  {action:<40} {row.waits:>5} waits  {row.wait_s / row.waits * 1000:7.1f} ms avg  "
+            f"timeout {engine.model.timeout_ms(action) / 1000:.1f} s"
+        )
@@ -0,0 +1,286 @@
+"""Per-test resource profiling of the worker's process tree, temp dir and browser objects.
+
+The tree is the pytest process itself, the Playwright driver (its direct children) and the
+browser processes below the driver. RSS and CPU come from psutil when installed, else from
+``/proc`` (Linux); elsewhere without psutil, only the temp dir and object counts are recorded.
+
+For every test (setup, call and teardown together) a :class:`ResourceRow` holds the tree's RSS
+before/after and its peak (sampled by a background thread), the CPU time used and the growth of
+the ``tmp_path_factory`` base dir. Still-open contexts and pages, extra child processes and temp
+dir growth left behind once teardown finished are reported as leaks.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_REPORT = "test-results/resources.json"
+DEFAULT_INTERVAL_MS = 200
+DEFAULT_LEAK_DISK_MB = 1.0
+MB = 1024 * 1024
+
+
+@dataclass
+class TreeSample:
+    python_mb: float = 0.0
+    driver_mb: float = 0.0
+    browser_mb: float = 0.0
+    cpu_s: float = 0.0
+    processes: int = 0
+
+    @property
+    def rss_mb(self) -> float:
+        return self.python_mb + self.driver_mb + self.browser_mb
+
+
+def _psutil_tree(pid: int) -> Optional[TreeSample]:
+    try:
+        import psutil  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    root = psutil.Process(pid)
+    sample = TreeSample()
+    direct = {c.pid for c in root.children()}
+    for proc in [root, *root.children(recursive=True)]:
+        try:
+            rss = proc.memory_info().rss / MB
+            cpu = proc.cpu_times()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        if proc.pid == pid:
+            sample.python_mb += rss
+        elif proc.pid in direct:
+            sample.driver_mb += rss
+        else:
+            sample.browser_mb += rss
+        sample.cpu_s += cpu.user + cpu.system
+        sample.processes += 1
+    return sample
+
+
+_PAGE_MB = os.sysconf("SC_PAGE_SIZE") / MB if hasattr(os, "sysconf") else 0.0
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _proc_stat(pid: int) -> Optional[Tuple[int, float, float]]:
+    """(ppid, rss MB, cpu s) from /proc/<pid>/stat."""
+    try:
+        raw = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    # Fields after the parenthesised command name: state, ppid, ... utime (12th), stime, ... rss (22nd).
+    rest = raw[raw.rindex(")") + 2 :].split()
+    return int(rest[1]), int(rest[21]) * _PAGE_MB, (int(rest[11]) + int(rest[12])) / _CLK_TCK
+
+
+def _proc_tree(pid: int) -> Optional[TreeSample]:
+    if not os.path.isdir("/proc"):
+        return None
+    stats = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            stat = _proc_stat(int(entry))
+            if stat is not None:
+                stats[int(entry)] = stat
+    if pid not in stats:
+        return None
+    children: Dict[int, List[int]] = {}
+    for child, (ppid, _, _) in stats.items():
+        children.setdefault(ppid, []).append(child)
+
+    sample = TreeSample()
+    stack = [(pid, 0)]
+    while stack:
+        current, depth = stack.pop()
+        _, rss, cpu = stats[current]
+        if depth == 0:
+            sample.python_mb += rss
+        elif depth == 1:
+            sample.driver_mb += rss
+        else:
+            sample.browser_mb += rss
+        sample.cpu_s += cpu
+        sample.processes += 1
+        stack.extend((c, depth + 1) for c in children.get(current, ()))
+    return sample
+
+
+def sample_tree(pid: Optional[int] = None) -> Optional[TreeSample]:
+    """RSS/CPU of ``pid`` (default: this process) and its descendants; None if unsupported."""
+    pid = pid or os.getpid()
+    sample = _psutil_tree(pid)
+    return sample if sample is not None else _proc_tree(pid)
+
+
+def dir_size_mb(path: Path) -> float:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total / MB
+
+
+@dataclass
+class ResourceRow:
+    nodeid: str
+    seconds: float
+    rss_before_mb: float
+    rss_after_mb: float
+    rss_peak_mb: float
+    browser_peak_mb: float
+    cpu_s: float
+    tmp_delta_mb: float
+    leaks: Dict[str, float] = field(default_factory=dict)
+    fixtures: List[str] = field(default_factory=list)
+
+    @property
+    def rss_delta_mb(self) -> float:
+        return self.rss_after_mb - self.rss_before_mb
+
+
+@dataclass
+class ObjectCounts:
+    """Contexts and pages owned by tests (warm-pool contexts excluded).
+
+    ``resident`` counts the driver and shared browsers; it is not a leak, but a test that started
+    one of them (the first test of a worker) has more processes afterwards.
+    """
+
+    contexts: int = 0
+    pages: int = 0
+    resident: int = 0
+
+
+class PeakSampler(threading.Thread):
+    """Samples the process tree every ``interval`` seconds and keeps the peak since :meth:`reset`."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="resource-sampler", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self.peak = TreeSample()
+
+    def reset(self, start: TreeSample) -> None:
+        with self._lock:
+            self.peak = start
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            sample = sample_tree()
+            if sample is None:
+                return
+            with self._lock:
+                if sample.rss_mb > self.peak.rss_mb:
+                    self.peak = sample
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+class ResourceMonitor:
+    """Per-worker profiler; :meth:`begin`/:meth:`end` bracket one test's whole protocol."""
+
+    def __init__(
+        self,
+        tmp_root: Callable[[], Optional[Path]],
+        objects: Callable[[], ObjectCounts],
+        interval_ms: float = DEFAULT_INTERVAL_MS,
+        leak_disk_mb: float = DEFAULT_LEAK_DISK_MB,
+    ) -> None:
+        self.tmp_root = tmp_root
+        self.objects = objects
+        self.leak_disk_mb = leak_disk_mb
+        self.rows: List[ResourceRow] = []
+        self.supported = sample_tree() is not None
+        self.sampler = PeakSampler(interval_ms / 1000) if self.supported else None
+        if self.sampler is not None:
+            self.sampler.start()
+        self._start: Optional[Tuple[float, TreeSample, float, ObjectCounts]] = None
+
+    def _tmp_mb(self) -> float:
+        root = self.tmp_root()
+        return dir_size_mb(root) if root is not None and root.exists() else 0.0
+
+    def begin(self) -> None:
+        sample = sample_tree() or TreeSample()
+        if self.sampler is not None:
+            self.sampler.reset(sample)
+        self._start = (time.perf_counter(), sample, self._tmp_mb(), self.objects())
+
+    def end(self, nodeid: str, fixtures: List[str]) -> Optional[ResourceRow]:
+        if self._start is None:
+            return None
+        started, before, tmp_before, objects_before = self._start
+        self._start = None
+        after = sample_tree() or TreeSample()
+        peak = self.sampler.peak if self.sampler is not None else after
+        if after.rss_mb > peak.rss_mb:
+            peak = after
+        tmp_delta = self._tmp_mb() - tmp_before
+        objects_after = self.objects()
+
+        leaks: Dict[str, float] = {}
+        for name in ("contexts", "pages"):
+            grown = getattr(objects_after, name) - getattr(objects_before, name)
+            if grown > 0:
+                leaks[name] = grown
+        # The lazily started driver/browser explains the extra processes of a worker's first test.
+        launched = objects_after.resident > objects_before.resident
+        if self.supported and after.processes > before.processes and not launched:
+            leaks["processes"] = after.processes - before.processes
+        if tmp_delta >= self.leak_disk_mb:
+            leaks["disk_mb"] = round(tmp_delta, 2)
+
+        row = ResourceRow(
+            nodeid,
+            time.perf_counter() - started,
+            before.rss_mb,
+            after.rss_mb,
+            peak.rss_mb,
+            peak.browser_mb,
+            max(0.0, after.cpu_s - before.cpu_s),
+            tmp_delta,
+            leaks,
+            fixtures if leaks else [],
+        )
+        self.rows.append(row)
+        return row
+
+    def close(self) -> None:
+        if self.sampler is not None:
+            self.sampler.stop()
+
+
+def trend(rows: List[ResourceRow]) -> Dict[str, float]:
+    """Least-squares slope of post-test RSS over test index (MB per 100 tests)."""
+    n = len(rows)
+    if n < 2:
+        return {"tests": n, "slope_mb_per_100": 0.0}
+    ys = [r.rss_after_mb for r in rows]
+    mean_x, mean_y = (n - 1) / 2, sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in range(n))
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(ys))
+    return {
+        "tests": n,
+        "rss_first_mb": ys[0],
+        "rss_last_mb": ys[-1],
+        "rss_max_mb": max(r.rss_peak_mb for r in rows),
+        "slope_mb_per_100": sxy / sxx * 100,
+    }
+
+
+def row_to_dict(row: ResourceRow) -> Dict[str, Any]:
+    return asdict(row)
+
+
+def row_from_dict(data: Dict[str, Any]) -> ResourceRow:
+    return ResourceRow(**data)
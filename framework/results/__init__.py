@@ -0,0 +1,5 @@
+"""Test results streamed to a local store, and queries over it (``python -m framework.results --help``)."""
+
+from .store import DEFAULT_STORE, ResultWriter, TestResult, open_sink, store_path
+
+__all__ = ["DEFAULT_STORE", "ResultWriter", "TestResult", "open_sink", "store_path"]
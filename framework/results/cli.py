@@ -0,0 +1,88 @@
+"""``python -m framework.results``: duration trends, flaky tests and slowest steps across runs."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from framework.results.query import duration_trends, flakiness, open_store, recent_runs, slowest_steps
+from framework.results.store import DEFAULT_STORE
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+
+def format_trends(rows: List[Dict[str, Any]]) -> str:
+    lines = [
+        f"{'started':<16} {'label':<12} {'-m':<16} {'tests':>6} {'failed':>6} {'mean s':>7} {'p95 s':>7} {'sum s':>8}"
+    ]
+    for r in rows:
+        started = time.strftime("%Y-%m-%d %H:%M", time.localtime(r["started"] or 0))
+        lines.append(
+            f"{started:<16} {(r['label'] or '-')[:12]:<12} {(r['markexpr'] or '-')[:16]:<16} {r['n']:>6} "
+            f"{r['failures']:>6} {r['mean']:>7.2f} {r['p95']:>7.2f} {r['total']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_flaky(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'test':<70} {'browser':<10} {'runs':>5} {'fail%':>6} {'flip%':>6} {'last':<6}"]
+    for r in rows:
+        lines.append(
+            f"{r['nodeid'][-70:]:<70} {(r['browser'] or '-')[:10]:<10} {r['runs']:>5} "
+            f"{r['fail_rate'] * 100:>5.0f}% {r['flip_rate'] * 100:>5.0f}% {r['last']:<6}"
+        )
+    return "\n".join(lines)
+
+
+def format_steps(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'action':<48} {'calls':>6} {'p50 ms':>7} {'p95 ms':>7} {'total s':>8} {'before':>7} {'latest':>7}"]
+    for r in rows:
+        lines.append(
+            f"{r['action'][:48]:<48} {r['calls']:>6} {_ms(r['p50']):>7} {_ms(r['p95']):>7} {r['total']:>8.1f} "
+            f"{_ms(r['before_p50']):>7} {_ms(r['latest_p50']):>7}"
+        )
+    return "\n".join(lines)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m framework.results",
+        description="Query the results streamed by pytest --results-store.",
+    )
+    parser.add_argument("--store", default=DEFAULT_STORE, help=f"SQLite or .ndjson store (default {DEFAULT_STORE}).")
+    parser.add_argument("--runs", type=int, default=30, help="Look at the newest N runs (default 30).")
+    parser.add_argument("--label", default=None, help="Only runs with this --results-label (e.g. nightly).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    trends = commands.add_parser("trends", help="Test count, failures and durations per run.")
+    trends.add_argument("--test", default=None, help="Only tests whose node id contains this text.")
+    flaky = commands.add_parser("flaky", help="Tests by flip rate (outcome changed from the previous run).")
+    flaky.add_argument("--min-runs", type=int, default=3, help="Skip tests with fewer runs (default 3).")
+    flaky.add_argument("--all", action="store_true", help="Also list tests that never flipped.")
+    steps = commands.add_parser("steps", help="Slowest page-object steps and fixtures by p95.")
+    steps.add_argument("--top", type=int, default=20, help="Rows to show (default 20).")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parser().parse_args(argv)
+    try:
+        conn = open_store(Path(args.store))
+    except FileNotFoundError as exc:
+        sys.exit(str(exc))
+    runs = recent_runs(conn, args.runs, args.label)
+    if not runs:
+        sys.exit(f"No runs in {args.store}" + (f" with label {args.label!r}" if args.label else ""))
+
+    if args.command == "trends":
+        print(format_trends(duration_trends(conn, runs, args.test)))
+    elif args.command == "flaky":
+        rows = flakiness(conn, runs, args.min_runs)
+        print(format_flaky(rows if args.all else [r for r in rows if r["flip_rate"] > 0]))
+    else:
+        print(format_steps(slowest_steps(conn, runs, args.top)))
@@ -0,0 +1,149 @@
+"""Queries over a results store: duration trends, flakiness and the slowest steps across runs.
+
+NDJSON stores are loaded into an in-memory SQLite database with the same schema, so both formats
+answer the same queries. Every query looks at the newest ``runs`` runs (optionally one ``label``).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from framework.results.store import COLUMNS, SCHEMA, is_ndjson
+from framework.stats import describe
+
+
+def open_store(path: Path) -> sqlite3.Connection:
+    if not path.exists():
+        raise FileNotFoundError(f"No results store at {path}")
+    if not is_ndjson(path):
+        return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA)
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            table = row.pop("type", None)
+            if table not in COLUMNS:
+                continue
+            columns = COLUMNS[table]
+            verb = "INSERT OR REPLACE" if table == "runs" else "INSERT"
+            conn.execute(
+                f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                tuple(row.get(c) for c in columns),
+            )
+    return conn
+
+
+def recent_runs(conn: sqlite3.Connection, runs: int, label: Optional[str] = None) -> List[Dict[str, Any]]:
+    """The newest ``runs`` runs, oldest first."""
+    where, args = ("WHERE label = ?", [label]) if label else ("", [])
+    cursor = conn.execute(
+        f"SELECT run_id, started, finished, label, markexpr, browser, tests, failed FROM runs {where} "
+        "ORDER BY started DESC LIMIT ?",
+        [*args, runs],
+    )
+    names = [d[0] for d in cursor.description]
+    return [dict(zip(names, row)) for row in reversed(cursor.fetchall())]
+
+
+def _run_filter(run_ids: List[str]) -> str:
+    return f"run_id IN ({', '.join('?' * len(run_ids))})"
+
+
+def duration_trends(
+    conn: sqlite3.Connection, runs: List[Dict[str, Any]], test: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Per run: test count, failures, mean/p95 test duration and summed test time.
+
+    ``test`` narrows the rows to node ids containing that substring.
+    """
+    if not runs:
+        return []
+    run_ids = [r["run_id"] for r in runs]
+    sql = f"SELECT run_id, outcome, duration FROM tests WHERE {_run_filter(run_ids)}"
+    args: List[Any] = list(run_ids)
+    if test:
+        sql += " AND instr(nodeid, ?) > 0"
+        args.append(test)
+    durations: Dict[str, List[float]] = defaultdict(list)
+    failed: Dict[str, int] = defaultdict(int)
+    for run_id, outcome, duration in conn.execute(sql, args):
+        durations[run_id].append(duration or 0.0)
+        failed[run_id] += outcome in ("failed", "error")
+
+    rows = []
+    for run in runs:
+        d = describe(durations[run["run_id"]])
+        rows.append({**run, **d, "failures": failed[run["run_id"]]})
+    return rows
+
+
+def flakiness(conn: sqlite3.Connection, runs: List[Dict[str, Any]], min_runs: int = 3) -> List[Dict[str, Any]]:
+    """Per test and browser: failure rate and flip rate (outcome changed from the previous run).
+
+    Tests that always fail are broken rather than flaky; a high flip rate is the flaky signal.
+    Skipped and xfailed runs are left out.
+    """
+    if not runs:
+        return []
+    order = {r["run_id"]: i for i, r in enumerate(runs)}
+    history: Dict[tuple, List[tuple]] = defaultdict(list)
+    sql = f"SELECT run_id, nodeid, browser, outcome FROM tests WHERE {_run_filter(list(order))}"
+    for run_id, nodeid, browser, outcome in conn.execute(sql, list(order)):
+        if outcome in ("passed", "failed", "error", "xpassed"):
+            history[(nodeid, browser)].append((order[run_id], outcome in ("failed", "error")))
+
+    rows = []
+    for (nodeid, browser), results in history.items():
+        if len(results) < min_runs:
+            continue
+        failures = [failed for _, failed in sorted(results)]
+        flips = sum(a != b for a, b in zip(failures, failures[1:]))
+        rows.append(
+            {
+                "nodeid": nodeid,
+                "browser": browser,
+                "runs": len(failures),
+                "fail_rate": sum(failures) / len(failures),
+                "flip_rate": flips / (len(failures) - 1),
+                "last": "failed" if failures[-1] else "passed",
+            }
+        )
+    return sorted(rows, key=lambda r: (-r["flip_rate"], -r["fail_rate"], r["nodeid"]))
+
+
+def slowest_steps(conn: sqlite3.Connection, runs: List[Dict[str, Any]], top: int = 20) -> List[Dict[str, Any]]:
+    """Per action: calls, p50/p95 over the runs, and the newest run's p50 next to the older runs' p50."""
+    if not runs:
+        return []
+    run_ids = [r["run_id"] for r in runs]
+    newest = run_ids[-1]
+    samples: Dict[str, List[float]] = defaultdict(list)
+    latest: Dict[str, List[float]] = defaultdict(list)
+    sql = f"SELECT run_id, action, seconds FROM steps WHERE {_run_filter(run_ids)}"
+    for run_id, action, seconds in conn.execute(sql, run_ids):
+        (latest if run_id == newest else samples)[action].append(seconds)
+
+    rows = []
+    for action in set(samples) | set(latest):
+        everything = samples[action] + latest[action]
+        d = describe(everything)
+        rows.append(
+            {
+                "action": action,
+                "calls": d["n"],
+                "p50": d["p50"],
+                "p95": d["p95"],
+                "total": d["total"],
+                "before_p50": describe(samples[action])["p50"] if samples[action] else None,
+                "latest_p50": describe(latest[action])["p50"] if latest[action] else None,
+            }
+        )
+    return sorted(rows, key=lambda r: -r["p95"])[:top]
@@ -0,0 +1,238 @@
+"""Result rows, the SQLite and NDJSON sinks and the background writer that batches into them.
+
+Three kinds of rows are written:
+
+- ``runs``  -> one per session: start/finish time, label, ``-m`` expression, browser, host, totals;
+- ``tests`` -> one per test: outcome, setup/call/teardown durations, browser, user, worker, markers;
+- ``steps`` -> one per page-object action or conftest fixture the test went through (see
+               framework/instrumentation.py), with its round trips and time spent waiting.
+
+The format follows the path: ``.ndjson``/``.jsonl`` files get one JSON object per line (with a
+``"type"`` field naming the table), anything else is a SQLite database. Workers of a
+``pytest -n N`` run write to the same store: SQLite runs in WAL mode with a busy timeout, and
+every NDJSON batch is a single ``O_APPEND`` write.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+DEFAULT_STORE = "test-results/results.db"
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_S = 1.0
+
+COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "runs": ("run_id", "started", "finished", "label", "markexpr", "browser", "host", "workers", "tests", "failed"),
+    "tests": (
+        "run_id", "nodeid", "outcome", "duration", "setup", "call", "teardown",
+        "browser", "user", "worker", "markers", "finished",
+    ),
+    "steps": ("run_id", "nodeid", "action", "seconds", "round_trips", "wait_seconds"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY, started REAL, finished REAL, label TEXT, markexpr TEXT,
+    browser TEXT, host TEXT, workers INTEGER, tests INTEGER, failed INTEGER
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id TEXT, nodeid TEXT, outcome TEXT, duration REAL, setup REAL, call REAL, teardown REAL,
+    browser TEXT, user TEXT, worker TEXT, markers TEXT, finished REAL
+);
+CREATE INDEX IF NOT EXISTS tests_by_node ON tests (nodeid, run_id);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id TEXT, nodeid TEXT, action TEXT, seconds REAL, round_trips INTEGER, wait_seconds REAL
+);
+CREATE INDEX IF NOT EXISTS steps_by_action ON steps (action, run_id);
+"""
+
+# Worst phase wins: a test that passed its call but failed teardown is an error, not a pass.
+_OUTCOME_RANK = {"passed": 0, "xpassed": 1, "skipped": 2, "xfailed": 3, "failed": 4, "error": 5}
+
+
+def store_path(config: pytest.Config) -> Optional[str]:
+    """--results-store / RESULTS_STORE, or None when streaming is off."""
+    return config.getoption("results_store", default=None) or os.getenv("RESULTS_STORE") or None
+
+
+def is_ndjson(path: Path) -> bool:
+    return path.suffix.lower() in NDJSON_SUFFIXES
+
+
+def phase_outcome(report: pytest.TestReport) -> str:
+    """Outcome of one phase, with xfail/xpass and setup/teardown errors told apart."""
+    if hasattr(report, "wasxfail"):
+        return "xfailed" if report.skipped else "xpassed"
+    if report.failed and report.when != "call":
+        return "error"
+    return report.outcome
+
+
+@dataclass
+class TestResult:
+    """Accumulates the setup/call/teardown reports of one test into its ``tests`` row."""
+
+    nodeid: str
+    outcome: str = "passed"
+    setup: float = 0.0
+    call: float = 0.0
+    teardown: float = 0.0
+
+    def add(self, report: pytest.TestReport) -> None:
+        setattr(self, report.when, report.duration)
+        outcome = phase_outcome(report)
+        if _OUTCOME_RANK.get(outcome, 0) > _OUTCOME_RANK.get(self.outcome, 0):
+            self.outcome = outcome
+
+    def row(self, run_id: str, **fields: Any) -> Dict[str, Any]:
+        return {
+            "run_id": run_id,
+            "nodeid": self.nodeid,
+            "outcome": self.outcome,
+            "duration": self.setup + self.call + self.teardown,
+            "setup": self.setup,
+            "call": self.call,
+            "teardown": self.teardown,
+            "finished": time.time(),
+            **fields,
+        }
+
+
+class SqliteSink:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), timeout=30.0)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def write(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        by_table: Dict[str, List[Tuple[Any, ...]]] = {}
+        for table, row in batch:
+            by_table.setdefault(table, []).append(tuple(row.get(c) for c in COLUMNS[table]))
+        with self.conn:  # one transaction per batch
+            for table, rows in by_table.items():
+                columns = COLUMNS[table]
+                verb = "INSERT OR REPLACE" if table == "runs" else "INSERT"
+                self.conn.executemany(
+                    f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows
+                )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class NdjsonSink:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def write(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        data = "".join(json.dumps({"type": table, **row}, separators=(",", ":")) + "\n" for table, row in batch)
+        os.write(self.fd, data.encode("utf-8"))
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def open_sink(path: Path):
+    return NdjsonSink(path) if is_ndjson(path) else SqliteSink(path)
+
+
+@dataclass
+class WriterStats:
+    rows: int = 0
+    batches: int = 0
+    write_s: float = 0.0
+    max_queued: int = 0
+    dropped: int = 0
+    error: Optional[str] = None
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        self.rows += other["rows"]
+        self.batches += other["batches"]
+        self.write_s += other["write_s"]
+        self.max_queued = max(self.max_queued, other["max_queued"])
+        self.dropped += other["dropped"]
+        self.error = self.error or other["error"]
+
+
+_STOP = object()
+
+
+class ResultWriter:
+    """Streams rows to a sink from a daemon thread; ``put`` never blocks the test thread.
+
+    Rows are written when ``batch_size`` are queued or ``flush_s`` after the first one, whichever
+    comes first. A failing sink stops the writer (rows are then counted as dropped), the tests go on.
+    """
+
+    def __init__(
+        self,
+        open_sink: Callable[[], Any],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_s: float = DEFAULT_FLUSH_S,
+    ) -> None:
+        self.open_sink = open_sink
+        self.batch_size = batch_size
+        self.flush_s = flush_s
+        self.stats = WriterStats()
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="results-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, table: str, row: Dict[str, Any]) -> None:
+        if self.stats.error is not None:
+            self.stats.dropped += 1
+            return
+        self._queue.put((table, row))
+        self.stats.max_queued = max(self.stats.max_queued, self._queue.qsize())
+
+    def _flush(self, sink: Any, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        started = time.perf_counter()
+        sink.write(batch)
+        self.stats.write_s += time.perf_counter() - started
+        self.stats.rows += len(batch)
+        self.stats.batches += 1
+
+    def _run(self) -> None:
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        deadline = None
+        sink = None
+        try:
+            sink = self.open_sink()
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if item is not None and item is not _STOP:
+                    batch.append(item)
+                    deadline = deadline or time.monotonic() + self.flush_s
+                if batch and (item is None or item is _STOP or len(batch) >= self.batch_size):
+                    self._flush(sink, batch)
+                    batch, deadline = [], None
+                if item is _STOP:
+                    return
+        except Exception as exc:  # disk full, locked database...: report it, never fail the tests
+            self.stats.error = f"{type(exc).__name__}: {exc}"
+            self.stats.dropped += len(batch)
+        finally:
+            if sink is not None:
+                sink.close()
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Write what is queued and stop the thread."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
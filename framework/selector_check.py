@@ -0,0 +1,52 @@
+"""Startup validation of the selector registry (``pages/selectors.py``).
+
+Visits every registered page once with a seeded session (login cookie plus one item in the
+cart), waits for the page's ``READY`` selector and checks all of its selectors in a single
+``evaluate`` call. A renamed element then fails the session at startup with the exact list of
+broken selectors, instead of every test timing out on its first ``expect``.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+from urllib.parse import urljoin
+
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.selectors import MISSING_SELECTORS_JS, REGISTRY, SelectorGroup
+from pages.state import seed_state
+
+READY_TIMEOUT_MS = 10_000
+SEED_ITEM_ID = 4  # Sauce Labs Backpack
+
+
+def validate_selectors(page: Page, base_url: str) -> Dict[str, List[str]]:
+    """Broken selectors per registered group (empty dict when everything resolves)."""
+    broken: Dict[str, List[str]] = {}
+    seeded = False
+    # The login page (empty path) is checked before the session is seeded.
+    for group in sorted(REGISTRY, key=lambda g: bool(g.path)):
+        if group.path and not seeded:
+            seed_state(page.context, base_url, cart=[SEED_ITEM_ID])
+            seeded = True
+        broken.update(_check_group(page, base_url, group))
+    return broken
+
+
+def _check_group(page: Page, base_url: str, group: SelectorGroup) -> Dict[str, List[str]]:
+    page.goto(urljoin(base_url, group.path))
+    try:
+        page.wait_for_selector(group.ready, state="attached", timeout=READY_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        return {group.name: [f"READY ({group.ready}) not found at /{group.path}"]}
+    missing = page.evaluate(MISSING_SELECTORS_JS, group.required)
+    return {group.name: [f"{name} ({group.selectors[name]})" for name in missing]} if missing else {}
+
+
+def format_report(broken: Dict[str, List[str]], seconds: float) -> str:
+    lines = [f"selector validation failed ({seconds:.1f} s):"]
+    for group, entries in broken.items():
+        lines.extend(f"  {group}.{entry}" for entry in entries)
+    return "\n".join(lines)
+
@@ -0,0 +1,5 @@
+"""Local SauceDemo stand-in app (``python -m framework.standin`` to serve it manually)."""
+
+from .server import StandinServer, load_app_data
+
+__all__ = ["StandinServer", "load_app_data"]
@@ -0,0 +1,215 @@
+"""Local SauceDemo stand-in: a threaded HTTP server serving a small client-side app.
+
+Every page path serves the same HTML shell; ``static/app.js`` renders the page for
+``location.pathname`` with the DOM the page objects expect. Product and user data come
+from ``data/products.json`` / ``data/users.json`` and are inlined into the shell, so a
+page renders without extra requests.
+
+Latency injection:
+- ``latency_ms`` delays every response;
+- ``glitch_latency_ms`` additionally delays page loads for ``performance_glitch_user``
+  (identified by the ``session-username`` cookie), like the real app's slow login.
+Both are plain attributes and can be changed while the server runs.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+STATIC_DIR = Path(__file__).parent / "static"
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+GLITCH_USER = "performance_glitch_user"
+DEFAULT_GLITCH_LATENCY_MS = 2500
+
+PAGE_PATHS = {
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+}
+
+CONTENT_TYPES = {
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+}
+
+# Product images: a flat placeholder whose colour is derived from the name, enough for visual checks.
+_IMAGE_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="120" height="120" viewBox="0 0 120 120">'
+    '<rect width="120" height="120" fill="hsl({hue},60%,60%)"/></svg>'
+)
+
+_ABOUT_HTML = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Sauce Labs</title></head>
+<body><h1>Sauce Labs</h1><p>Local stand-in for https://saucelabs.com/</p></body></html>
+"""
+
+
+def load_app_data(data_dir: Path = DATA_DIR) -> Dict[str, Any]:
+    users = json.loads((data_dir / "users.json").read_text(encoding="utf-8"))
+    catalog = json.loads((data_dir / "products.json").read_text(encoding="utf-8"))
+    return {
+        "users": users["users"],
+        "password": users["password"],
+        "products": catalog["products"],
+        "currency": catalog["currency"],
+        "tax_rate": catalog["tax_rate"],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_StandinHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _session_user(self) -> Optional[str]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get("session-username")
+        return morsel.value if morsel else None
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str, cache: bool = False) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "public, max-age=3600" if cache else "no-store")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self.do_GET()
+
+    def do_GET(self) -> None:
+        standin = self.server.standin
+        path = urlsplit(self.path).path
+        standin.requests += 1
+
+        delay_ms = standin.latency_ms
+        if path in PAGE_PATHS and self._session_user() == GLITCH_USER:
+            delay_ms += standin.glitch_latency_ms
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+
+        if path in PAGE_PATHS:
+            self._send(HTTPStatus.OK, standin.shell, CONTENT_TYPES[".html"])
+        elif path.startswith("/saucelabs"):
+            self._send(HTTPStatus.OK, _ABOUT_HTML.encode("utf-8"), CONTENT_TYPES[".html"])
+        elif path.startswith("/static/media/") and path.endswith(".svg"):
+            name = path.rsplit("/", 1)[-1]
+            body = _IMAGE_SVG.format(hue=sum(name.encode("utf-8")) % 360).encode("utf-8")
+            self._send(HTTPStatus.OK, body, "image/svg+xml", cache=True)
+        elif path.startswith("/static/"):
+            target = (STATIC_DIR / path[len("/static/"):]).resolve()
+            if STATIC_DIR.resolve() not in target.parents or not target.is_file():
+                self._send(HTTPStatus.NOT_FOUND, b"not found", "text/plain")
+                return
+            content_type = CONTENT_TYPES.get(target.suffix, "application/octet-stream")
+            self._send(HTTPStatus.OK, target.read_bytes(), content_type, cache=True)
+        else:
+            self._send(HTTPStatus.NOT_FOUND, b"not found", "text/plain")
+
+
+class _StandinHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, standin: "StandinServer") -> None:
+        self.standin = standin
+        super().__init__(address, _Handler)
+
+
+class StandinServer:
+    """SauceDemo stand-in bound to ``host:port`` (port 0 picks a free port)."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: int = 0,
+        glitch_latency_ms: int = DEFAULT_GLITCH_LATENCY_MS,
+        data_dir: Path = DATA_DIR,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.glitch_latency_ms = glitch_latency_ms
+        self.requests = 0
+        template = (STATIC_DIR / "index.html").read_text(encoding="utf-8")
+        self.shell = template.replace("/*__STANDIN_DATA__*/", json.dumps(load_app_data(data_dir))).encode("utf-8")
+        self._httpd: Optional[_StandinHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> "StandinServer":
+        self._httpd = _StandinHTTPServer((self.host, self.port), self)
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="saucedemo-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    @contextmanager
+    def injected_latency(self, latency_ms: Optional[int] = None, glitch_latency_ms: Optional[int] = None) -> Iterator[None]:
+        """Temporarily change the injected latency, e.g. to reproduce performance_glitch_user."""
+        saved = (self.latency_ms, self.glitch_latency_ms)
+        if latency_ms is not None:
+            self.latency_ms = latency_ms
+        if glitch_latency_ms is not None:
+            self.glitch_latency_ms = glitch_latency_ms
+        try:
+            yield
+        finally:
+            self.latency_ms, self.glitch_latency_ms = saved
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the local SauceDemo stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--glitch-latency-ms", type=int, default=DEFAULT_GLITCH_LATENCY_MS)
+    args = parser.parse_args()
+
+    server = StandinServer(args.host, args.port, args.latency_ms, args.glitch_latency_ms).start()
+    print(f"SauceDemo stand-in listening on {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
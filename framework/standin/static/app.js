@@ -0,0 +1,396 @@
+// SauceDemo stand-in client. Mirrors the DOM/selectors the page objects in pages/ rely on.
+(function () {
+  'use strict';
+
+  const DATA = window.__STANDIN__;
+  const PRODUCTS = DATA.products;
+  const CART_KEY = 'cart-contents';
+  const SESSION_COOKIE = 'session-username';
+  const ERROR_KEY = 'standin-error';
+  const SORTS = [
+    ['az', 'Name (A to Z)'],
+    ['za', 'Name (Z to A)'],
+    ['lohi', 'Price (low to high)'],
+    ['hilo', 'Price (high to low)'],
+  ];
+  // Items problem_user / error_user cannot add to the cart (known bugs in the real app).
+  const BROKEN_ITEMS = new Set([1, 3, 5]);
+
+  const root = document.getElementById('root');
+
+  function h(tag, attrs, ...children) {
+    const el = document.createElement(tag);
+    for (const [key, value] of Object.entries(attrs || {})) {
+      if (value === undefined || value === null || value === false) continue;
+      if (key === 'text') el.textContent = value;
+      else if (key.startsWith('on')) el.addEventListener(key.slice(2), value);
+      else el.setAttribute(key === 'className' ? 'class' : key, value === true ? '' : value);
+    }
+    for (const child of children.flat()) {
+      if (child !== null && child !== undefined) el.append(child);
+    }
+    return el;
+  }
+
+  const slug = (name) => name.toLowerCase().replace(/\s+/g, '-');
+  const money = (value) => DATA.currency + value.toFixed(2);
+  const go = (path) => { window.location.href = path; };
+  const productById = (id) => PRODUCTS.find((p) => p.id === id);
+
+  function currentUser() {
+    const match = document.cookie.match(new RegExp('(?:^|; )' + SESSION_COOKIE + '=([^;]*)'));
+    return match ? decodeURIComponent(match[1]) : null;
+  }
+
+  const userKind = (user) => (DATA.users[user] || {}).kind;
+  const isBuggy = (user, name) => user === name;
+
+  function readCart() {
+    try {
+      return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function writeCart(ids) {
+    if (ids.length) window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    else window.localStorage.removeItem(CART_KEY);
+  }
+
+  function requireLogin() {
+    const user = currentUser();
+    if (!user) {
+      window.sessionStorage.setItem(
+        ERROR_KEY,
+        `Epic sadface: You can only access '${window.location.pathname}' when you are logged in.`,
+      );
+      go('/');
+    }
+    return user;
+  }
+
+  // ----- Shared chrome -----------------------------------------------------------------
+
+  function updateBadge() {
+    const link = document.querySelector('a.shopping_cart_link');
+    if (!link) return;
+    link.querySelectorAll('.shopping_cart_badge').forEach((b) => b.remove());
+    const count = readCart().length;
+    if (count) link.append(h('span', { className: 'shopping_cart_badge', 'data-test': 'shopping-cart-badge', text: String(count) }));
+  }
+
+  function header(user, title, extra) {
+    const panel = h('div', { className: 'bm-menu-wrap', hidden: true, 'aria-hidden': 'true' },
+      h('nav', { className: 'bm-item-list' },
+        h('a', { id: 'inventory_sidebar_link', className: 'bm-item menu-item', href: '/inventory.html', text: 'All Items' }),
+        h('a', { id: 'about_sidebar_link', className: 'bm-item menu-item', href: '/saucelabs/', text: 'About' }),
+        h('a', {
+          id: 'logout_sidebar_link', className: 'bm-item menu-item', href: '#', text: 'Logout',
+          onclick: (e) => {
+            e.preventDefault();
+            document.cookie = `${SESSION_COOKIE}=; path=/; max-age=0`;
+            go('/');
+          },
+        }),
+        h('a', {
+          id: 'reset_sidebar_link', className: 'bm-item menu-item', href: '#', text: 'Reset App State',
+          onclick: (e) => {
+            e.preventDefault();
+            writeCart([]);
+            updateBadge();
+            document.querySelectorAll('button.btn_inventory').forEach((btn) => setButtonState(btn, false));
+          },
+        }),
+      ),
+      h('button', {
+        id: 'react-burger-cross-btn', type: 'button', text: 'Close Menu',
+        onclick: () => { panel.hidden = true; panel.setAttribute('aria-hidden', 'true'); },
+      }),
+    );
+
+    return h('div', { id: 'header_container', className: 'header_container' },
+      h('div', { className: 'primary_header' },
+        h('div', { id: 'menu_button_container' },
+          h('div', { className: 'bm-burger-button' },
+            h('button', {
+              id: 'react-burger-menu-btn', type: 'button', text: 'Open Menu',
+              onclick: () => { panel.hidden = false; panel.setAttribute('aria-hidden', 'false'); },
+            }),
+          ),
+          panel,
+        ),
+        h('div', { className: 'app_logo', text: 'Swag Labs' }),
+        h('div', { id: 'shopping_cart_container', className: 'shopping_cart_container' },
+          h('a', { className: 'shopping_cart_link', 'data-test': 'shopping-cart-link', href: '/cart.html' }),
+        ),
+      ),
+      h('div', { className: 'header_secondary_container' },
+        h('span', { className: 'title', 'data-test': 'title', text: title }),
+        extra || null,
+      ),
+    );
+  }
+
+  function setButtonState(btn, inCart) {
+    const name = btn.getAttribute('data-name');
+    const id = (inCart ? 'remove-' : 'add-to-cart-') + slug(name);
+    btn.id = id;
+    btn.setAttribute('data-test', id);
+    btn.textContent = inCart ? 'Remove' : 'Add to cart';
+    btn.className = 'btn btn_small btn_inventory ' + (inCart ? 'btn_secondary' : 'btn_primary');
+  }
+
+  function cartButton(user, product) {
+    const btn = h('button', { 'data-name': product.name, type: 'button' });
+    setButtonState(btn, readCart().includes(product.id));
+    btn.addEventListener('click', () => {
+      const cart = readCart();
+      const inCart = cart.includes(product.id);
+      if ((isBuggy(user, 'problem_user') || isBuggy(user, 'error_user')) && BROKEN_ITEMS.has(product.id)) {
+        console.error(`Failed to ${inCart ? 'remove' : 'add'} item ${product.id}`);
+        return;
+      }
+      writeCart(inCart ? cart.filter((id) => id !== product.id) : [...cart, product.id]);
+      setButtonState(btn, !inCart);
+      updateBadge();
+    });
+    return btn;
+  }
+
+  function imageFor(user, product) {
+    const image = isBuggy(user, 'problem_user') ? 'sl-404' : product.image;
+    return h('img', { className: 'inventory_item_img', alt: product.name, src: `/static/media/${image}.svg` });
+  }
+
+  // ----- Pages -------------------------------------------------------------------------
+
+  function renderLogin() {
+    const error = window.sessionStorage.getItem(ERROR_KEY);
+    window.sessionStorage.removeItem(ERROR_KEY);
+
+    const errorBox = h('div', { className: 'error-message-container' });
+    const showError = (message) => {
+      errorBox.replaceChildren(h('h3', { 'data-test': 'error', text: message }));
+      errorBox.classList.add('error');
+    };
+    if (error) showError(error);
+
+    const username = h('input', { id: 'user-name', name: 'user-name', 'data-test': 'username', placeholder: 'Username', autocomplete: 'off' });
+    const password = h('input', { id: 'password', name: 'password', 'data-test': 'password', type: 'password', placeholder: 'Password' });
+    const form = h('form', {
+      className: 'login_container',
+      onsubmit: (e) => {
+        e.preventDefault();
+        const user = username.value.trim();
+        if (!user) return showError('Epic sadface: Username is required');
+        if (!password.value) return showError('Epic sadface: Password is required');
+        if (!(user in DATA.users) || password.value !== DATA.password) {
+          return showError('Epic sadface: Username and password do not match any user in this service');
+        }
+        if (userKind(user) === 'locked_out') return showError('Epic sadface: Sorry, this user has been locked out.');
+        document.cookie = `${SESSION_COOKIE}=${encodeURIComponent(user)}; path=/; max-age=600`;
+        go('/inventory.html');
+      },
+    },
+      h('div', { className: 'login_logo', text: 'Swag Labs' }),
+      username,
+      password,
+      errorBox,
+      h('input', { id: 'login-button', name: 'login-button', 'data-test': 'login-button', type: 'submit', className: 'submit-button btn_action', value: 'Login' }),
+    );
+    root.replaceChildren(form);
+  }
+
+  function renderInventory(user) {
+    const list = h('div', { className: 'inventory_list', 'data-test': 'inventory-list' });
+    const active = h('span', { className: 'active_option', 'data-test': 'active-option' });
+
+    const draw = (mode) => {
+      const label = SORTS.find(([value]) => value === mode)[1];
+      active.textContent = label;
+      let products = [...PRODUCTS];
+      // problem_user: the select "works" but the list never re-orders.
+      if (!isBuggy(user, 'problem_user')) {
+        const byName = (a, b) => a.name.localeCompare(b.name);
+        const sorters = {
+          az: byName,
+          za: (a, b) => byName(b, a),
+          lohi: (a, b) => a.price - b.price || byName(a, b),
+          hilo: (a, b) => b.price - a.price || byName(a, b),
+        };
+        products.sort(sorters[mode]);
+      }
+      list.replaceChildren(...products.map((p) => h('div', { className: 'inventory_item', 'data-test': 'inventory-item' },
+        h('div', { className: 'inventory_item_img' },
+          h('a', { id: `item_${p.id}_img_link`, href: `/inventory-item.html?id=${p.id}` }, imageFor(user, p))),
+        h('div', { className: 'inventory_item_description' },
+          h('div', { className: 'inventory_item_label' },
+            h('a', { id: `item_${p.id}_title_link`, href: `/inventory-item.html?id=${p.id}` },
+              h('div', { className: 'inventory_item_name', 'data-test': 'inventory-item-name', text: p.name })),
+            h('div', { className: 'inventory_item_desc', 'data-test': 'inventory-item-desc', text: p.description })),
+          h('div', { className: 'pricebar' },
+            h('div', { className: 'inventory_item_price', 'data-test': 'inventory-item-price', text: money(p.price) }),
+            cartButton(user, p))),
+      )));
+    };
+
+    const select = h('select', {
+      className: 'product_sort_container', 'data-test': 'product-sort-container',
+      onchange: (e) => draw(e.target.value),
+    }, SORTS.map(([value, label]) => h('option', { value, text: label })));
+
+    root.replaceChildren(
+      header(user, 'Products', h('div', { className: 'right_component' },
+        h('span', { className: 'select_container' }, active, select))),
+      h('div', { id: 'inventory_container', className: 'inventory_container' }, list),
+    );
+    draw('az');
+    updateBadge();
+  }
+
+  function renderItem(user) {
+    const id = Number(new URLSearchParams(window.location.search).get('id'));
+    const p = productById(id);
+    root.replaceChildren(
+      header(user, ''),
+      h('div', { className: 'inventory_details' },
+        h('button', { id: 'back-to-products', 'data-test': 'back-to-products', text: 'Back to products', onclick: () => go('/inventory.html') }),
+        p ? h('div', { className: 'inventory_details_container' },
+          imageFor(user, p),
+          h('div', { className: 'inventory_details_name large_size', 'data-test': 'inventory-item-name', text: p.name }),
+          h('div', { className: 'inventory_details_desc large_size', 'data-test': 'inventory-item-desc', text: p.description }),
+          h('div', { className: 'inventory_details_price', 'data-test': 'inventory-item-price', text: money(p.price) }),
+          cartButton(user, p),
+        ) : h('div', { className: 'inventory_details_name', text: 'ITEM NOT FOUND' }),
+      ),
+    );
+    updateBadge();
+  }
+
+  function cartRows(user, removable) {
+    return readCart().map(productById).filter(Boolean).map((p) => {
+      const row = h('div', { className: 'cart_item', 'data-test': 'inventory-item' },
+        h('div', { className: 'cart_quantity', 'data-test': 'item-quantity', text: '1' }),
+        h('div', { className: 'cart_item_label' },
+          h('a', { id: `item_${p.id}_title_link`, href: `/inventory-item.html?id=${p.id}` },
+            h('div', { className: 'inventory_item_name', 'data-test': 'inventory-item-name', text: p.name })),
+          h('div', { className: 'inventory_item_desc', text: p.description }),
+          h('div', { className: 'item_pricebar' },
+            h('div', { className: 'inventory_item_price', 'data-test': 'inventory-item-price', text: money(p.price) }))),
+      );
+      if (removable) {
+        const id = 'remove-' + slug(p.name);
+        row.querySelector('.item_pricebar').append(h('button', {
+          id, 'data-test': id, className: 'btn btn_secondary btn_small cart_button', text: 'Remove',
+          onclick: () => {
+            writeCart(readCart().filter((x) => x !== p.id));
+            row.remove();
+            updateBadge();
+          },
+        }));
+      }
+      return row;
+    });
+  }
+
+  function renderCart(user) {
+    root.replaceChildren(
+      header(user, 'Your Cart'),
+      h('div', { id: 'cart_contents_container', className: 'cart_contents_container' },
+        h('div', { className: 'cart_list', 'data-test': 'cart-list' }, cartRows(user, true)),
+        h('div', { className: 'cart_footer' },
+          h('button', { id: 'continue-shopping', 'data-test': 'continue-shopping', text: 'Continue Shopping', onclick: () => go('/inventory.html') }),
+          h('button', { id: 'checkout', 'data-test': 'checkout', text: 'Checkout', onclick: () => go('/checkout-step-one.html') }))),
+    );
+    updateBadge();
+  }
+
+  function renderStepOne(user) {
+    const errorBox = h('div', { className: 'error-message-container' });
+    const first = h('input', { id: 'first-name', 'data-test': 'firstName', placeholder: 'First Name' });
+    const last = h('input', { id: 'last-name', 'data-test': 'lastName', placeholder: 'Last Name' });
+    const zip = h('input', { id: 'postal-code', 'data-test': 'postalCode', placeholder: 'Zip/Postal Code' });
+    // error_user: the last name field swallows input.
+    if (isBuggy(user, 'error_user')) last.addEventListener('input', () => { last.value = ''; });
+
+    const form = h('form', {
+      onsubmit: (e) => {
+        e.preventDefault();
+        const missing = [[first, 'First Name'], [last, 'Last Name'], [zip, 'Postal Code']].find(([input]) => !input.value.trim());
+        if (missing) {
+          errorBox.replaceChildren(h('h3', { 'data-test': 'error', text: `Error: ${missing[1]} is required` }));
+          errorBox.classList.add('error');
+          return;
+        }
+        go('/checkout-step-two.html');
+      },
+    },
+      first, last, zip, errorBox,
+      h('button', { id: 'cancel', 'data-test': 'cancel', type: 'button', text: 'Cancel', onclick: () => go('/cart.html') }),
+      h('input', { id: 'continue', 'data-test': 'continue', type: 'submit', className: 'submit-button btn btn_primary', value: 'Continue' }),
+    );
+
+    root.replaceChildren(
+      header(user, 'Checkout: Your Information'),
+      h('div', { id: 'checkout_info_container', className: 'checkout_info' }, form),
+    );
+    updateBadge();
+  }
+
+  function renderStepTwo(user) {
+    const items = readCart().map(productById).filter(Boolean);
+    const subtotal = items.reduce((sum, p) => sum + p.price, 0);
+    const tax = Math.round(subtotal * DATA.tax_rate * 100) / 100;
+    root.replaceChildren(
+      header(user, 'Checkout: Overview'),
+      h('div', { id: 'checkout_summary_container', className: 'checkout_summary_container' },
+        h('div', { className: 'cart_list' }, cartRows(user, false)),
+        h('div', { className: 'summary_info' },
+          h('div', { className: 'summary_subtotal_label', 'data-test': 'subtotal-label', text: `Item total: ${money(subtotal)}` }),
+          h('div', { className: 'summary_tax_label', 'data-test': 'tax-label', text: `Tax: ${money(tax)}` }),
+          h('div', { className: 'summary_total_label', 'data-test': 'total-label', text: `Total: ${money(subtotal + tax)}` }),
+          h('button', { id: 'cancel', 'data-test': 'cancel', text: 'Cancel', onclick: () => go('/inventory.html') }),
+          h('button', {
+            id: 'finish', 'data-test': 'finish', text: 'Finish',
+            onclick: () => {
+              // error_user: finishing the order silently does nothing.
+              if (isBuggy(user, 'error_user')) return;
+              writeCart([]);
+              go('/checkout-complete.html');
+            },
+          }))),
+    );
+    updateBadge();
+  }
+
+  function renderComplete(user) {
+    root.replaceChildren(
+      header(user, 'Checkout: Complete!'),
+      h('div', { id: 'checkout_complete_container', className: 'checkout_complete_container' },
+        h('h2', { className: 'complete-header', 'data-test': 'complete-header', text: 'Thank you for your order!' }),
+        h('div', { className: 'complete-text', 'data-test': 'complete-text', text: 'Your order has been dispatched, and will arrive just as fast as the pony can get there!' }),
+        h('button', { id: 'back-to-products', 'data-test': 'back-to-products', text: 'Back Home', onclick: () => go('/inventory.html') })),
+    );
+    updateBadge();
+  }
+
+  const ROUTES = {
+    '/inventory.html': renderInventory,
+    '/inventory-item.html': renderItem,
+    '/cart.html': renderCart,
+    '/checkout-step-one.html': renderStepOne,
+    '/checkout-step-two.html': renderStepTwo,
+    '/checkout-complete.html': renderComplete,
+  };
+
+  const route = ROUTES[window.location.pathname];
+  if (!route) {
+    renderLogin();
+    return;
+  }
+  const user = requireLogin();
+  if (!user) return;
+  if (isBuggy(user, 'visual_user')) document.body.classList.add('visual_failure');
+  route(user);
+})();
@@ -0,0 +1,153 @@
+"""Startup cost: the collection cache and the per-worker startup timeline.
+
+Collection cache (--fast-startup): every run stores, per test file, the markers of each of its
+items together with the file's source fingerprint (test file plus the shared sources of
+framework/history.py). With ``-m``, a test file whose fingerprint is unchanged and none of whose
+items can match the expression is not imported at all: all its tests would be deselected anyway.
+
+Startup timeline (--startup-report): seconds from process start to plugins and conftest imported
+(``pytest_configure``), to collection done and to the first test call, plus the Playwright driver
+spawn and the first browser launch (both started lazily by framework/browser.py).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+from framework.history import SourceFingerprints
+
+CACHE_KEY = "saucedemo/collection"
+DEFAULT_REPORT = "test-results/startup.json"
+
+# One item's markers: [name, kwargs] pairs (kwargs restricted to what -m can compare).
+ItemMarks = List[Tuple[str, Dict[str, Any]]]
+_NOT_SET = object()
+
+
+def process_started_at() -> Optional[float]:
+    """Epoch seconds this process was started (None where neither ``/proc`` nor psutil is available).
+
+    On Linux the age comes from ``/proc/self/stat`` and ``/proc/uptime`` (10 ms resolution);
+    psutil's ``create_time()`` is based on the boot time rounded to the second.
+    """
+    try:
+        raw = Path("/proc/self/stat").read_text()
+        uptime = float(Path("/proc/uptime").read_text().split()[0])
+    except OSError:
+        try:
+            import psutil  # type: ignore[import-not-found]
+        except ImportError:
+            return None
+        return psutil.Process().create_time()
+    # starttime (22nd field, clock ticks since boot) is the 20th after the parenthesised command name.
+    started_after_boot = int(raw[raw.rindex(")") + 2 :].split()[19]) / os.sysconf("SC_CLK_TCK")
+    return time.time() - (uptime - started_after_boot)
+
+
+def item_marks(item: pytest.Item) -> ItemMarks:
+    return [
+        (mark.name, {k: v for k, v in mark.kwargs.items() if v is None or isinstance(v, (str, int, bool))})
+        for mark in item.iter_markers()
+    ]
+
+
+def _matcher(marks: ItemMarks) -> Callable[..., bool]:
+    """Same semantics as pytest's ``MarkMatcher``: a name, optionally with keyword values."""
+
+    def matches(name: str, /, **kwargs: Any) -> bool:
+        return any(
+            mark == name and all(mark_kwargs.get(k, _NOT_SET) == v for k, v in kwargs.items())
+            for mark, mark_kwargs in marks
+        )
+
+    return matches
+
+
+def compile_markexpr(markexpr: str) -> Optional[Callable[[ItemMarks], bool]]:
+    """``-m`` expression as a predicate over cached item marks; None when it can't be used."""
+    if not markexpr:
+        return None
+    try:
+        from _pytest.mark.expression import Expression  # pytest's own -m parser
+        expression = Expression.compile(markexpr)
+    except Exception:  # a bad expression is reported by pytest itself
+        return None
+    return lambda marks: expression.evaluate(_matcher(marks))
+
+
+class CollectionCache:
+    """Per test file: fingerprint and item marks of the last collection, in ``.pytest_cache``."""
+
+    def __init__(self, rootpath: Path, entries: Optional[Dict[str, Any]] = None) -> None:
+        self.rootpath = rootpath
+        self.fingerprints = SourceFingerprints(rootpath)
+        self.entries: Dict[str, Any] = dict(entries or {})
+        self.collected: Dict[str, Any] = {}
+
+    @classmethod
+    def load(cls, config: pytest.Config) -> "CollectionCache":
+        cache = getattr(config, "cache", None)
+        return cls(config.rootpath, cache.get(CACHE_KEY, None) if cache is not None else None)
+
+    def relpath(self, path: Path) -> Optional[str]:
+        try:
+            return path.relative_to(self.rootpath).as_posix()
+        except ValueError:
+            return None
+
+    def cached_marks(self, path: Path) -> Optional[List[ItemMarks]]:
+        """Item marks of ``path`` if it is unchanged since they were recorded."""
+        relpath = self.relpath(path)
+        entry = self.entries.get(relpath) if relpath else None
+        if entry is None or entry["fingerprint"] != self.fingerprints.for_nodeid(relpath):
+            return None
+        return [[(name, kwargs) for name, kwargs in marks] for marks in entry["items"]]
+
+    def record(self, items: List[pytest.Item]) -> None:
+        by_file: Dict[str, List[ItemMarks]] = {}
+        for item in items:
+            by_file.setdefault(item.nodeid.split("::", 1)[0], []).append(item_marks(item))
+        for relpath, marks in by_file.items():
+            fingerprint = self.fingerprints.for_nodeid(relpath)
+            if fingerprint is not None:
+                self.collected[relpath] = {"fingerprint": fingerprint, "items": marks}
+
+    def save(self, config: pytest.Config) -> None:
+        cache = getattr(config, "cache", None)
+        if cache is None or not self.collected:
+            return
+        merged = {**self.entries, **self.collected}
+        cache.set(CACHE_KEY, {k: v for k, v in sorted(merged.items()) if (self.rootpath / k).is_file()})
+
+
+@dataclass
+class StartupTimes:
+    """One worker's startup timeline.
+
+    ``*_at`` values are seconds since ``origin``: the process start when it is known, else the
+    moment plugins were configured (``imported_at`` is then unknown).
+    """
+
+    worker: str = "master"
+    origin: float = 0.0  # epoch
+    imported_at: Optional[float] = None
+    collection_s: Optional[float] = None
+    collected_at: Optional[float] = None
+    driver_start_s: Optional[float] = None
+    first_launch_s: Optional[float] = None
+    browser_ready_at: Optional[float] = None
+    first_test_at: Optional[float] = None
+    files_skipped: int = 0
+    tests_skipped: int = 0
+
+    def since_origin(self, epoch: Optional[float]) -> Optional[float]:
+        return None if epoch is None else epoch - self.origin
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
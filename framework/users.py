@@ -0,0 +1,89 @@
+"""User matrix: the users of ``data/users.json`` as test parameters, and per-user timings.
+
+Each user has a ``kind``: ``normal``, ``locked_out`` or ``known_bug`` (SauceDemo's deliberately
+broken accounts). Tests marked ``@pytest.mark.users(*kinds)`` run once per user of those kinds;
+``known_bug`` users are marked ``known_bug`` automatically.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pytest
+
+from framework.stats import describe
+
+USERS_PATH = Path(__file__).resolve().parent.parent / "data" / "users.json"
+USER_KINDS = ("normal", "locked_out", "known_bug")
+BASELINE_USER = "standard_user"
+
+
+@lru_cache(maxsize=None)
+def _read_users(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def load_users(path: Path = USERS_PATH) -> Dict[str, Any]:
+    """``data/users.json`` (read once per process; every call returns a fresh copy)."""
+    return json.loads(_read_users(path))
+
+
+@dataclass(frozen=True)
+class UserCase:
+    username: str
+    kind: str
+    password: str
+
+    @property
+    def can_login(self) -> bool:
+        return self.kind != "locked_out"
+
+
+def user_cases(users_data: Dict[str, Any], kinds: Iterable[str] = ()) -> List[UserCase]:
+    """Users of the given kinds (all users when ``kinds`` is empty), in file order."""
+    wanted = set(kinds)
+    unknown = wanted - set(USER_KINDS)
+    if unknown:
+        raise pytest.UsageError(f"Unknown user kinds {sorted(unknown)} (expected {', '.join(USER_KINDS)})")
+    return [
+        UserCase(name, info["kind"], users_data["password"])
+        for name, info in users_data["users"].items()
+        if not wanted or info["kind"] in wanted
+    ]
+
+
+@dataclass
+class UserTimings:
+    """Call durations and login latencies per user, aggregated on the controller."""
+
+    calls: Dict[str, List[float]] = field(default_factory=dict)
+    logins: Dict[str, List[float]] = field(default_factory=dict)
+    failures: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, username: str, seconds: float, login_s: Optional[float], failed: bool) -> None:
+        self.calls.setdefault(username, []).append(seconds)
+        if login_s is not None:
+            self.logins.setdefault(username, []).append(login_s)
+        self.failures[username] = self.failures.get(username, 0) + int(failed)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per user: call and login statistics, plus the login slowdown against ``standard_user``."""
+        baseline = describe(self.logins.get(BASELINE_USER, []))["mean"]
+        rows: Dict[str, Dict[str, Any]] = {}
+        for user, calls in self.calls.items():
+            login = describe(self.logins.get(user, []))
+            rows[user] = {
+                "tests": len(calls),
+                "failed": self.failures.get(user, 0),
+                "call": describe(calls),
+                "login": login,
+                "login_vs_baseline": login["mean"] / baseline if baseline and login["n"] else None,
+            }
+        return rows
+
+
+USER_TIMINGS_KEY = pytest.StashKey[UserTimings]()
@@ -0,0 +1,332 @@
+"""Screenshot comparison against baselines stored per AUT host, browser and viewport.
+
+Baselines live in ``visual-baselines/<host>/<browser>-<W>x<H>/`` (viewport from ``WINDOW_WIDTH``
+/ ``WINDOW_HEIGHT``): ``<name>.png`` plus ``<name>.json`` with its PNG digest, difference hash
+and size. A capture is checked in increasing order of cost:
+
+1. same PNG bytes as the baseline -> identical, nothing is decoded;
+2. decode; same 64-bit difference hash (dHash of a 9x8 grey thumbnail) as the baseline and
+   equal pixel buffers -> identical (the encoder produced different bytes for the same pixels);
+3. vectorized pixel diff (numpy) against the baseline, which is decoded once per worker: bytes
+   that differ are found in one flat comparison, and only their pixels are measured, so a
+   near-identical frame costs about as much as step 2. A pixel is changed when any channel
+   moved by more than ``tolerance``; the check fails when more than ``max_diff_ratio`` of the
+   unmasked pixels changed.
+
+A matching perceptual hash alone is never taken as "identical": a changed price label doesn't
+move a 64-bit hash. A mismatching one skips the equality check, and its distance is reported on
+failure (a few bits: a local change; many: a shifted layout or another screen).
+
+A missing baseline fails the check; baselines are only recorded with ``--visual update``, so a
+fresh checkout can't pass by writing its own.
+
+Element masks are painted over by Playwright at capture time; rectangle masks (``regions``) are
+blanked in both images before hashing and diffing. A failing check writes the actual, expected
+and diff images to ``test-results/visual/<test>/``.
+
+numpy and Pillow are optional: without them byte-identical captures still pass, baselines can
+still be recorded, and every other comparison is counted as unchecked.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+
+from framework.stats import describe
+
+VISUAL_MODES = ("check", "update", "off")
+BASELINE_DIR = "visual-baselines"
+DEFAULT_DIFF_DIR = "test-results/visual"
+DEFAULT_TOLERANCE = 16  # per channel, 0-255: absorbs anti-aliasing and sub-pixel font rendering
+DEFAULT_MAX_DIFF_RATIO = 0.001
+DIFF_COLOR = (255, 0, 255)
+
+# x, y, width, height in CSS pixels of the capture
+Region = Tuple[int, int, int, int]
+
+
+def _imaging() -> Optional[Tuple[Any, Any]]:
+    """(numpy, PIL.Image), or None when either is missing."""
+    try:
+        import numpy
+        from PIL import Image
+    except ImportError:
+        return None
+    return numpy, Image
+
+
+def baseline_dir(root: Path, base_url: str, target_id: str, viewport: Dict[str, int]) -> Path:
+    host = urlsplit(base_url).hostname or "local"
+    return root / BASELINE_DIR / host / f"{target_id}-{viewport['width']}x{viewport['height']}"
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_")[:150]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _decode(png: bytes, regions: Iterable[Region]) -> Any:
+    """H x W x 3 uint8 pixels, with ``regions`` blanked."""
+    numpy, Image = _imaging()
+    image = Image.open(io.BytesIO(png))
+    pixels = numpy.asarray(image if image.mode == "RGB" else image.convert("RGB"))
+    if regions:
+        pixels = pixels.copy()
+        for x, y, w, h in regions:
+            pixels[max(0, y) : y + h, max(0, x) : x + w] = 0
+    return pixels
+
+
+def dhash(pixels: Any) -> int:
+    """64-bit difference hash: brighter-than-right-neighbour bits of a 9x8 grey thumbnail."""
+    numpy, Image = _imaging()
+    image = Image.fromarray(pixels)
+    # Integer pre-reduction keeps the box filter cheap on full-page captures.
+    image = image.reduce(max(1, min(image.width // 36, image.height // 32)))
+    grey = numpy.asarray(image.convert("L").resize((9, 8), Image.Resampling.BOX), dtype=numpy.int16)
+    return int.from_bytes(numpy.packbits(grey[:, 1:] > grey[:, :-1]).tobytes(), "big")
+
+
+def changed_pixels(actual: Any, expected: Any, tolerance: int) -> Any:
+    """Flat indices of the pixels where any channel differs by more than ``tolerance``."""
+    numpy, _ = _imaging()
+    candidates = numpy.unique(numpy.flatnonzero(actual.reshape(-1) != expected.reshape(-1)) // 3)
+    if not candidates.size:
+        return candidates
+    a = actual.reshape(-1, 3)[candidates].astype(numpy.int16)
+    e = expected.reshape(-1, 3)[candidates].astype(numpy.int16)
+    return candidates[numpy.abs(a - e).max(axis=1) > tolerance]
+
+
+def _hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class Baseline:
+    png_digest: str
+    dhash: Optional[int] = None
+    size: Optional[Tuple[int, int]] = None
+    regions: List[Region] = field(default_factory=list)
+
+
+@dataclass
+class Comparison:
+    name: str
+    outcome: str  # new | missing | identical | same-pixels | within-tolerance | different | updated | unchecked
+    seconds: float
+    diff_ratio: float = 0.0
+    distance: Optional[int] = None
+    files: List[str] = field(default_factory=list)
+
+    @property
+    def failed(self) -> bool:
+        return self.outcome in ("different", "missing")
+
+
+@dataclass
+class VisualStats:
+    seconds: Dict[str, List[float]] = field(default_factory=dict)  # outcome -> comparison times
+
+    def record(self, comparison: Comparison) -> None:
+        self.seconds.setdefault(comparison.outcome, []).append(comparison.seconds)
+
+    def merge(self, other: Dict[str, List[float]]) -> None:
+        for outcome, times in other.items():
+            self.seconds.setdefault(outcome, []).extend(times)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {outcome: describe(times) for outcome, times in sorted(self.seconds.items())}
+
+
+class VisualEngine:
+    """Per-worker comparator with an in-memory cache of decoded baselines."""
+
+    def __init__(self, diff_dir: Path, update: bool = False) -> None:
+        self.diff_dir = diff_dir
+        self.update = update
+        self.stats = VisualStats()
+        self.available = _imaging() is not None
+        self._baselines: Dict[Path, Baseline] = {}
+        self._pixels: Dict[Tuple[Path, Tuple[Region, ...]], Any] = {}
+
+    def _load(self, png_path: Path) -> Optional[Baseline]:
+        baseline = self._baselines.get(png_path)
+        if baseline is None and png_path.is_file():
+            meta_path = png_path.with_suffix(".json")
+            if meta_path.is_file():
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                baseline = Baseline(**{**meta, "regions": [tuple(r) for r in meta.get("regions", [])]})
+            else:  # a baseline copied in by hand
+                baseline = Baseline(_digest(png_path.read_bytes()))
+            self._baselines[png_path] = baseline
+        return baseline
+
+    def _expected(self, png_path: Path, regions: Tuple[Region, ...]) -> Any:
+        key = (png_path, regions)
+        if key not in self._pixels:
+            self._pixels[key] = _decode(png_path.read_bytes(), regions)
+        return self._pixels[key]
+
+    def _write_baseline(self, png_path: Path, png: bytes, pixels: Any, regions: Tuple[Region, ...]) -> None:
+        baseline = Baseline(_digest(png), regions=list(regions))
+        if pixels is not None:
+            baseline.dhash = dhash(pixels)
+            baseline.size = (int(pixels.shape[1]), int(pixels.shape[0]))
+        png_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename: xdist workers may create the same baseline at the same time.
+        for path, data in (
+            (png_path, png),
+            (png_path.with_suffix(".json"), json.dumps(baseline.__dict__, indent=2).encode("utf-8")),
+        ):
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        self._baselines[png_path] = baseline
+        self._pixels = {k: v for k, v in self._pixels.items() if k[0] != png_path}
+
+    def _write_failure(
+        self, test_dir: Path, name: str, png: bytes, expected_png: bytes, actual: Any, changed: Any
+    ) -> List[str]:
+        numpy, Image = _imaging()
+        test_dir.mkdir(parents=True, exist_ok=True)
+        actual_path = test_dir / f"{name}-actual.png"
+        expected_path = test_dir / f"{name}-expected.png"
+        diff_path = test_dir / f"{name}-diff.png"
+        actual_path.write_bytes(png)
+        expected_path.write_bytes(expected_png)
+        if changed is not None:
+            # Faded actual capture with the changed pixels in magenta.
+            faded = (actual // 3 + 170).astype(numpy.uint8)
+            faded.reshape(-1, 3)[changed] = DIFF_COLOR
+            Image.fromarray(faded).save(diff_path, optimize=False, compress_level=1)
+            return [str(actual_path), str(expected_path), str(diff_path)]
+        return [str(actual_path), str(expected_path)]
+
+    def compare(
+        self,
+        directory: Path,
+        name: str,
+        png: bytes,
+        nodeid: str,
+        regions: Iterable[Region] = (),
+        tolerance: int = DEFAULT_TOLERANCE,
+        max_diff_ratio: float = DEFAULT_MAX_DIFF_RATIO,
+        write: bool = True,
+    ) -> Comparison:
+        """Check ``png`` against baseline ``name`` in ``directory``; ``write=False`` never touches the baseline."""
+        started = time.perf_counter()
+        name = _safe_name(name)
+        regions = tuple(tuple(r) for r in regions)
+        png_path = directory / f"{name}.png"
+        baseline = self._load(png_path)
+
+        def done(outcome: str, **extra: Any) -> Comparison:
+            result = Comparison(name, outcome, time.perf_counter() - started, **extra)
+            self.stats.record(result)
+            return result
+
+        if baseline is None:
+            if not (self.update and write):
+                return done("missing")
+            self._write_baseline(png_path, png, _decode(png, regions) if self.available else None, regions)
+            return done("new")
+        if _digest(png) == baseline.png_digest:
+            return done("identical")
+        if not self.available:
+            if self.update and write:
+                self._write_baseline(png_path, png, None, regions)
+                return done("updated")
+            return done("unchecked")
+
+        numpy, _ = _imaging()
+        actual = _decode(png, regions)
+        expected = self._expected(png_path, regions)
+        distance = _hamming(dhash(actual), baseline.dhash) if baseline.dhash is not None else None
+        if distance == 0 and numpy.array_equal(actual, expected):
+            return done("same-pixels", distance=0)
+        if expected.shape != actual.shape:
+            changed, ratio = None, 1.0
+        else:
+            changed = changed_pixels(actual, expected, tolerance)
+            unmasked = actual.shape[0] * actual.shape[1] - sum(w * h for _, _, w, h in regions)
+            ratio = changed.size / max(1, unmasked)
+        if ratio <= max_diff_ratio:
+            return done("within-tolerance", diff_ratio=ratio, distance=distance)
+        if self.update and write:
+            self._write_baseline(png_path, png, actual, regions)
+            return done("updated", diff_ratio=ratio, distance=distance)
+        test_dir = self.diff_dir / _safe_name(nodeid)
+        files = self._write_failure(test_dir, name, png, png_path.read_bytes(), actual, changed)
+        return done("different", diff_ratio=ratio, distance=distance, files=files)
+
+
+class VisualCheck:
+    """The ``visual`` fixture: ``visual(page_object, "name", selector=..., mask=[...], regions=[...])``."""
+
+    def __init__(self, engine: VisualEngine, directory: Path, item: pytest.Item) -> None:
+        self.engine = engine
+        self.directory = directory
+        self.item = item
+
+    def __call__(
+        self,
+        page_object: Any,
+        name: str,
+        selector: Optional[str] = None,
+        mask: Iterable[str] = (),
+        regions: Iterable[Region] = (),
+        tolerance: int = DEFAULT_TOLERANCE,
+        max_diff_ratio: float = DEFAULT_MAX_DIFF_RATIO,
+        create: bool = True,
+    ) -> Comparison:
+        """Compare a capture of ``page_object`` (viewport, or ``selector``) with baseline ``name``.
+
+        A missing baseline fails the check; ``--visual update`` records it. ``create=False`` compares
+        against a baseline owned by another test and never writes it, not even with --visual update
+        (the test is skipped while that run records it). For captures expected to differ, e.g.
+        ``visual_user`` against the ``standard_user`` baseline.
+        """
+        __tracebackhide__ = True
+        png = page_object.capture(selector, mask)
+        result = self.engine.compare(
+            self.directory,
+            name,
+            png,
+            self.item.nodeid,
+            regions,
+            tolerance=tolerance,
+            max_diff_ratio=max_diff_ratio,
+            write=create,
+        )
+        self.item.user_properties.append(
+            ("visual", {"name": result.name, "outcome": result.outcome, "ms": result.seconds * 1000})
+        )
+        if result.outcome == "missing":
+            if not create and self.engine.update:
+                pytest.skip(f"visual baseline {name!r} is recorded by another test")
+            raise AssertionError(
+                f"no visual baseline {result.name!r} in {self.directory}: record it with --visual update "
+                "(on the CI runner's browser and fonts) and commit it"
+            )
+        if result.failed:
+            distance = f", dHash distance {result.distance}" if result.distance is not None else ""
+            raise AssertionError(
+                f"visual mismatch {result.name!r}: {result.diff_ratio:.2%} of pixels changed{distance}"
+                + "".join(f"\n  {path}" for path in result.files)
+            )
+        return result
@@ -0,0 +1,35 @@
+"""pytest-xdist awareness helpers (all of them also work without xdist installed)."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def worker_id(config: pytest.Config) -> str:
+    """``gw0``, ``gw1``... on xdist workers, ``master`` otherwise (same naming as xdist)."""
+    workerinput = getattr(config, "workerinput", None)
+    return workerinput["workerid"] if workerinput else "master"
+
+
+def is_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def is_distributed(config: pytest.Config) -> bool:
+    """True on the controller and the workers of a ``pytest -n N`` run."""
+    if is_worker(config):
+        return True
+    return bool(config.getoption("numprocesses", default=None)) and config.getoption("dist", default="no") != "no"
+
+
+def worker_count(config: pytest.Config) -> int:
+    """Number of workers sharing the run (known on workers; 1 in serial runs)."""
+    workerinput = getattr(config, "workerinput", None)
+    return int(workerinput.get("workercount", 1)) if workerinput else 1
+
+
+def report_worker(report: pytest.TestReport) -> str:
+    """Worker that produced ``report`` (only meaningful on the xdist controller)."""
+    node = getattr(report, "node", None)
+    gateway = getattr(node, "gateway", None)
+    return getattr(gateway, "id", None) or "master"
@@ -1,4 +1,38 @@
-from .login import LoginPage
-from .inventory import InventoryPage
-from .cart import CartPage
-from .checkout import CheckoutStepOnePage, CheckoutOverviewPage, CheckoutCompletePage
+"""Page objects (sync API).
+
+Submodules are imported on first attribute access, so ``import pages.waits`` or a plugin that
+only needs ``pages.base`` doesn't load every page object at startup.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_EXPORTS = {
+    "LoginPage": ".login",
+    "InventoryPage": ".inventory",
+    "InventoryItem": ".inventory",
+    "InventorySnapshot": ".inventory",
+    "CartPage": ".cart",
+    "CheckoutStepOnePage": ".checkout",
+    "CheckoutOverviewPage": ".checkout",
+    "CheckoutCompletePage": ".checkout",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .login import LoginPage
+    from .inventory import InventoryPage, InventoryItem, InventorySnapshot
+    from .cart import CartPage
+    from .checkout import CheckoutStepOnePage, CheckoutOverviewPage, CheckoutCompletePage
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
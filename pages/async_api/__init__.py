@@ -0,0 +1,10 @@
+"""asyncio twins of the page objects, for driving many pages from one process.
+
+Same class names and selectors as ``pages`` (like ``playwright.async_api`` mirrors
+``playwright.sync_api``); every driver-facing method is a coroutine.
+"""
+
+from .login import LoginPage
+from .inventory import InventoryPage
+from .cart import CartPage
+from .checkout import CheckoutStepOnePage, CheckoutOverviewPage, CheckoutCompletePage
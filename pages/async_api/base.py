@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from playwright.async_api import Locator, Page, expect
+
+from ..selectors import READ_CART_STORAGE_JS, WRITE_CART_STORAGE_JS, BaseSelectors
+from ..waits import ENGINE, SETTLED_MS
+
+
+class BasePage(BaseSelectors):
+    def __init__(self, page: Page):
+        self.page = page
+        self._locators: dict[str, Locator] = {}
+
+    def _loc(self, selector: str) -> Locator:
+        """Locator for a registry selector, created once per page object."""
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+    # Same readiness and accounting as the sync pages (pages/base.py, pages/waits.py): one ENGINE,
+    # so async waits learn and report under the same action names.
+    def _action(self, name: str) -> str:
+        return f"{type(self).__name__}.{name}"
+
+    @contextmanager
+    def _ready(self, name: str) -> Iterator[float]:
+        with ENGINE.wait(self._action(name)) as timeout_ms:
+            yield timeout_ms
+
+    async def _settle(self, name: str) -> None:
+        await ENGINE.settle_async(self.page, self._action(name))
+
+    async def _click(self, selector: str, name: str = "click") -> None:
+        with ENGINE.act(self._action(name)):
+            await self.page.click(selector)
+
+    async def _fill(self, selector: str, value: str, name: str = "fill") -> None:
+        with ENGINE.act(self._action(name)):
+            await self.page.fill(selector, value)
+
+    async def expect_url_contains(self, fragment: str) -> None:
+        with self._ready("expect_url") as timeout_ms:
+            await expect(self.page).to_have_url(lambda url: fragment.lower() in url.lower(), timeout=timeout_ms)
+
+    async def expect_cart_badge(self, count: int) -> None:
+        badge = self._loc(self.CART_BADGE)
+        if count == 0:
+            # Absence: let pending renders land, then the check passes (or fails) at once.
+            await self._settle("cart_badge")
+            await expect(badge).to_have_count(0, timeout=SETTLED_MS)
+        else:
+            with self._ready("cart_badge") as timeout_ms:
+                await expect(badge).to_have_text(str(count), timeout=timeout_ms)
+
+    async def cart_storage_ids(self) -> list[int]:
+        raw = await self.page.evaluate(READ_CART_STORAGE_JS, self.CART_STORAGE_KEY)
+        return json.loads(raw) if raw else []
+
+    async def write_cart_storage(self, item_ids: Iterable[int]) -> None:
+        """Fast path: replace the cart in localStorage and reload so the app renders it."""
+        ids = sorted(set(item_ids))
+        with ENGINE.act(self._action("write_cart_storage")):
+            await self.page.evaluate(WRITE_CART_STORAGE_JS, [self.CART_STORAGE_KEY, ids])
+            await self.page.reload()
+        await self.expect_cart_badge(len(ids))
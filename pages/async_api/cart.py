@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, Optional
+
+from playwright.async_api import expect
+
+from ..selectors import CART_ROWS_JS, CartSelectors
+from .base import BasePage
+
+
+class CartPage(CartSelectors, BasePage):
+    async def wait_for_ready(self) -> None:
+        with self._ready("wait_for_ready") as timeout_ms:
+            await expect(self.page).to_have_url(re.compile(r".*/cart\.html.*"), timeout=timeout_ms)
+            await expect(self._loc(self.CHECKOUT)).to_be_visible(timeout=timeout_ms)
+
+    async def item_count(self) -> int:
+        return await self._loc(self.ITEM).count()
+
+    async def assert_item_count(self, expected: int) -> None:
+        with self._ready("item_count") as timeout_ms:
+            await expect(self._loc(self.ITEM)).to_have_count(expected, timeout=timeout_ms)
+
+    async def item_names(self) -> list[str]:
+        return [n.strip() for n in await self._loc(self.ITEM).locator(self.ITEM_NAME).all_inner_texts()]
+
+    async def remove_items(self, names: Optional[Iterable[str]] = None) -> None:
+        """Remove ``names`` (all when None) in one planned pass, see :meth:`pages.CartPage.remove_items`."""
+        rows = await self._loc(self.ITEM).evaluate_all(
+            CART_ROWS_JS, {"name": self.ITEM_NAME, "remove": self.REMOVE_BUTTON}
+        )
+        wanted = None if names is None else set(names)
+        if wanted is not None:
+            unknown = wanted - {name for name, _ in rows}
+            assert not unknown, f"Items not in cart: {sorted(unknown)}"
+
+        targets = [test_id for name, test_id in rows if wanted is None or name in wanted]
+        for test_id in targets:
+            await self._click(f"[data-test='{test_id}']", "remove_items")
+        await self.assert_item_count(len(rows) - len(targets))
+
+    async def remove_all_items(self) -> None:
+        await self.remove_items()
+
+    async def clear_cart_storage(self) -> None:
+        await self.write_cart_storage([])
+        await self.assert_item_count(0)
+
+    async def start_checkout(self) -> None:
+        await self._click(self.CHECKOUT, "start_checkout")
+
+    async def checkout(self) -> None:
+        await self.start_checkout()
+
+    async def continue_shopping(self) -> None:
+        await self._click(self.CONTINUE_SHOPPING, "continue_shopping")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from playwright.async_api import expect
+
+from ..selectors import CheckoutCompleteSelectors, CheckoutOverviewSelectors, CheckoutStepOneSelectors
+from .base import BasePage
+
+
+class CheckoutStepOnePage(CheckoutStepOneSelectors, BasePage):
+    async def is_at(self) -> None:
+        with self._ready("is_at") as timeout_ms:
+            await expect(self._loc(self.TITLE)).to_contain_text("Checkout: Your Information", timeout=timeout_ms)
+
+    async def fill(self, first: str, last: str, zip_code: str) -> None:
+        await self._fill(self.FIRST, first, "fill")
+        await self._fill(self.LAST, last, "fill")
+        await self._fill(self.ZIP, zip_code, "fill")
+
+    async def continue_checkout(self) -> None:
+        await self._click(self.CONTINUE, "continue_checkout")
+
+    async def error_text(self) -> str:
+        """The error banner's text, or "" once the page has settled without one (no timeout)."""
+        await self._settle("error_text")
+        error = self._loc(self.ERROR)
+        return await error.inner_text() if await error.count() else ""
+
+
+class CheckoutOverviewPage(CheckoutOverviewSelectors, BasePage):
+    async def is_at(self) -> None:
+        with self._ready("is_at") as timeout_ms:
+            await expect(self._loc(self.TITLE)).to_contain_text("Checkout: Overview", timeout=timeout_ms)
+
+    async def finish(self) -> None:
+        await self._click(self.FINISH, "finish")
+
+
+class CheckoutCompletePage(CheckoutCompleteSelectors, BasePage):
+    async def is_at(self) -> None:
+        with self._ready("is_at") as timeout_ms:
+            await expect(self._loc(self.TITLE)).to_contain_text("Checkout: Complete!", timeout=timeout_ms)
+
+    async def confirmation_message(self) -> str:
+        return await self._loc(self.COMPLETE_HEADER).inner_text()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from playwright.async_api import expect
+
+from ..inventory import InventoryItem, InventorySnapshot, parse_snapshot
+from ..selectors import SNAPSHOT_JS, InventorySelectors
+from ..waits import ENGINE
+from .base import BasePage
+
+
+class InventoryPage(InventorySelectors, BasePage):
+    async def is_at(self) -> None:
+        with self._ready("is_at") as timeout_ms:
+            await expect(self._loc(self.TITLE)).to_contain_text("Products", timeout=timeout_ms)
+
+    async def inventory_count(self) -> int:
+        return await self._loc(self.ITEM).count()
+
+    async def cart_count(self) -> int:
+        # The badge only exists for a non-empty cart: settle first so "absent" is not a race.
+        await self._settle("cart_count")
+        badge = self._loc(self.CART_BADGE)
+        if await badge.count() == 0:
+            return 0
+        txt = (await badge.first.inner_text()).strip()
+        return int(txt) if txt else 0
+
+    async def open_cart(self) -> None:
+        await self._click(self.CART_LINK, "open_cart")
+
+    async def snapshot(self) -> InventorySnapshot:
+        items = self._loc(self.ITEM)
+        with self._ready("snapshot") as timeout_ms:
+            await expect(items.first).to_be_visible(timeout=timeout_ms)
+        return parse_snapshot(await items.evaluate_all(SNAPSHOT_JS, self.snapshot_selectors()))
+
+    async def _click_item_button(self, item: InventoryItem) -> None:
+        await self._click(f"[data-test='{item.button_test_id}']", "item_button")
+
+    async def add_items(self, names: Optional[Iterable[str]] = None) -> None:
+        snap = await self.snapshot()
+        targets = [i for i in snap.select(names) if not i.in_cart]
+        for item in targets:
+            await self._click_item_button(item)
+        await self.expect_cart_badge(len(snap.in_cart()) + len(targets))
+
+    async def remove_items(self, names: Optional[Iterable[str]] = None) -> None:
+        snap = await self.snapshot()
+        targets = [i for i in snap.select(names) if i.in_cart]
+        for item in targets:
+            await self._click_item_button(item)
+        await self.expect_cart_badge(len(snap.in_cart()) - len(targets))
+
+    async def add_all_items(self) -> None:
+        await self.add_items()
+
+    async def remove_all_items(self) -> None:
+        await self.remove_items()
+
+    async def set_cart(self, names: Optional[Iterable[str]] = None) -> None:
+        await self.write_cart_storage(i.item_id for i in (await self.snapshot()).select(names))
+
+    async def item_names(self) -> list[str]:
+        return (await self.snapshot()).names
+
+    async def item_prices(self) -> list[float]:
+        return (await self.snapshot()).prices
+
+    async def select_sort(self, visible_text: str) -> None:
+        with ENGINE.act(self._action("select_sort")):
+            await self.page.select_option(self.SORT_SELECT, label=visible_text)
+        with self._ready("select_sort") as timeout_ms:
+            await expect(self._loc(self.ACTIVE_SORT)).to_have_text(visible_text, timeout=timeout_ms)
+
+    async def assert_sorted_name_asc(self) -> None:
+        names = await self.item_names()
+        assert names == sorted(names, key=str.casefold)
+
+    async def assert_sorted_name_desc(self) -> None:
+        names = await self.item_names()
+        assert names == sorted(names, key=str.casefold, reverse=True)
+
+    async def assert_sorted_price_asc(self) -> None:
+        prices = await self.item_prices()
+        assert prices == sorted(prices)
+
+    async def assert_sorted_price_desc(self) -> None:
+        prices = await self.item_prices()
+        assert prices == sorted(prices, reverse=True)
+
+    # Menu
+    async def open_menu(self) -> None:
+        await self._click(self.MENU_BTN, "open_menu")
+        with self._ready("open_menu") as timeout_ms:
+            await expect(self._loc(self.MENU_PANEL)).to_be_visible(timeout=timeout_ms)
+
+    async def close_menu(self) -> None:
+        await self._click(self.MENU_CLOSE, "close_menu")
+        with self._ready("close_menu") as timeout_ms:
+            await expect(self._loc(self.MENU_PANEL)).to_be_hidden(timeout=timeout_ms)
+
+    async def assert_menu_item_exists(self, item: str) -> None:
+        await self.open_menu()
+        with self._ready("menu_item") as timeout_ms:
+            await expect(self._loc(self.menu_item_selector(item))).to_be_visible(timeout=timeout_ms)
+        await self.close_menu()
+
+    async def click_menu_item(self, item: str) -> None:
+        await self.open_menu()
+        await self._click(self.menu_item_selector(item), "click_menu_item")
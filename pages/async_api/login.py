@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from playwright.async_api import Page, expect
+
+from ..selectors import LoginSelectors
+from .base import BasePage
+
+
+class LoginPage(LoginSelectors, BasePage):
+    def __init__(self, page: Page, base_url: str):
+        super().__init__(page)
+        self.base_url = base_url
+
+    async def open(self) -> None:
+        await self.page.goto(self.base_url)
+        await self.wait_until_open()
+
+    async def wait_until_open(self) -> None:
+        with self._ready("wait_until_open") as timeout_ms:
+            await expect(self._loc(self.LOGIN_BTN)).to_be_visible(timeout=timeout_ms)
+
+    async def login(self, username: str, password: str) -> None:
+        await self._fill(self.USERNAME, username, "login")
+        await self._fill(self.PASSWORD, password, "login")
+        await self._click(self.LOGIN_BTN, "login")
+
+    async def error_text(self) -> str:
+        """The error banner's text, or "" once the page has settled without one (no timeout)."""
+        await self._settle("error_text")
+        error = self._loc(self.ERROR)
+        return await error.inner_text() if await error.count() else ""
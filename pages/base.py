@@ -1,11 +1,123 @@
 from __future__ import annotations
 
-from playwright.sync_api import Page, expect
+import json
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional, TypeVar, Union
+from urllib.parse import urljoin
 
+from playwright.sync_api import Locator, Page, expect
 
-class BasePage:
+from .selectors import READ_CART_STORAGE_JS, WRITE_CART_STORAGE_JS, BaseSelectors
+from .state import seed_state
+from .waits import ENGINE, SETTLED_MS
+
+
+P = TypeVar("P", bound="BasePage")
+
+# Called with the page object each time a page reports that it is ready (is_at(), wait_for_ready(),
+# LoginPage.open()...); framework/perf.py collects web performance metrics from here.
+TRANSITION_LISTENERS: list[Callable[["BasePage"], None]] = []
+
+
+class BasePage(BaseSelectors):
     def __init__(self, page: Page):
         self.page = page
+        self._locators: dict[str, Locator] = {}
+
+    @classmethod
+    def goto_state(
+        cls: type[P],
+        page: Page,
+        base_url: str,
+        username: str = "standard_user",
+        cart: Iterable[Union[str, int]] = (),
+    ) -> P:
+        """Open this page logged in as ``username`` with ``cart`` (names or ids) in the cart.
+
+        The session and cart are seeded into the context (see pages/state.py), so the only cost
+        is one navigation. For pages behind the login; use LoginPage.open() for the login page.
+        """
+        seed_state(page.context, base_url, username, cart)
+        page.goto(urljoin(base_url, cls.PATH))
+        target = cls(page)
+        target.wait_ready()
+        return target
+
+    def _loc(self, selector: str) -> Locator:
+        """Locator for a registry selector, created once per page object."""
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+    # Readiness (see pages/waits.py): waits use per-action learned timeouts and are accounted
+    # separately from the clicks and fills that drive the page.
+    def _action(self, name: str) -> str:
+        return f"{type(self).__name__}.{name}"
+
+    @contextmanager
+    def _ready(self, name: str) -> Iterator[float]:
+        with ENGINE.wait(self._action(name)) as timeout_ms:
+            yield timeout_ms
+
+    def _settle(self, name: str) -> None:
+        ENGINE.settle(self.page, self._action(name))
+
+    def _click(self, selector: str, name: str = "click") -> None:
+        with ENGINE.act(self._action(name)):
+            self.page.click(selector)
+
+    def _fill(self, selector: str, value: str, name: str = "fill") -> None:
+        with ENGINE.act(self._action(name)):
+            self.page.fill(selector, value)
+
+    def _arrived(self) -> None:
+        for listener in TRANSITION_LISTENERS:
+            listener(self)
+
+    def wait_ready(self) -> None:
+        """Return once the page's READY selector is visible and the DOM has stopped changing."""
+        if self.READY:
+            with self._ready("wait_ready") as timeout_ms:
+                expect(self._loc(getattr(self, self.READY))).to_be_visible(timeout=timeout_ms)
+        self._settle("settle")
+        self._arrived()
+
+    def capture(self, selector: Optional[str] = None, mask: Iterable[str] = ()) -> bytes:
+        """PNG of the viewport, or of the element at ``selector``; ``mask`` elements are painted over.
+
+        Waits for the DOM and network to settle, stops animations and hides the caret, so the same
+        state gives the same bytes (see framework/visual.py).
+        """
+        self._settle("capture")
+        target = self._loc(selector) if selector else self.page
+        return target.screenshot(mask=[self._loc(s) for s in mask], animations="disabled", caret="hide")
 
     def expect_url_contains(self, fragment: str) -> None:
-        expect(self.page).to_have_url(lambda url: fragment.lower() in url.lower())
+        with self._ready("expect_url") as timeout_ms:
+            expect(self.page).to_have_url(lambda url: fragment.lower() in url.lower(), timeout=timeout_ms)
+
+    def expect_cart_badge(self, count: int) -> None:
+        badge = self._loc(self.CART_BADGE)
+        if count == 0:
+            # Absence: let pending renders land, then the check passes (or fails) at once.
+            self._settle("cart_badge")
+            expect(badge).to_have_count(0, timeout=SETTLED_MS)
+        else:
+            with self._ready("cart_badge") as timeout_ms:
+                expect(badge).to_have_text(str(count), timeout=timeout_ms)
+
+    def cart_storage_ids(self) -> list[int]:
+        raw = self.page.evaluate(READ_CART_STORAGE_JS, self.CART_STORAGE_KEY)
+        return json.loads(raw) if raw else []
+
+    def write_cart_storage(self, item_ids: Iterable[int]) -> None:
+        """Fast path: replace the cart in localStorage and reload so the app renders it.
+
+        Skips the UI entirely; use the click-based helpers in tests that validate adding/removing.
+        """
+        ids = sorted(set(item_ids))
+        with ENGINE.act(self._action("write_cart_storage")):
+            self.page.evaluate(WRITE_CART_STORAGE_JS, [self.CART_STORAGE_KEY, ids])
+            self.page.reload()
+        self.expect_cart_badge(len(ids))
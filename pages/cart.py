@@ -1,33 +1,61 @@
 from __future__ import annotations
 
 import re
+from typing import Iterable, Optional
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 
+from .base import BasePage
+from .selectors import CART_ROWS_JS, CartSelectors
 
-class CartPage:
-    def __init__(self, page: Page) -> None:
-        self.page = page
-        self._items = page.locator(".cart_item")
-        self._remove_buttons = page.locator("button[data-test^='remove']")
-        self._checkout_button = page.locator("[data-test='checkout']")
-        self._continue_shopping = page.locator("[data-test='continue-shopping']")
 
+class CartPage(CartSelectors, BasePage):
     def wait_for_ready(self) -> None:
-        expect(self.page).to_have_url(re.compile(r".*/cart\.html.*"))
+        with self._ready("wait_for_ready") as timeout_ms:
+            expect(self.page).to_have_url(re.compile(r".*/cart\.html.*"), timeout=timeout_ms)
+            expect(self._loc(self.CHECKOUT)).to_be_visible(timeout=timeout_ms)
+        self._arrived()
 
     def item_count(self) -> int:
-        return self._items.count()
+        return self._loc(self.ITEM).count()
 
     def assert_item_count(self, expected: int) -> None:
-        expect(self._items).to_have_count(expected)
+        with self._ready("item_count") as timeout_ms:
+            expect(self._loc(self.ITEM)).to_have_count(expected, timeout=timeout_ms)
+
+    def item_names(self) -> list[str]:
+        return [n.strip() for n in self._loc(self.ITEM).locator(self.ITEM_NAME).all_inner_texts()]
+
+    def remove_items(self, names: Optional[Iterable[str]] = None) -> None:
+        """Remove ``names`` (all when None) in one planned pass.
+
+        Rows are read once, buttons are clicked by their data-test id and the item count is
+        awaited a single time at the end (no re-resolution per click).
+        """
+        rows = self._loc(self.ITEM).evaluate_all(CART_ROWS_JS, {"name": self.ITEM_NAME, "remove": self.REMOVE_BUTTON})
+        wanted = None if names is None else set(names)
+        if wanted is not None:
+            unknown = wanted - {name for name, _ in rows}
+            assert not unknown, f"Items not in cart: {sorted(unknown)}"
+
+        targets = [test_id for name, test_id in rows if wanted is None or name in wanted]
+        for test_id in targets:
+            self._click(f"[data-test='{test_id}']", "remove_items")
+        self.assert_item_count(len(rows) - len(targets))
 
     def remove_all_items(self) -> None:
-        while self._remove_buttons.count() > 0:
-            self._remove_buttons.first.click()
+        self.remove_items()
+
+    def clear_cart_storage(self) -> None:
+        """Fast path: empty the cart via localStorage (no clicks)."""
+        self.write_cart_storage([])
+        self.assert_item_count(0)
+
+    def start_checkout(self) -> None:
+        self._click(self.CHECKOUT, "start_checkout")
 
     def checkout(self) -> None:
-        self._checkout_button.click()
+        self.start_checkout()
 
     def continue_shopping(self) -> None:
-        self._continue_shopping.click()
+        self._click(self.CONTINUE_SHOPPING, "continue_shopping")
@@ -3,48 +3,45 @@ from __future__ import annotations
 from playwright.sync_api import expect
 
 from .base import BasePage
+from .selectors import CheckoutCompleteSelectors, CheckoutOverviewSelectors, CheckoutStepOneSelectors
 
 
-class CheckoutStepOnePage(BasePage):
-    TITLE = "span.title"
-    FIRST = "#first-name"
-    LAST = "#last-name"
-    ZIP = "#postal-code"
-    CONTINUE = "#continue"
-    ERROR = "h3[data-test='error']"
-
+class CheckoutStepOnePage(CheckoutStepOneSelectors, BasePage):
     def is_at(self) -> None:
-        expect(self.page.locator(self.TITLE)).to_contain_text("Checkout: Your Information")
+        with self._ready("is_at") as timeout_ms:
+            expect(self._loc(self.TITLE)).to_contain_text("Checkout: Your Information", timeout=timeout_ms)
+        self._arrived()
 
     def fill(self, first: str, last: str, zip_code: str) -> None:
-        self.page.fill(self.FIRST, first)
-        self.page.fill(self.LAST, last)
-        self.page.fill(self.ZIP, zip_code)
+        self._fill(self.FIRST, first, "fill")
+        self._fill(self.LAST, last, "fill")
+        self._fill(self.ZIP, zip_code, "fill")
 
     def continue_checkout(self) -> None:
-        self.page.click(self.CONTINUE)
+        self._click(self.CONTINUE, "continue_checkout")
 
     def error_text(self) -> str:
-        return self.page.locator(self.ERROR).inner_text()
-
+        """The error banner's text, or "" once the page has settled without one (no timeout)."""
+        self._settle("error_text")
+        error = self._loc(self.ERROR)
+        return error.inner_text() if error.count() else ""
 
-class CheckoutOverviewPage(BasePage):
-    TITLE = "span.title"
-    FINISH = "#finish"
 
+class CheckoutOverviewPage(CheckoutOverviewSelectors, BasePage):
     def is_at(self) -> None:
-        expect(self.page.locator(self.TITLE)).to_contain_text("Checkout: Overview")
+        with self._ready("is_at") as timeout_ms:
+            expect(self._loc(self.TITLE)).to_contain_text("Checkout: Overview", timeout=timeout_ms)
+        self._arrived()
 
     def finish(self) -> None:
-        self.page.click(self.FINISH)
-
+        self._click(self.FINISH, "finish")
 
-class CheckoutCompletePage(BasePage):
-    TITLE = "span.title"
-    COMPLETE_HEADER = "h2.complete-header"
 
+class CheckoutCompletePage(CheckoutCompleteSelectors, BasePage):
     def is_at(self) -> None:
-        expect(self.page.locator(self.TITLE)).to_contain_text("Checkout: Complete!")
+        with self._ready("is_at") as timeout_ms:
+            expect(self._loc(self.TITLE)).to_contain_text("Checkout: Complete!", timeout=timeout_ms)
+        self._arrived()
 
     def confirmation_message(self) -> str:
-        return self.page.locator(self.COMPLETE_HEADER).inner_text()
+        return self._loc(self.COMPLETE_HEADER).inner_text()
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from typing import Iterable, Optional
 
 from playwright.sync_api import expect
 
 from .base import BasePage
+from .selectors import SNAPSHOT_JS, InventorySelectors
+from .waits import ENGINE
 
 
 @dataclass(frozen=True)
@@ -13,72 +17,148 @@ class SortOption:
     assert_mode: str
 
 
-class InventoryPage(BasePage):
-    TITLE = "span.title"
-    ITEM = ".inventory_item"
-    ITEM_NAME = ".inventory_item_name"
-    ITEM_PRICE = ".inventory_item_price"
-    CART_LINK = "a.shopping_cart_link"
-    CART_BADGE = "span.shopping_cart_badge"
-    BTN_INVENTORY = "button.btn_inventory"
-    SORT_SELECT = "select[data-test='product-sort-container']"
-    ACTIVE_SORT = "[data-test='active-option']"
+@dataclass(frozen=True, slots=True)
+class InventoryItem:
+    name: str
+    price: float
+    description: str
+    button_label: str
+    button_test_id: str
+    item_id: int = -1
 
-    # Menu
-    MENU_BTN = "#react-burger-menu-btn"
-    MENU_CLOSE = "#react-burger-cross-btn"
-    MENU_PANEL = ".bm-menu-wrap"
-    MENU_ALL_ITEMS = "#inventory_sidebar_link"
-    MENU_ABOUT = "#about_sidebar_link"
-    MENU_LOGOUT = "#logout_sidebar_link"
-    MENU_RESET = "#reset_sidebar_link"
+    @property
+    def in_cart(self) -> bool:
+        return "remove" in self.button_label.lower()
+
+
+@dataclass(frozen=True, slots=True)
+class InventorySnapshot:
+    """Immutable view of every inventory item, read in a single driver round trip."""
+
+    items: tuple[InventoryItem, ...]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    @property
+    def names(self) -> list[str]:
+        return [i.name for i in self.items]
+
+    @property
+    def prices(self) -> list[float]:
+        return [i.price for i in self.items]
+
+    def in_cart(self) -> list[InventoryItem]:
+        return [i for i in self.items if i.in_cart]
 
+    def not_in_cart(self) -> list[InventoryItem]:
+        return [i for i in self.items if not i.in_cart]
+
+    def select(self, names: Optional[Iterable[str]] = None) -> list[InventoryItem]:
+        """Items matching ``names`` (all items when None); unknown names raise."""
+        if names is None:
+            return list(self.items)
+        by_name = {i.name: i for i in self.items}
+        wanted = list(names)
+        unknown = [n for n in wanted if n not in by_name]
+        assert not unknown, f"Unknown inventory items: {unknown}"
+        return [by_name[n] for n in wanted]
+
+
+_ITEM_LINK_ID = re.compile(r"item_(\d+)_title_link")
+
+
+def _to_item(name: str, price: str, desc: str, label: str, test_id: str, link_id: str) -> InventoryItem:
+    match = _ITEM_LINK_ID.fullmatch(link_id)
+    return InventoryItem(
+        name,
+        float(price.replace("$", "").strip()),
+        desc,
+        label,
+        test_id,
+        int(match.group(1)) if match else -1,
+    )
+
+
+def parse_snapshot(rows: list[list[str]]) -> InventorySnapshot:
+    """Build a snapshot from the rows returned by :data:`~pages.selectors.SNAPSHOT_JS`."""
+    return InventorySnapshot(tuple(_to_item(*row) for row in rows))
+
+
+class InventoryPage(InventorySelectors, BasePage):
     def is_at(self) -> None:
-        expect(self.page.locator(self.TITLE)).to_contain_text("Products")
+        with self._ready("is_at") as timeout_ms:
+            expect(self._loc(self.TITLE)).to_contain_text("Products", timeout=timeout_ms)
+        self._arrived()
 
     def inventory_count(self) -> int:
-        return self.page.locator(self.ITEM).count()
+        return self._loc(self.ITEM).count()
 
     def cart_count(self) -> int:
-        badge = self.page.locator(self.CART_BADGE)
+        # The badge only exists for a non-empty cart: settle first so "absent" is not a race.
+        self._settle("cart_count")
+        badge = self._loc(self.CART_BADGE)
         if badge.count() == 0:
             return 0
         txt = badge.first.inner_text().strip()
         return int(txt) if txt else 0
 
     def open_cart(self) -> None:
-        self.page.click(self.CART_LINK)
+        self._click(self.CART_LINK, "open_cart")
+
+    def snapshot(self) -> InventorySnapshot:
+        """Name, price, description and button state of all items (O(1) round trips)."""
+        items = self._loc(self.ITEM)
+        with self._ready("snapshot") as timeout_ms:
+            expect(items.first).to_be_visible(timeout=timeout_ms)
+        return parse_snapshot(items.evaluate_all(SNAPSHOT_JS, self.snapshot_selectors()))
+
+    def _click_item_button(self, item: InventoryItem) -> None:
+        self._click(f"[data-test='{item.button_test_id}']", "item_button")
+
+    def add_items(self, names: Optional[Iterable[str]] = None) -> None:
+        """Click "Add to cart" for ``names`` (all when None) in one planned pass.
+
+        Only items not already in the cart are clicked; the badge is checked once at the end.
+        """
+        snap = self.snapshot()
+        targets = [i for i in snap.select(names) if not i.in_cart]
+        for item in targets:
+            self._click_item_button(item)
+        self.expect_cart_badge(len(snap.in_cart()) + len(targets))
+
+    def remove_items(self, names: Optional[Iterable[str]] = None) -> None:
+        snap = self.snapshot()
+        targets = [i for i in snap.select(names) if i.in_cart]
+        for item in targets:
+            self._click_item_button(item)
+        self.expect_cart_badge(len(snap.in_cart()) - len(targets))
 
     def add_all_items(self) -> None:
-        expect(self.page.locator(self.ITEM).first).to_be_visible()
-        buttons = self.page.locator(self.BTN_INVENTORY)
-        for i in range(buttons.count()):
-            btn = buttons.nth(i)
-            label = btn.inner_text().strip().lower()
-            if "add to cart" in label:
-                btn.click()
+        self.add_items()
 
     def remove_all_items(self) -> None:
-        buttons = self.page.locator(self.BTN_INVENTORY)
-        for i in range(buttons.count()):
-            btn = buttons.nth(i)
-            label = btn.inner_text().strip().lower()
-            if "remove" in label:
-                btn.click()
+        self.remove_items()
+
+    def set_cart(self, names: Optional[Iterable[str]] = None) -> None:
+        """Fast path: put ``names`` (all when None) in the cart via localStorage, no clicks."""
+        self.write_cart_storage(i.item_id for i in self.snapshot().select(names))
 
     def item_names(self) -> list[str]:
-        expect(self.page.locator(self.ITEM).first).to_be_visible()
-        loc = self.page.locator(self.ITEM_NAME)
-        return [loc.nth(i).inner_text().strip() for i in range(loc.count())]
+        return self.snapshot().names
 
     def item_prices(self) -> list[float]:
-        loc = self.page.locator(self.ITEM_PRICE)
-        return [float(loc.nth(i).inner_text().replace("$", "").strip()) for i in range(loc.count())]
+        return self.snapshot().prices
 
     def select_sort(self, visible_text: str) -> None:
-        self.page.select_option(self.SORT_SELECT, label=visible_text)
+        with ENGINE.act(self._action("select_sort")):
+            self.page.select_option(self.SORT_SELECT, label=visible_text)
         # Wait for UI to reflect selected option (prevents race conditions)
-        expect(self.page.locator(self.ACTIVE_SORT)).to_have_text(visible_text)
+        with self._ready("select_sort") as timeout_ms:
+            expect(self._loc(self.ACTIVE_SORT)).to_have_text(visible_text, timeout=timeout_ms)
 
     def assert_sorted_name_asc(self) -> None:
         names = self.item_names()
@@ -98,34 +178,23 @@ class InventoryPage(BasePage):
 
     # Menu
     def open_menu(self) -> None:
-        self.page.click(self.MENU_BTN)
-        expect(self.page.locator(self.MENU_PANEL)).to_be_visible()
+        self._click(self.MENU_BTN, "open_menu")
+        with self._ready("open_menu") as timeout_ms:
+            expect(self._loc(self.MENU_PANEL)).to_be_visible(timeout=timeout_ms)
 
     def close_menu(self) -> None:
-        self.page.click(self.MENU_CLOSE)
-        expect(self.page.locator(self.MENU_PANEL)).to_be_hidden()
+        self._click(self.MENU_CLOSE, "close_menu")
+        with self._ready("close_menu") as timeout_ms:
+            expect(self._loc(self.MENU_PANEL)).to_be_hidden(timeout=timeout_ms)
 
     def assert_menu_item_exists(self, item: str) -> None:
         self.open_menu()
-        mapping = {
-            "all items": self.MENU_ALL_ITEMS,
-            "about": self.MENU_ABOUT,
-            "logout": self.MENU_LOGOUT,
-            "reset app state": self.MENU_RESET,
-        }
-        locator = mapping.get(item.strip().lower())
-        assert locator, f"Unknown menu item: {item}"
-        expect(self.page.locator(locator)).to_be_visible()
+        locator = self.menu_item_selector(item)
+        with self._ready("menu_item") as timeout_ms:
+            expect(self._loc(locator)).to_be_visible(timeout=timeout_ms)
         self.close_menu()
 
     def click_menu_item(self, item: str) -> None:
         self.open_menu()
-        mapping = {
-            "all items": self.MENU_ALL_ITEMS,
-            "about": self.MENU_ABOUT,
-            "logout": self.MENU_LOGOUT,
-            "reset app state": self.MENU_RESET,
-        }
-        locator = mapping.get(item.strip().lower())
-        assert locator, f"Unknown menu item: {item}"
-        self.page.click(locator)
+        locator = self.menu_item_selector(item)
+        self._click(locator, "click_menu_item")
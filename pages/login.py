@@ -3,26 +3,30 @@ from __future__ import annotations
 from playwright.sync_api import Page, expect
 
 from .base import BasePage
+from .selectors import LoginSelectors
 
 
-class LoginPage(BasePage):
-    USERNAME = "#user-name"
-    PASSWORD = "#password"
-    LOGIN_BTN = "#login-button"
-    ERROR = "h3[data-test='error']"
-
+class LoginPage(LoginSelectors, BasePage):
     def __init__(self, page: Page, base_url: str):
         super().__init__(page)
         self.base_url = base_url
 
     def open(self) -> None:
         self.page.goto(self.base_url)
-        expect(self.page.locator(self.LOGIN_BTN)).to_be_visible()
+        self.wait_until_open()
+
+    def wait_until_open(self) -> None:
+        with self._ready("wait_until_open") as timeout_ms:
+            expect(self._loc(self.LOGIN_BTN)).to_be_visible(timeout=timeout_ms)
+        self._arrived()
 
     def login(self, username: str, password: str) -> None:
-        self.page.fill(self.USERNAME, username)
-        self.page.fill(self.PASSWORD, password)
-        self.page.click(self.LOGIN_BTN)
+        self._fill(self.USERNAME, username, "login")
+        self._fill(self.PASSWORD, password, "login")
+        self._click(self.LOGIN_BTN, "login")
 
     def error_text(self) -> str:
-        return self.page.locator(self.ERROR).inner_text()
+        """The error banner's text, or "" once the page has settled without one (no timeout)."""
+        self._settle("error_text")
+        error = self._loc(self.ERROR)
+        return error.inner_text() if error.count() else ""
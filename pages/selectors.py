@@ -0,0 +1,206 @@
+"""Selector registry shared by the sync page objects and their async twins.
+
+Page classes inherit the matching ``*Selectors`` group, so ``LoginPage.LOGIN_BTN`` keeps working
+and a selector change lands in both APIs at once. Every group is registered with the page it
+lives on (``PATH``), the selector that marks that page as rendered (``READY``) and the selectors
+that only exist in some states (``CONDITIONAL``, e.g. error banners); see
+``framework/selector_check.py`` for the startup validation built on top of it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+# Upper-case class attributes that describe a group rather than a DOM selector.
+_METADATA = frozenset({"PATH", "READY", "CONDITIONAL", "CART_STORAGE_KEY", "MENU_ITEMS"})
+
+
+@dataclass(frozen=True)
+class SelectorGroup:
+    name: str
+    path: str
+    ready: str
+    selectors: Dict[str, str]
+    conditional: frozenset
+
+    @property
+    def required(self) -> Dict[str, str]:
+        return {k: v for k, v in self.selectors.items() if k not in self.conditional}
+
+
+REGISTRY: List[SelectorGroup] = []
+
+
+def selectors_of(cls: type) -> Dict[str, str]:
+    """All selector constants of ``cls`` (inherited ones included), by attribute name."""
+    found: Dict[str, str] = {}
+    for owner in reversed(cls.__mro__):
+        for name, value in vars(owner).items():
+            if name.isupper() and name not in _METADATA and isinstance(value, str):
+                found[name] = value
+    return found
+
+
+def register(cls: type) -> type:
+    selectors = selectors_of(cls)
+    group = SelectorGroup(cls.__name__, cls.PATH, selectors[cls.READY], selectors, frozenset(cls.CONDITIONAL))
+    REGISTRY.append(group)
+    return cls
+
+
+class BaseSelectors:
+    PATH = ""
+    READY = ""
+    CONDITIONAL: frozenset = frozenset({"CART_BADGE"})
+
+    CART_BADGE = "span.shopping_cart_badge"
+    # SauceDemo keeps the cart client-side: a JSON array of item ids under this localStorage key.
+    CART_STORAGE_KEY = "cart-contents"
+
+
+@register
+class LoginSelectors(BaseSelectors):
+    PATH = ""
+    READY = "LOGIN_BTN"
+    CONDITIONAL = frozenset({"CART_BADGE", "ERROR"})
+
+    USERNAME = "#user-name"
+    PASSWORD = "#password"
+    LOGIN_BTN = "#login-button"
+    ERROR = "h3[data-test='error']"
+
+
+@register
+class InventorySelectors(BaseSelectors):
+    PATH = "inventory.html"
+    READY = "ITEM"
+    CONDITIONAL = frozenset()  # validation runs with one item in the cart
+
+    TITLE = "span.title"
+    INVENTORY_LIST = ".inventory_list"
+    ITEM = ".inventory_item"
+    ITEM_IMG = "img.inventory_item_img"
+    ITEM_NAME = ".inventory_item_name"
+    ITEM_PRICE = ".inventory_item_price"
+    ITEM_DESC = ".inventory_item_desc"
+    ITEM_LINK = "a[id$='_title_link']"
+    CART_LINK = "a.shopping_cart_link"
+    BTN_INVENTORY = "button.btn_inventory"
+    SORT_SELECT = "select[data-test='product-sort-container']"
+    ACTIVE_SORT = "[data-test='active-option']"
+
+    # Menu
+    MENU_BTN = "#react-burger-menu-btn"
+    MENU_CLOSE = "#react-burger-cross-btn"
+    MENU_PANEL = ".bm-menu-wrap"
+    MENU_ALL_ITEMS = "#inventory_sidebar_link"
+    MENU_ABOUT = "#about_sidebar_link"
+    MENU_LOGOUT = "#logout_sidebar_link"
+    MENU_RESET = "#reset_sidebar_link"
+    MENU_ITEMS = {
+        "all items": MENU_ALL_ITEMS,
+        "about": MENU_ABOUT,
+        "logout": MENU_LOGOUT,
+        "reset app state": MENU_RESET,
+    }
+
+    @classmethod
+    def menu_item_selector(cls, item: str) -> str:
+        locator = cls.MENU_ITEMS.get(item.strip().lower())
+        assert locator, f"Unknown menu item: {item}"
+        return locator
+
+    @classmethod
+    def snapshot_selectors(cls) -> dict[str, str]:
+        """Argument for :data:`SNAPSHOT_JS`."""
+        return {
+            "name": cls.ITEM_NAME,
+            "price": cls.ITEM_PRICE,
+            "description": cls.ITEM_DESC,
+            "button": cls.BTN_INVENTORY,
+            "link": cls.ITEM_LINK,
+        }
+
+
+@register
+class CartSelectors(BaseSelectors):
+    PATH = "cart.html"
+    READY = "CHECKOUT"
+    CONDITIONAL = frozenset()
+
+    ITEM = ".cart_item"
+    ITEM_NAME = ".inventory_item_name"
+    REMOVE_BUTTON = "button[data-test^='remove']"
+    CHECKOUT = "[data-test='checkout']"
+    CONTINUE_SHOPPING = "[data-test='continue-shopping']"
+
+
+@register
+class CheckoutStepOneSelectors(BaseSelectors):
+    PATH = "checkout-step-one.html"
+    READY = "FIRST"
+    CONDITIONAL = frozenset({"CART_BADGE", "ERROR"})
+
+    TITLE = "span.title"
+    FIRST = "#first-name"
+    LAST = "#last-name"
+    ZIP = "#postal-code"
+    CONTINUE = "#continue"
+    ERROR = "h3[data-test='error']"
+
+
+@register
+class CheckoutOverviewSelectors(BaseSelectors):
+    PATH = "checkout-step-two.html"
+    READY = "FINISH"
+
+    TITLE = "span.title"
+    FINISH = "#finish"
+
+
+@register
+class CheckoutCompleteSelectors(BaseSelectors):
+    PATH = "checkout-complete.html"
+    READY = "COMPLETE_HEADER"
+
+    TITLE = "span.title"
+    COMPLETE_HEADER = "h2.complete-header"
+
+
+READ_CART_STORAGE_JS = "(key) => window.localStorage.getItem(key)"
+
+WRITE_CART_STORAGE_JS = """([key, ids]) => ids.length
+    ? window.localStorage.setItem(key, JSON.stringify(ids))
+    : window.localStorage.removeItem(key)"""
+
+# Runs in the browser against all .inventory_item elements; returns one compact row per item.
+SNAPSHOT_JS = """
+(items, s) => items.map((el) => {
+  const text = (sel) => (el.querySelector(sel)?.innerText ?? '').trim();
+  const btn = el.querySelector(s.button);
+  return [
+    text(s.name),
+    text(s.price),
+    text(s.description),
+    (btn?.innerText ?? '').trim(),
+    btn?.getAttribute('data-test') ?? '',
+    el.querySelector(s.link)?.id ?? '',
+  ];
+})
+"""
+
+# Runs against all .cart_item elements; returns [name, remove-button data-test] per row.
+CART_ROWS_JS = """
+(items, s) => items.map((el) => [
+  (el.querySelector(s.name)?.innerText ?? '').trim(),
+  el.querySelector(s.remove)?.getAttribute('data-test') ?? '',
+])
+"""
+
+# Runs once per registered page: names of the selectors that match nothing.
+MISSING_SELECTORS_JS = """
+(selectors) => Object.entries(selectors)
+  .filter(([, sel]) => { try { return !document.querySelector(sel); } catch (e) { return true; } })
+  .map(([name]) => name)
+"""
@@ -0,0 +1,76 @@
+"""Seed a browser context straight into an app state, without clicking through the UI.
+
+SauceDemo keeps its whole session client-side: the logged-in user is the ``session-username``
+cookie and the cart is a JSON array of item ids in localStorage. Both are written before the
+first navigation, so reaching e.g. checkout step one with a full cart costs one ``goto``
+(see ``BasePage.goto_state``).
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext
+
+from .selectors import BaseSelectors
+
+SESSION_COOKIE = "session-username"
+PRODUCTS_PATH = Path(__file__).resolve().parent.parent / "data" / "products.json"
+
+# Writes the cart once per tab: later navigations (and the app's own cart updates) are left alone.
+_SEED_CART_JS = """
+(() => {{
+  if (window.location.origin !== {origin}) return;
+  const marker = {marker};
+  if (window.sessionStorage.getItem(marker)) return;
+  window.sessionStorage.setItem(marker, '1');
+  const ids = {ids};
+  ids.length
+    ? window.localStorage.setItem({key}, JSON.stringify(ids))
+    : window.localStorage.removeItem({key});
+}})();
+"""
+
+
+@lru_cache(maxsize=1)
+def product_ids() -> Dict[str, int]:
+    """Item id by product name, from ``data/products.json``."""
+    catalog = json.loads(PRODUCTS_PATH.read_text(encoding="utf-8"))
+    return {p["name"]: p["id"] for p in catalog["products"]}
+
+
+def all_products() -> List[str]:
+    return list(product_ids())
+
+
+def cart_ids(cart: Iterable[Union[str, int]]) -> List[int]:
+    """Item ids for ``cart`` entries given as product names or ids; unknown names raise."""
+    by_name = product_ids()
+    wanted = list(cart)
+    unknown = [c for c in wanted if isinstance(c, str) and c not in by_name]
+    assert not unknown, f"Unknown products: {unknown}"
+    return sorted({by_name[c] if isinstance(c, str) else int(c) for c in wanted})
+
+
+def seed_state(
+    context: BrowserContext,
+    base_url: str,
+    username: str = "standard_user",
+    cart: Iterable[Union[str, int]] = (),
+) -> None:
+    """Log ``username`` in and fill the cart for every page of ``context`` opened afterwards."""
+    parts = urlsplit(base_url)
+    context.add_cookies([{"name": SESSION_COOKIE, "value": username, "domain": parts.hostname, "path": "/"}])
+    context.add_init_script(
+        _SEED_CART_JS.format(
+            origin=json.dumps(f"{parts.scheme}://{parts.netloc}"),
+            marker=json.dumps(f"seeded-cart-{uuid.uuid4().hex}"),
+            ids=json.dumps(cart_ids(cart)),
+            key=json.dumps(BaseSelectors.CART_STORAGE_KEY),
+        )
+    )
@@ -0,0 +1,182 @@
+"""State-driven readiness for the page objects, with per-action timeouts learned from history.
+
+Instead of one fixed expect timeout everywhere:
+
+- positive checks (``is_at``, sort applied, cart loaded) poll the app-specific signal, so they
+  return as soon as the page is ready; learning from earlier runs of the same action only extends
+  the 5 s default for actions that are slow, it never shortens it;
+- absence checks (no error banner, no cart badge) first wait for the page to *settle* -- no DOM
+  mutations and no new network resources for a short quiet window -- and then read the DOM
+  once, so negative paths answer immediately instead of burning a whole timeout.
+
+Every wait and every action is timed per page-object action; ``WaitEngine.ledger`` splits the
+time spent waiting from the time spent acting. Learned timings are loaded and saved by
+``framework/plugins/waits.py``.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page as AsyncPage
+
+DEFAULT_TIMEOUT_MS = 5_000.0  # Playwright's expect default, used until an action has history
+# Samples are per action, not per user: a slow user (performance_glitch_user) must not inherit a
+# timeout learned from fast ones, so learning only ever extends the default.
+MIN_TIMEOUT_MS = DEFAULT_TIMEOUT_MS
+MAX_TIMEOUT_MS = 30_000.0
+MARGIN = 3.0  # learned timeout = p95 of successful waits x MARGIN
+MIN_SAMPLES = 5
+MAX_SAMPLES = 50
+QUIET_MS = 50
+SETTLED_MS = 100.0  # timeout for a check made after the page settled (0 would mean "no timeout")
+
+# Resolves once the DOM had no mutations and no new resource entries for ``quietMs``, or after
+# ``maxMs``; returns true when it gave up at ``maxMs`` (the page never went quiet).
+SETTLE_JS = """
+([quietMs, maxMs]) => new Promise((resolve) => {
+  let resources = performance.getEntriesByType('resource').length;
+  let timer;
+  const done = (capped) => { observer.disconnect(); clearInterval(poll); resolve(capped); };
+  const restart = () => { clearTimeout(timer); timer = setTimeout(() => done(false), quietMs); };
+  const observer = new MutationObserver(restart);
+  observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+  const poll = setInterval(() => {
+    const now = performance.getEntriesByType('resource').length;
+    if (now !== resources) { resources = now; restart(); }
+  }, Math.max(10, quietMs / 2));
+  restart();
+  setTimeout(() => done(true), maxMs);
+})
+"""
+
+
+class WaitModel:
+    """Recent successful wait durations per action and the timeouts derived from them."""
+
+    def __init__(self, samples: Optional[Dict[str, List[float]]] = None) -> None:
+        self.samples: Dict[str, List[float]] = {k: list(v) for k, v in (samples or {}).items()}
+
+    def observe(self, action: str, seconds: float) -> None:
+        self.extend(action, [seconds])
+
+    def extend(self, action: str, seconds: List[float]) -> None:
+        history = self.samples.setdefault(action, [])
+        history.extend(seconds)
+        del history[:-MAX_SAMPLES]
+
+    def timeout_ms(self, action: str) -> float:
+        history = self.samples.get(action, [])
+        if len(history) < MIN_SAMPLES:
+            return DEFAULT_TIMEOUT_MS
+        ordered = sorted(history)
+        p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+        return min(MAX_TIMEOUT_MS, max(MIN_TIMEOUT_MS, p95 * 1000 * MARGIN))
+
+
+@dataclass
+class LedgerRow:
+    waits: int = 0
+    wait_s: float = 0.0
+    acts: int = 0
+    act_s: float = 0.0
+    timeouts: int = 0
+    learned: int = 0  # successful waits, i.e. samples added to the model this run
+
+
+class _Capped(Exception):
+    """A settle wait that ran into its timeout: the page is used as is, the duration is not learned."""
+
+
+class WaitEngine:
+    def __init__(self, model: Optional[WaitModel] = None, learn: bool = True) -> None:
+        self.model = model or WaitModel()
+        # False (--learned-waits off): every wait keeps the default timeout, nothing is observed.
+        self.learn = learn
+        self.ledger: Dict[str, LedgerRow] = defaultdict(LedgerRow)
+
+    @contextmanager
+    def wait(self, action: str) -> Iterator[float]:
+        """Times a readiness check; yields the timeout (ms) to use for it."""
+        row = self.ledger[action]
+        started = time.perf_counter()
+        try:
+            yield self.model.timeout_ms(action)
+        except _Capped:
+            # Learning the cap would ratchet the timeout up on pages that never go quiet.
+            row.timeouts += 1
+        except (AssertionError, PlaywrightTimeoutError):
+            row.timeouts += 1
+            raise
+        else:
+            if self.learn:
+                self.model.observe(action, time.perf_counter() - started)
+                row.learned += 1
+        finally:
+            row.waits += 1
+            row.wait_s += time.perf_counter() - started
+
+    @contextmanager
+    def act(self, action: str) -> Iterator[None]:
+        row = self.ledger[action]
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            row.acts += 1
+            row.act_s += time.perf_counter() - started
+
+    def settle(self, page: Page, action: str) -> None:
+        """Wait until the page stops changing (bounded by the learned timeout for ``action``)."""
+        with self.wait(action) as timeout_ms:
+            try:
+                capped = page.evaluate(SETTLE_JS, [QUIET_MS, timeout_ms])
+            except PlaywrightError as exc:
+                # A navigation replaced the document mid-check: the new one is what we wait for.
+                if "context was destroyed" not in str(exc):
+                    raise
+                page.wait_for_load_state(timeout=timeout_ms)
+                capped = False
+            if capped:
+                raise _Capped(action)
+
+    async def settle_async(self, page: AsyncPage, action: str) -> None:
+        """:meth:`settle` for the asyncio page objects (``pages.async_api``)."""
+        with self.wait(action) as timeout_ms:
+            try:
+                capped = await page.evaluate(SETTLE_JS, [QUIET_MS, timeout_ms])
+            except PlaywrightError as exc:
+                if "context was destroyed" not in str(exc):
+                    raise
+                await page.wait_for_load_state(timeout=timeout_ms)
+                capped = False
+            if capped:
+                raise _Capped(action)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"samples": self.model.samples, "ledger": {k: asdict(v) for k, v in self.ledger.items()}}
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        """Fold a worker's engine (:meth:`as_dict`) into this one, learned samples included."""
+        for action, row in other["ledger"].items():
+            # The newest samples are the ones learned this run; the rest is shared history.
+            learned = min(row["learned"], MAX_SAMPLES)
+            if learned:
+                self.model.extend(action, other["samples"][action][-learned:])
+            mine = self.ledger[action]
+            for name, value in row.items():
+                setattr(mine, name, getattr(mine, name) + value)
+
+
+# Shared by all page objects of the process; the waits plugin loads the learned model into it.
+ENGINE = WaitEngine()
@@ -0,0 +1,49 @@
+import os
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# A session that starts the sync driver, then reaches an asyncio test on the session loop.
+MIXED_SESSION = """
+import pytest
+
+from framework.browser import BROWSER_MANAGER_KEY, BrowserManager
+
+pytest_plugins = ["framework.plugins.async_api"]
+
+
+@pytest.fixture(scope="session")
+def browser_manager(pytestconfig, tmp_path_factory):
+    manager = BrowserManager(None, tmp_path_factory)
+    pytestconfig.stash[BROWSER_MANAGER_KEY] = manager
+    yield manager
+    manager.close()
+"""
+
+
+@pytest.mark.regression
+def test_async_tests_skip_after_the_sync_driver_started(pytester: pytest.Pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [str(ROOT), os.getenv("PYTHONPATH")])))
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function\n")
+    pytester.makeconftest(MIXED_SESSION)
+    pytester.makepyfile(
+        test_mixed="""
+        import asyncio
+
+        import pytest
+
+
+        def test_sync(browser_manager):
+            assert browser_manager.playwright
+
+
+        @pytest.mark.asyncio(loop_scope="session")
+        async def test_async():
+            await asyncio.sleep(0)
+        """
+    )
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider", "-rs")
+    result.assert_outcomes(passed=1, skipped=1)
+    result.stdout.fnmatch_lines(["*sync Playwright driver already runs in this process*"])
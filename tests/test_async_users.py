@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from pages.async_api import LoginPage
+
+pytestmark = [pytest.mark.async_api, pytest.mark.asyncio(loop_scope="session")]
+
+SORTS = [
+    ("Name (A to Z)", "assert_sorted_name_asc"),
+    ("Name (Z to A)", "assert_sorted_name_desc"),
+    ("Price (low to high)", "assert_sorted_price_asc"),
+    ("Price (high to low)", "assert_sorted_price_desc"),
+]
+
+
+@pytest.mark.regression
+async def test_all_users_login_concurrently(async_login, async_new_context, base_url, users_data):
+    users = users_data["users"]
+    accepted = [u for u, info in users.items() if info["kind"] != "locked_out"]
+
+    async def rejected(username: str) -> str:
+        lp = LoginPage(await (await async_new_context()).new_page(), base_url)
+        await lp.open()
+        await lp.login(username, users_data["password"])
+        return await lp.error_text()
+
+    inventories = await asyncio.gather(*(async_login(u) for u in accepted))
+    await asyncio.gather(*(inv.is_at() for inv in inventories))
+
+    errors = await asyncio.gather(*(rejected(u) for u, info in users.items() if info["kind"] == "locked_out"))
+    assert all("locked" in e.lower() for e in errors)
+
+
+@pytest.mark.regression
+async def test_sort_matrix_in_parallel_tabs(async_login):
+    first = await async_login("standard_user")
+    inventories = [first]
+    for _ in SORTS[1:]:
+        tab = await first.page.context.new_page()
+        await tab.goto(first.page.url)
+        inventories.append(type(first)(tab))
+
+    async def check(inv, label: str, assertion: str) -> None:
+        await inv.select_sort(label)
+        await getattr(inv, assertion)()
+
+    await asyncio.gather(*(check(inv, label, a) for inv, (label, a) in zip(inventories, SORTS)))
@@ -15,10 +15,11 @@ def test_standard_user_can_login(page, base_url, users_data):
 
 @pytest.mark.regression
 @pytest.mark.negative
-def test_locked_out_user_rejected(page, base_url, users_data):
+@pytest.mark.users("locked_out")
+def test_locked_out_user_rejected(user, page, base_url):
     lp = LoginPage(page, base_url)
     lp.open()
-    lp.login("locked_out_user", users_data["password"])
+    lp.login(user.username, user.password)
     assert "locked" in lp.error_text().lower()
 
 
@@ -32,18 +33,8 @@ def test_invalid_password_rejected(page, base_url):
 
 
 @pytest.mark.regression
-@pytest.mark.parametrize(
-    "username",
-    [
-        pytest.param("problem_user", marks=pytest.mark.known_bug),
-        pytest.param("performance_glitch_user", marks=pytest.mark.known_bug),
-        pytest.param("error_user", marks=pytest.mark.known_bug),
-        pytest.param("visual_user", marks=pytest.mark.known_bug),
-    ],
-)
-def test_special_users_can_login_known_bug(username, page, base_url, users_data):
-    lp = LoginPage(page, base_url)
-    lp.open()
-    lp.login(username, users_data["password"])
-    inv = InventoryPage(page)
-    inv.is_at()
+@pytest.mark.ui_login
+@pytest.mark.users("known_bug")
+def test_special_users_can_login_known_bug(user_inventory: InventoryPage):
+    # The login latency of each user (performance_glitch_user!) lands in the "user matrix" summary.
+    user_inventory.is_at()
@@ -2,6 +2,7 @@ import pytest
 
 from pages import InventoryPage, CartPage
 from pages import CheckoutStepOnePage, CheckoutOverviewPage, CheckoutCompletePage
+from pages.state import all_products
 
 
 @pytest.mark.smoke
@@ -20,6 +21,67 @@ def test_add_all_and_remove_all_from_cart(standard_inventory: InventoryPage):
     cart.assert_item_count(0)
 
 
+@pytest.mark.regression
+def test_inventory_snapshot_tracks_cart_state(standard_inventory: InventoryPage):
+    before = standard_inventory.snapshot()
+    assert len(before) == standard_inventory.inventory_count()
+    assert not before.in_cart()
+    assert all(item.name and item.price > 0 and item.button_test_id for item in before)
+
+    standard_inventory.add_all_items()
+    after = standard_inventory.snapshot()
+    assert after.names == before.names
+    assert len(after.in_cart()) == len(after)
+    assert standard_inventory.cart_count() == len(after)
+
+
+@pytest.mark.regression
+def test_add_and_remove_selected_items(standard_inventory: InventoryPage):
+    picks = ["Sauce Labs Backpack", "Sauce Labs Onesie"]
+    standard_inventory.add_items(picks)
+
+    standard_inventory.open_cart()
+    cart = CartPage(standard_inventory.page)
+    cart.wait_for_ready()
+    assert sorted(cart.item_names()) == sorted(picks)
+
+    cart.remove_items(["Sauce Labs Onesie"])
+    assert cart.item_names() == ["Sauce Labs Backpack"]
+
+
+@pytest.mark.regression
+def test_cart_state_via_storage_fast_path(standard_inventory: InventoryPage):
+    standard_inventory.set_cart()
+    assert standard_inventory.cart_count() == standard_inventory.inventory_count()
+    assert len(standard_inventory.snapshot().in_cart()) == standard_inventory.inventory_count()
+
+    standard_inventory.open_cart()
+    cart = CartPage(standard_inventory.page)
+    cart.wait_for_ready()
+    cart.clear_cart_storage()
+
+    # The emptied cart must survive a fresh render, not just the one clear_cart_storage triggered.
+    cart.page.reload()
+    cart.wait_for_ready()
+    assert cart.item_count() == 0
+    assert cart.cart_storage_ids() == []
+    cart.expect_cart_badge(0)
+
+
+@pytest.mark.regression
+def test_goto_state_seeds_session_and_cart(page, base_url):
+    picks = ["Sauce Labs Backpack", "Sauce Labs Onesie"]
+    cart = CartPage.goto_state(page, base_url, cart=picks)
+    assert sorted(cart.item_names()) == sorted(picks)
+
+    cart.remove_items(["Sauce Labs Onesie"])
+    cart.continue_shopping()
+    inventory = InventoryPage(page)
+    inventory.is_at()
+    # The seed is applied once per tab: the removal survives the navigation.
+    assert inventory.cart_count() == 1
+
+
 @pytest.mark.smoke
 @pytest.mark.regression
 def test_place_order_happy_path_all_products(standard_inventory: InventoryPage):
@@ -52,14 +114,9 @@ def test_place_order_happy_path_all_products(standard_inventory: InventoryPage):
         ("John", "Doe", "", "Postal Code"),
     ],
 )
-def test_checkout_required_field_validation(standard_inventory: InventoryPage, first, last, zip_code,
-                                            expected_fragment):
-    standard_inventory.add_all_items()
-    standard_inventory.open_cart()
-    cart = CartPage(standard_inventory.page)
-    cart.start_checkout()
-
-    c1 = CheckoutStepOnePage(standard_inventory.page)
+def test_checkout_required_field_validation(page, base_url, first, last, zip_code, expected_fragment):
+    c1 = CheckoutStepOnePage.goto_state(page, base_url, cart=all_products())
+    c1.is_at()
     c1.fill(first, last, zip_code)
     c1.continue_checkout()
     assert expected_fragment.lower() in c1.error_text().lower()
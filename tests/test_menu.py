@@ -5,12 +5,14 @@ from pages import InventoryPage
 
 
 @pytest.mark.regression
+@pytest.mark.read_only
 def test_menu_open_close(standard_inventory: InventoryPage):
     standard_inventory.open_menu()
     standard_inventory.close_menu()
 
 
 @pytest.mark.regression
+@pytest.mark.read_only
 def test_menu_items_exist(standard_inventory: InventoryPage):
     for item in ["All Items", "About", "Logout", "Reset App State"]:
         standard_inventory.assert_menu_item_exists(item)